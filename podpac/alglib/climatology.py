@@ -3,6 +3,7 @@ PODPAC node to compute beta fit of seasonal variables
 """
 
 import logging
+import warnings
 import numpy as np
 import xarray as xr
 import traitlets as tl
@@ -32,10 +33,22 @@ class BetaFitDayOfYear(DayOfYearWindow):
         Default is []. After computing the beta distribution, optionally compute the value of the function for the given
         percentiles in the list. The results will be available as an output named ['d0', 'd1',...] for each entry in
         the list.
+    fit_method: str, optional
+        Default is 'MLE'. Fit the beta distribution for each point with maximum likelihood ('MLE'), or with the method
+        of moments ('MM'). The method of moments is computed for many points at once, which is much faster.
     """
 
     percentiles = tl.List().tag(attr=True)
     rescale = tl.Bool(True).tag(attr=True)
+    fit_method = tl.CaselessStrEnum(["MLE", "MM"], default_value="MLE").tag(attr=True)
+
+    @property
+    def _vectorized(self):
+        return self.fit_method.upper() == "MM"
+
+    @property
+    def _running(self):
+        return self.sliding_window and self.fit_method.upper() == "MM"
 
     @property
     def outputs(self):
@@ -59,6 +72,28 @@ class BetaFitDayOfYear(DayOfYearWindow):
 
         return output
 
+    def vectorized_function(self, data):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            m = np.nanmean(data, axis=1)
+            v = np.nanvar(data, axis=1)
+        return self._fit_moments(m, v)
+
+    def running_function(self, moments):
+        N, M1, M2 = moments
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self._fit_moments(M1, M2 / N)
+
+    def _fit_moments(self, m, v):
+        # method of moments
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = m * (1 - m) / v - 1
+        c[~(c > 0)] = np.nan
+        a = m * c
+        b = (1 - m) * c
+
+        return np.stack([a, b] + [beta.ppf(d, a, b) for d in self.percentiles], axis=-1)
+
     def rescale_outputs(self, output, scale_max, scale_min):
         output[..., 2:] = (output[..., 2:] * (scale_max - scale_min)) + scale_min
         return output
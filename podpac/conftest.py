@@ -20,11 +20,16 @@ def pytest_addoption(parser):
     # config option for when we're running tests on ci
     parser.addoption("--ci", action="store_true", default=False)
 
+    # config option to run the microbenchmarks
+    parser.addoption("--benchmark", action="store_true", default=False)
+
 
 def pytest_runtest_setup(item):
     markers = [marker.name for marker in item.iter_markers()]
     if item.config.getoption("--ci") and "aws" in markers:
         pytest.skip("Skip aws tests during CI")
+    if not item.config.getoption("--benchmark") and "benchmark" in markers:
+        pytest.skip("Skip benchmarks, use --benchmark to run them")
 
 
 def pytest_configure(config):
@@ -38,6 +43,7 @@ def pytest_configure(config):
 
     config.addinivalue_line("markers", "aws: mark test as an aws test")
     config.addinivalue_line("markers", "integration: mark test as integration test")
+    config.addinivalue_line("markers", "benchmark: mark test as a microbenchmark (skipped without --benchmark)")
 
 
 def pytest_unconfigure(config):
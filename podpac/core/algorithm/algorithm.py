@@ -56,8 +56,15 @@ class Algorithm(BaseAlgorithm):
     Notes
     ------
     Developers of new Algorithm nodes need to implement the `algorithm` method.
+
+    An output array provided to `eval` is passed on to at most one input, named by `_output_input`. Algorithms that
+    compute their result in the array of that input (e.g. Mask modifies its source) set `_output_input`, so that the
+    input is evaluated directly into the output array and the result is not copied.
     """
 
+    # name of the input that is evaluated into the provided output array, if any
+    _output_input = None
+
     # not the best solution... hard to check for these attrs
     # abstract = tl.Bool(default_value=True, allow_none=True).tag(attr=True, required=False, hidden=True)
 
@@ -93,11 +100,37 @@ class Algorithm(BaseAlgorithm):
         """
 
         self._requested_coordinates = coordinates
+        outputs = {self._output_input: output} if self._output_input is not None else None
+        inputs = self._eval_inputs(self.inputs, coordinates, outputs=outputs, _selector=_selector)
+        result = self.algorithm(inputs, coordinates)
+        return self._finalize_output(result, output)
+
+    def _eval_inputs(self, nodes, coordinates, outputs=None, _selector=None):
+        """Evaluates input nodes, concurrently if settings["MULTITHREADING"] is True.
+
+        Parameters
+        ----------
+        nodes : dict
+            Input nodes to evaluate.
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        outputs : dict, optional
+            Output arrays for some of the input nodes, with the same keys. Each output array is used by one node.
+        _selector: callable(coordinates, request_coordinates)
+            Source selector.
+
+        Returns
+        -------
+        inputs : dict
+            Evaluated outputs of the input nodes, with the same keys.
+        """
 
         inputs = {}
+        if outputs is None:
+            outputs = {}
 
         if settings["MULTITHREADING"]:
-            n_threads = thread_manager.request_n_threads(len(self.inputs))
+            n_threads = thread_manager.request_n_threads(len(nodes))
             if n_threads == 1:
                 thread_manager.release_n_threads(n_threads)
         else:
@@ -105,17 +138,17 @@ class Algorithm(BaseAlgorithm):
 
         if settings["MULTITHREADING"] and n_threads > 1:
             # Create a function for each thread to execute asynchronously
-            def f(node):
-                return node.eval(coordinates, _selector=_selector)
+            def f(key, node):
+                return node.eval(coordinates, output=outputs.get(key), _selector=_selector)
 
             # Create pool of size n_threads, note, this may be created from a sub-thread (i.e. not the main thread)
             pool = thread_manager.get_thread_pool(processes=n_threads)
 
             # Evaluate nodes in parallel/asynchronously
-            results = [pool.apply_async(f, [node]) for node in self.inputs.values()]
+            results = [pool.apply_async(f, [key, node]) for key, node in nodes.items()]
 
             # Collect the results in dictionary
-            for key, res in zip(self.inputs.keys(), results):
+            for key, res in zip(nodes.keys(), results):
                 inputs[key] = res.get()
 
             # This prevents any more tasks from being submitted to the pool, and will close the workers once done
@@ -126,11 +159,27 @@ class Algorithm(BaseAlgorithm):
             self._multi_threaded = True
         else:
             # Evaluate nodes in serial
-            for key, node in self.inputs.items():
-                inputs[key] = node.eval(coordinates, output=output, _selector=_selector)
+            for key, node in nodes.items():
+                inputs[key] = node.eval(coordinates, output=outputs.get(key), _selector=_selector)
             self._multi_threaded = False
 
-        result = self.algorithm(inputs, coordinates)
+        return inputs
+
+    def _finalize_output(self, result, output=None):
+        """Selects the single output, if necessary, and fills the provided output from an algorithm result.
+
+        Parameters
+        ----------
+        result : xr.DataArray
+            Algorithm result.
+        output : podpac.UnitsDataArray, optional
+            Output array to fill.
+
+        Returns
+        -------
+        output : podpac.UnitsDataArray
+            Node output.
+        """
 
         if not isinstance(result, xr.DataArray):
             raise NodeException("algorithm returned unsupported type '%s'" % type(result))
@@ -145,7 +194,12 @@ class Algorithm(BaseAlgorithm):
 
             output_dims = output.dims
             output = output.transpose(..., *result.dims)
-            output[:] = result.data
+            if _same_memory(output.data, result.data):
+                pass  # the result was computed in the output array
+            elif np.may_share_memory(output.data, result.data):
+                output[:] = result.data.copy()
+            else:
+                output[:] = result.data
             output = output.transpose(*output_dims)
         elif isinstance(result, UnitsDataArray):
             output = result
@@ -182,3 +236,13 @@ class UnaryAlgorithm(BaseAlgorithm):
     @tl.default("style")
     def _default_style(self):  # Pass through source style by default
         return self.source.style
+
+
+def _same_memory(a, b):
+    """Whether two arrays are views of the same elements, in the same order."""
+
+    return (
+        a.shape == b.shape
+        and a.strides == b.strides
+        and a.__array_interface__["data"][0] == b.__array_interface__["data"][0]
+    )
@@ -4,9 +4,12 @@ General-purpose Algorithm Nodes.
 
 from __future__ import division, unicode_literals, print_function, absolute_import
 
+import re
 import sys
 import warnings
 
+from collections import OrderedDict
+
 import numpy as np
 import xarray as xr
 import traitlets as tl
@@ -21,6 +24,7 @@ from podpac import Coordinates
 from podpac.core.node import Node, NodeException
 from podpac.core.utils import NodeTrait
 from podpac.core.algorithm.algorithm import Algorithm
+from podpac.core.managers.arena import buffer_arena
 
 if sys.version_info.major == 2:
 
@@ -52,7 +56,149 @@ class GenericInputs(Algorithm):
         return d
 
 
-class Arithmetic(GenericInputs):
+class ElementwiseMixin(tl.HasTraits):
+    """Fuses chains of elementwise nodes into a single numexpr expression.
+
+    Elementwise inputs (e.g. an Arithmetic input of an Arithmetic or Mask node) are not evaluated separately. Instead,
+    their expressions are inlined, and the fused expression is evaluated in a single pass over the other inputs, which
+    are each evaluated once. Elementwise inputs that cache their output or select an output are not fused.
+
+    Attributes
+    ----------
+    fuse : bool
+        Default is True. Evaluate this node and its elementwise inputs as a single expression, when possible.
+
+    Notes
+    -----
+    If settings["CHUNK_SIZE"] is an integer, the fused expression is evaluated in chunks of the requested coordinates,
+    so that only the output and one chunk of each input are held in memory.
+    """
+
+    fuse = tl.Bool(True)
+
+    def _expression(self, terms):
+        """numexpr expression for this node.
+
+        The primary input (whose attributes the unfused algorithm keeps) must be added to the terms first, because the
+        fused output takes the attributes of the first input node.
+
+        Parameters
+        ----------
+        terms : list
+            Input nodes and constants of the fused expression, extended in-place. Each term is named by its index, see
+            :meth:`_term`.
+
+        Returns
+        -------
+        str
+            numexpr expression
+        """
+
+        raise NotImplementedError
+
+    @property
+    def _fusable(self):
+        """Whether this node can be evaluated as part of a fused expression."""
+
+        return self.fuse
+
+    def _term(self, value, terms):
+        """Expression for an input node or constant, inlining the expression of fusable elementwise nodes."""
+
+        if isinstance(value, ElementwiseMixin) and value._fusable and value.output is None and not value.cache_output:
+            return "(%s)" % value._expression(terms)
+
+        for i, term in enumerate(terms):
+            if isinstance(value, Node) and term is value:
+                break
+        else:
+            i = len(terms)
+            terms.append(value)
+        return "__t%d" % i
+
+    def _eval(self, coordinates, output=None, _selector=None):
+        if not self._fusable:
+            return super(ElementwiseMixin, self)._eval(coordinates, output=output, _selector=_selector)
+
+        terms = []
+        expr = self._expression(terms)
+        nodes = OrderedDict(("__t%d" % i, term) for i, term in enumerate(terms) if isinstance(term, Node))
+        try:
+            ne.NumExpr(expr, [("__t%d" % i, np.float64) for i in range(len(terms))])
+        except Exception:
+            nodes = {}
+        if not nodes:
+            return super(ElementwiseMixin, self)._eval(coordinates, output=output, _selector=_selector)
+
+        self._requested_coordinates = coordinates
+
+        chunk_size = settings["CHUNK_SIZE"]
+        if not isinstance(chunk_size, int) or coordinates.size <= chunk_size:
+            inputs = self._eval_inputs(nodes, coordinates, _selector=_selector)
+            result = self._eval_expression(expr, terms, inputs, out=output)
+            return self._finalize_output(result, output)
+
+        shape = list(coordinates.shape)
+        while np.prod(shape) > chunk_size and max(shape) > 1:
+            i = int(np.argmax(shape))
+            shape[i] = int(np.ceil(shape[i] / 2))
+
+        # the inputs of each chunk are evaluated into arrays from the arena, once their layout is known
+        result = None
+        layouts = {}
+        for chunk, slices in coordinates.iterchunks(shape, return_slices=True):
+            outputs, buffers = {}, []
+            for key, node in nodes.items():
+                outputs[key], buffer = buffer_arena.output_array(node, chunk, layouts.get(key))
+                buffers.append(buffer)
+            try:
+                inputs = self._eval_inputs(nodes, chunk, outputs=outputs, _selector=_selector)
+
+                if result is None:
+                    x = xr.broadcast(*inputs.values())[0]
+                    dims = [d for d in x.dims if d != "output"]
+                    if any(d not in coordinates.dims for d in dims):
+                        # the output coordinates are unknown, evaluate the inputs for all of the coordinates instead
+                        inputs = self._eval_inputs(nodes, coordinates, _selector=_selector)
+                        return self._finalize_output(self._eval_expression(expr, terms, inputs, out=output), output)
+
+                    layouts = {key: buffer_arena.get_layout(inputs[key], chunk) for key in nodes}
+                    missing_dims = [d for d in coordinates.dims if d not in dims]
+                    outputs = list(x["output"].data) if "output" in x.dims else None
+                    result = self.create_output_array(coordinates.drop(missing_dims), outputs=outputs)
+
+                index = tuple(
+                    slices[coordinates.dims.index(d)] if d in coordinates.dims else slice(None) for d in result.dims
+                )
+                self._eval_expression(expr, terms, inputs, out=result[index])
+            finally:
+                for buffer in buffers:
+                    buffer_arena.release(buffer)
+
+        return self._finalize_output(result, output)
+
+    def _eval_expression(self, expr, terms, inputs, out=None):
+        """Evaluates the fused expression.
+
+        The inputs are broadcast against each other, as in the unfused algorithms, and the result takes the attributes
+        of the first input. The result is written directly into the `out` array if it has the same dims.
+        """
+
+        # the dims are only reordered or expanded, the data is not copied
+        arrays = OrderedDict(zip(inputs.keys(), xr.broadcast(*inputs.values())))
+        local_dict = {"__t%d" % i: term for i, term in enumerate(terms) if not isinstance(term, Node)}
+        local_dict.update({key: a.data for key, a in arrays.items()})
+        template = arrays[list(inputs)[0]]
+
+        if out is not None and set(out.dims) == set(template.dims):
+            out = out.transpose(*template.dims)
+            ne.evaluate(expr, local_dict, out=out.data)
+            return out
+
+        return template.copy(data=ne.evaluate(expr, local_dict).astype(self.dtype, copy=False))
+
+
+class Arithmetic(ElementwiseMixin, GenericInputs):
     """Create a simple point-by-point computation using named input nodes.
 
     Examples
@@ -81,6 +227,34 @@ class Arithmetic(GenericInputs):
 
         super(Arithmetic, self).init()
 
+    @property
+    def _fusable(self):
+        if not self.fuse:
+            return False
+        try:
+            ne.NumExpr(self.eqn.format(**self.params), [(key, np.float64) for key in self.inputs])
+        except Exception:
+            return False
+        return True
+
+    def _expression(self, terms):
+        self._check_unsafe_eval()
+        eqn = self.eqn.format(**self.params)
+        names = {key: self._term(node, terms) for key, node in self.inputs.items()}
+        if not names:
+            return eqn
+        pattern = r"\b(%s)\b" % "|".join(re.escape(key) for key in names)
+        return re.sub(pattern, lambda m: names[m.group(0)], eqn)
+
+    def _check_unsafe_eval(self):
+        if not settings.allow_unsafe_eval:
+            raise PermissionError(
+                "Insecure evaluation of Python code using Arithmetic node has not been allowed. If "
+                "this is an error, use: `podpac.settings.allow_unrestricted_code_execution(True)`. "
+                "NOTE: Allowing unsafe evaluation enables arbitrary execution of Python code through PODPAC "
+                "Node definitions."
+            )
+
     def algorithm(self, inputs, coordinates):
         """Compute the algorithms equation
 
@@ -98,13 +272,7 @@ class Arithmetic(GenericInputs):
             Algorithm result.
         """
 
-        if not settings.allow_unsafe_eval:
-            raise PermissionError(
-                "Insecure evaluation of Python code using Arithmetic node has not been allowed. If "
-                "this is an error, use: `podpac.settings.allow_unrestricted_code_execution(True)`. "
-                "NOTE: Allowing unsafe evaluation enables arbitrary execution of Python code through PODPAC "
-                "Node definitions."
-            )
+        self._check_unsafe_eval()
 
         eqn = self.eqn.format(**self.params)
 
@@ -186,7 +354,7 @@ class Generic(GenericInputs):
         return inputs["output"]
 
 
-class Mask(Algorithm):
+class Mask(ElementwiseMixin, Algorithm):
     """
     Masks the `source` based on a boolean expression involving the `mask`
     (i.e. source[mask <bool_op> <bool_val> ] = <masked_val>).
@@ -235,6 +403,14 @@ class Mask(Algorithm):
     in_place = tl.Bool(False).tag(attr=True)
 
     _repr_keys = ["source", "mask"]
+    _output_input = "source"
+
+    def _expression(self, terms):
+        source = self._term(self.source, terms)
+        mask = self._term(self.mask, terms)
+        bool_val = self._term(self.bool_val, terms)
+        masked_val = self._term(np.nan if self.masked_val is None else self.masked_val, terms)
+        return "where(%s %s %s, %s, %s)" % (mask, self.bool_op, bool_val, masked_val, source)
 
     def algorithm(self, inputs, coordinates):
         """
@@ -17,6 +17,7 @@ from podpac.core.node import Node
 from podpac.core.algorithm.algorithm import UnaryAlgorithm
 from podpac.core.utils import common_doc, ArrayTrait, NodeTrait
 from podpac.core.node import COMMON_NODE_DOC
+from podpac.core.managers.multi_threading import thread_manager
 
 
 COMMON_DOC = COMMON_NODE_DOC.copy()
@@ -72,12 +73,34 @@ class Convolution(UnaryAlgorithm):
         Any kernel defined in `scipy.signal` as well as `mean` can be used. For example:
         kernel_type = 'mean, 8' or kernel_type = 'gaussian,16,8' are both valid.
         Note: These kernels are automatically normalized such that kernel.sum() == 1
+    nan_policy : str, optional
+        Default is 'propagate'. How missing source values are handled:
+         * 'propagate': the output is nan wherever the kernel overlaps a nan
+         * 'normalize': normalized convolution, the kernel is applied to the valid values only and rescaled by the
+           valid fraction of its (absolute) weight. The output is nan only where the kernel overlaps no valid values.
+    tile_size : int, optional
+        Maximum number of requested coordinates evaluated and convolved at once. Default is settings["CHUNK_SIZE"]
+        when it is an integer; otherwise, the request is evaluated at once.
+    multithreading : bool, optional
+        Default is settings["MULTITHREADING"]. Evaluate and convolve tiles concurrently.
+
+    Notes
+    -----
+    Separable kernels (including the `kernel_type` kernels) are applied as successive 1D convolutions, and missing
+    values are masked out so that the FFT method can be used for large kernels.
     """
 
     kernel = ArrayTrait(dtype=float).tag(attr=True)
     kernel_dims = tl.List().tag(attr=True)
     # Takes one or the other which is hard to implement in a GUI
     kernel_type = tl.List().tag(attr=True)
+    nan_policy = tl.Enum(["propagate", "normalize"], default_value="propagate").tag(attr=True)
+    tile_size = tl.Int(default_value=None, allow_none=True)
+    multithreading = tl.Bool(False)
+
+    @tl.default("multithreading")
+    def _default_multithreading(self):
+        return settings["MULTITHREADING"]
 
     def _first_init(self, kernel=None, kernel_dims=None, kernel_type=None, kernel_ndim=None, **kwargs):
         if kernel_dims is None:
@@ -106,6 +129,9 @@ class Convolution(UnaryAlgorithm):
     def _eval(self, coordinates, output=None, _selector=None):
         """Evaluates this nodes using the supplied coordinates.
 
+        Large requests are evaluated and convolved in tiles (see `tile_size`). Each tile is expanded by the kernel
+        halo, so the tiled result is the same as the result of a single evaluation.
+
         Parameters
         ----------
         coordinates : podpac.Coordinates
@@ -119,6 +145,73 @@ class Convolution(UnaryAlgorithm):
         -------
         {eval_return}
         """
+        tile_shape = self._get_tile_shape(coordinates)
+        if tile_shape is None:
+            return self._eval_tile(coordinates, output=output, _selector=_selector)
+
+        tiles = list(coordinates.iterchunks(tile_shape, return_slices=True))
+        f = lambda tile: self._eval_tile(tile[0], _selector=_selector)
+
+        n_threads = 0
+        if self.multithreading:
+            n_threads = thread_manager.request_n_threads(len(tiles))
+            if n_threads <= 1:
+                thread_manager.release_n_threads(n_threads)
+
+        if n_threads > 1:
+            pool = thread_manager.get_thread_pool(processes=n_threads)
+            results = pool.imap(f, tiles)
+        else:
+            results = map(f, tiles)
+
+        try:
+            for (_, slices), result in zip(tiles, results):
+                if output is None:
+                    missing_dims = [d for d in coordinates.dims if d not in result.dims]
+                    output = self.create_output_array(coordinates.drop(missing_dims))
+                index = tuple(
+                    slices[coordinates.dims.index(d)] if d in coordinates.dims else slice(None) for d in output.dims
+                )
+                output.data[index] = result.transpose(*output.dims).data
+        finally:
+            if n_threads > 1:
+                pool.close()
+                thread_manager.release_n_threads(n_threads)
+
+        return output
+
+    def _get_tile_shape(self, coordinates):
+        """Shape of the tiles for a request, or None if the request is evaluated at once.
+
+        Tiles are split along uniform dimensions and dimensions that are not convolved, so that the halo of each tile
+        contains the neighboring source coordinates.
+        """
+
+        tile_size = self.tile_size
+        if tile_size is None and isinstance(settings["CHUNK_SIZE"], int):
+            tile_size = settings["CHUNK_SIZE"]
+        if tile_size is None or coordinates.size <= tile_size:
+            return None
+
+        shape = list(coordinates.shape)
+        splittable = [
+            i
+            for i, dim in enumerate(coordinates.dims)
+            if dim not in self.kernel_dims or isinstance(coordinates[dim], UniformCoordinates1d)
+        ]
+        while np.prod(shape) > tile_size:
+            i = max(splittable, key=lambda i: shape[i], default=None)
+            if i is None or shape[i] == 1:
+                break
+            shape[i] = int(np.ceil(shape[i] / 2))
+
+        if shape == list(coordinates.shape):
+            return None
+        return shape
+
+    def _eval_tile(self, coordinates, output=None, _selector=None):
+        """Evaluates the source at the coordinates expanded by the kernel halo, and convolves."""
+
         # The size of this kernel is used to figure out the expanded size
         full_kernel = self.kernel
 
@@ -212,18 +305,13 @@ class Convolution(UnaryAlgorithm):
             full_kernel = full_kernel[tuple(new_axis)]
             exp_slice = new_exp_slice
 
-        if np.any(np.isnan(source)):
-            method = "direct"
-        else:
-            method = "auto"
-
         if ("output" not in source.dims) or ("output" in source.dims and "output" in kernel_dims):
-            result = scipy.signal.convolve(source, full_kernel, mode="same", method=method)
+            result = _convolve(source.data, full_kernel, self.nan_policy)
         else:
             # source with multiple outputs
             result = np.stack(
                 [
-                    scipy.signal.convolve(source.sel(output=output), full_kernel, mode="same", method=method)
+                    _convolve(source.sel(output=output).data, full_kernel, self.nan_policy)
                     for output in source.coords["output"]
                 ],
                 axis=source.dims.index("output"),
@@ -253,3 +341,100 @@ class Convolution(UnaryAlgorithm):
                 k = np.tensordot(k, k1d, 0)
 
         return k / k.sum()
+
+
+def _separable_factors(kernel):
+    """1D factors of a rank-1 (separable) kernel, or None if the kernel is not separable.
+
+    Parameters
+    ----------
+    kernel : np.ndarray
+        N-dimensional kernel
+
+    Returns
+    -------
+    list, None
+        One 1D array per kernel axis, such that the outer product of the factors is the kernel.
+    """
+
+    if kernel.ndim < 2 or not np.all(np.isfinite(kernel)):
+        return None
+
+    # the factors are the lines through the largest element, scaled so that their outer product matches it
+    index = np.unravel_index(np.argmax(np.abs(kernel)), kernel.shape)
+    pivot = kernel[index]
+    if pivot == 0:
+        return None
+
+    factors = []
+    for axis in range(kernel.ndim):
+        line = list(index)
+        line[axis] = slice(None)
+        factors.append(kernel[tuple(line)] / pivot)
+    factors[0] = factors[0] * pivot
+
+    outer = factors[0]
+    for f in factors[1:]:
+        outer = np.multiply.outer(outer, f)
+    if not np.allclose(outer, kernel, rtol=1e-12, atol=1e-14 * np.abs(pivot)):
+        return None
+    return factors
+
+
+def _convolve_same(data, kernel, factors=None):
+    """'same' mode convolution, as successive 1D convolutions if the kernel factors are given."""
+
+    if factors is None:
+        return scipy.signal.convolve(data, kernel, mode="same")
+
+    for axis, f in enumerate(factors):
+        if f.size == 1:
+            data = data * f[0]
+            continue
+        shape = [1] * data.ndim
+        shape[axis] = f.size
+        data = scipy.signal.convolve(data, f.reshape(shape), mode="same")
+    return data
+
+
+def _convolve(data, kernel, nan_policy="propagate"):
+    """'same' mode convolution of data that may contain nan values.
+
+    The nan values are zeroed, so that the FFT method can be used, and the convolution of the nan mask determines the
+    output values that are affected by them.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Data to convolve
+    kernel : np.ndarray
+        Convolution kernel, with the same number of dimensions as the data
+    nan_policy : str
+        'propagate' or 'normalize', see :class:`Convolution`
+
+    Returns
+    -------
+    np.ndarray
+        Convolved data, with the same shape as the input data
+    """
+
+    factors = _separable_factors(kernel)
+    isnan = np.isnan(data)
+    if not isnan.any():
+        return _convolve_same(data, kernel, factors)
+
+    result = _convolve_same(np.where(isnan, 0, data), kernel, factors)
+    if nan_policy == "normalize":
+        weights = np.abs(kernel)
+        wfactors = None if factors is None else [np.abs(f) for f in factors]
+        valid = _convolve_same((~isnan).astype(float), weights, wfactors)
+        # rounding errors of the FFT method are relative to the total weight
+        empty = valid <= 1e-8 * weights.sum()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = result * (weights.sum() / valid)
+        result[empty] = np.nan
+    else:
+        footprint = np.ones(kernel.shape)
+        n = _convolve_same(isnan.astype(float), footprint, [np.ones(s) for s in kernel.shape])
+        result[n > 0.5] = np.nan
+    return result
@@ -5,6 +5,7 @@ Stats Summary
 from __future__ import division, unicode_literals, print_function, absolute_import
 
 import warnings
+import multiprocessing
 from operator import mul
 from functools import reduce
 import logging
@@ -12,14 +13,20 @@ import logging
 import xarray as xr
 import numpy as np
 import scipy.stats
+import scipy.special
 import traitlets as tl
+import psutil
 from six import string_types
 
 # Internal dependencies
 import podpac
-from podpac.core.coordinates import Coordinates
+from podpac.core.settings import settings
+from podpac.core.coordinates import Coordinates, UniformCoordinates1d
 from podpac.core.node import Node
+from podpac.core.data.datasource import DataSource
 from podpac.core.algorithm.algorithm import UnaryAlgorithm, Algorithm
+from podpac.core.managers.multi_threading import thread_manager
+from podpac.core.managers.arena import buffer_arena
 from podpac.core.utils import common_doc, NodeTrait
 from podpac.core.node import COMMON_NODE_DOC
 
@@ -29,7 +36,96 @@ COMMON_DOC = COMMON_NODE_DOC.copy()
 _log = logging.getLogger(__name__)
 
 
-class Reduce(UnaryAlgorithm):
+class IncrementalMixin(tl.HasTraits):
+    """Mixin for time-dependent nodes that can be evaluated incrementally.
+
+    In incremental mode, the requested time coordinates are split into chunks aligned to calendar periods, and the
+    partial aggregation state (or the source output) of each time chunk is cached with the chunk coordinates. When the
+    node is evaluated again with a time axis that is extended, e.g. by one day, only the new or changed time chunks are
+    computed and merged with the cached chunks.
+
+    Attributes
+    ----------
+    incremental : bool
+        Evaluate and cache time chunks separately when the requested coordinates have a time dimension. The node must
+        have a cache (see `cache_ctrl`) and a definition. Default False.
+    incremental_period : str
+        Period of the time chunks, as a numpy datetime unit: 'Y', 'M', 'W', 'D', or 'h'. Default 'M'.
+    """
+
+    incremental = tl.Bool(False)
+    incremental_period = tl.Enum(["Y", "M", "W", "D", "h"], default_value="M")
+
+    def _incremental(self, coordinates):
+        return self.incremental and "time" in coordinates.dims
+
+    def _time_chunks(self, coordinates):
+        """Split coordinates along time into runs of consecutive times in the same calendar period.
+
+        Returns
+        -------
+        list
+            List of Coordinates, in time order.
+        """
+
+        periods = coordinates["time"].coordinates.astype("datetime64[%s]" % self.incremental_period)
+        breaks = [0] + list(np.where(periods[1:] != periods[:-1])[0] + 1) + [periods.size]
+        i = coordinates.dims.index("time")
+        index = [slice(None)] * len(coordinates.dims)
+        chunks = []
+        for start, stop in zip(breaks[:-1], breaks[1:]):
+            index[i] = slice(start, stop)
+            chunks.append(coordinates[tuple(index)])
+        return chunks
+
+    def _cached_chunk(self, key, chunk, f):
+        """Get cached data for a time chunk, or compute and cache it.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        chunk : podpac.Coordinates
+            Time chunk coordinates
+        f : callable(chunk)
+            Computes the data for the time chunk.
+        """
+
+        coords = chunk.transpose(*sorted(chunk.dims)).simplify()
+        if not self.force_eval and self.has_cache(key, coords):
+            return self.get_cache(key, coords)
+        data = f(chunk)
+        self.put_cache(data, key, coords)
+        return data
+
+    def _eval_incremental(self, node, key, coordinates, _selector=None):
+        """Evaluate a node over the time chunks of the requested coordinates, using cached chunk outputs.
+
+        Parameters
+        ----------
+        node : podpac.Node
+            Node to evaluate, e.g. the source node.
+        key : str
+            Cache key for the chunk outputs of this node.
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        _selector : callable, optional
+            Source selector.
+
+        Returns
+        -------
+        UnitsDataArray
+            Node output for the requested coordinates.
+        """
+
+        f = lambda chunk: node.eval(chunk, _selector=_selector)
+        outputs = [self._cached_chunk(key, chunk, f) for chunk in self._time_chunks(coordinates)]
+        if len(outputs) == 1 or "time" not in outputs[0].dims:
+            return outputs[0]
+        return xr.concat(outputs, "time")
+
+
+class Reduce(IncrementalMixin, UnaryAlgorithm):
     """Base node for statistical algorithms
 
     Attributes
@@ -38,15 +134,40 @@ class Reduce(UnaryAlgorithm):
         List of strings that give the dimensions which should be reduced
     source : podpac.Node
         The source node that will be reduced.
+    multithreading : bool
+        Evaluate and partially reduce chunks concurrently. Only used for chunked evaluations of nodes that define
+        mergeable partial states (see :meth:`partial`). Default is ``settings["MULTITHREADING"]``.
+    backend : str
+        Concurrent backend, 'thread' or 'process'. The 'process' backend evaluates each chunk from the node definition
+        in a separate process, so the node must be serializable. Default is 'thread'.
+    max_in_flight : int, None
+        Maximum number of chunks evaluated at once, which bounds the memory used by a concurrent reduction. Default
+        is the number of workers.
+
+    Notes
+    -----
+    Reductions that can be computed in O(1) space implement :meth:`partial`, :meth:`combine` and :meth:`finalize`.
+    The partial state of each chunk is computed independently, and the partial states are combined pairwise into the
+    final state, which does not depend on the order or grouping of the chunks.
     """
 
     from podpac.core.utils import DimsTrait
 
     dims = DimsTrait(allow_none=True, default_value=None).tag(attr=True)
+    multithreading = tl.Bool(False)
+    backend = tl.Enum(["thread", "process"], default_value="thread")
+    max_in_flight = tl.Int(default_value=None, allow_none=True)
 
     _reduced_coordinates = tl.Instance(Coordinates, allow_none=True)
     _dims = tl.List(trait=tl.Unicode())
 
+    # approximate number of chunk-sized arrays in memory while reducing a chunk (source output and temporaries)
+    _chunk_overhead = 4
+
+    @tl.default("multithreading")
+    def _default_multithreading(self):
+        return settings["MULTITHREADING"]
+
     def _first_init(self, **kwargs):
         if "dims" in kwargs and isinstance(kwargs["dims"], string_types):
             kwargs["dims"] = [kwargs["dims"]]
@@ -80,10 +201,51 @@ class Reduce(UnaryAlgorithm):
 
         chunk_size = podpac.settings["CHUNK_SIZE"]
         if chunk_size == "auto":
-            return 1024**2  # TODO
+            return self._auto_chunk_size()
         else:
             return chunk_size
 
+    def _auto_chunk_size(self):
+        """Chunk size from the memory budget (see settings["CHUNK_MEMORY_FRACTION"]), shared by the chunks in flight."""
+
+        if self.multithreading:
+            n = self.max_in_flight or settings["N_THREADS"]
+        else:
+            n = 1
+        return _auto_chunk_size(n, self._chunk_overhead)
+
+    def _get_storage_chunks(self, coords):
+        """Native storage chunk lengths of the source along each uniform dimension, in requested coordinates units.
+
+        Returns
+        -------
+        dict
+            Chunk length by dim, only for dims where the source storage chunks can be discovered.
+        """
+
+        if not isinstance(self.source, DataSource) or not self.source.storage_chunks:
+            return {}
+
+        if coords.crs.lower() != self.source.coordinates.crs.lower():
+            return {}
+
+        d = {}
+        for dim, n in self.source.storage_chunks.items():
+            if dim not in coords.dims or dim not in self.source.coordinates.dims:
+                continue
+            src, req = self.source.coordinates[dim], coords[dim]
+            if not isinstance(src, UniformCoordinates1d) or not isinstance(req, UniformCoordinates1d):
+                continue
+            d[dim] = max(1, int(round(n * abs(src.step / req.step))))
+        return d
+
+    def _get_storage_grid(self, coords):
+        """Storage grid of the source to snap the chunk edges to, see :meth:`DataSource.get_storage_grid`."""
+
+        if not isinstance(self.source, DataSource):
+            return {}
+        return self.source.get_storage_grid(coords)
+
     def _get_chunk_shape(self, coords):
         """Shape of chunks for parallel processing or large arrays that do not fit in memory.
 
@@ -96,6 +258,7 @@ class Reduce(UnaryAlgorithm):
             return None
 
         chunk_size = self.chunk_size
+        storage_chunks = self._get_storage_chunks(coords)
 
         d = {k: coords[k].size for k in coords.dims if k not in self._dims}
         s = reduce(mul, d.values(), 1)
@@ -104,7 +267,7 @@ class Reduce(UnaryAlgorithm):
             if n == 0:
                 d[dim] = 1
             elif n < coords[dim].size:
-                d[dim] = n
+                d[dim] = _align_chunk(n, storage_chunks.get(dim))
             else:
                 d[dim] = coords[dim].size
             s *= d[dim]
@@ -146,7 +309,7 @@ class Reduce(UnaryAlgorithm):
             Output for this chunk
         """
         chunk_shape = self._get_chunk_shape(coordinates)
-        for chunk in coordinates.iterchunks(chunk_shape):
+        for chunk in coordinates.iterchunks(chunk_shape, grid=self._get_storage_grid(coordinates)):
             yield self.source.eval(chunk, _selector=_selector)
 
     @common_doc(COMMON_DOC)
@@ -178,16 +341,10 @@ class Reduce(UnaryAlgorithm):
         if output is None:
             output = self.create_output_array(self._reduced_coordinates)
 
-        if self.chunk_size and self.chunk_size < reduce(mul, coordinates.shape, 1):
-            try:
-                result = self.reduce_chunked(self.iteroutputs(coordinates, _selector), output)
-            except NotImplementedError:
-                warnings.warn("No reduce_chunked method defined, using one-step reduce")
-                source_output = self.source.eval(coordinates, _selector=_selector)
-                result = self.reduce(source_output)
+        if self._incremental(coordinates):
+            result = self._reduce_incremental(coordinates, output, _selector)
         else:
-            source_output = self.source.eval(coordinates, _selector=_selector)
-            result = self.reduce(source_output)
+            result = self._reduce(coordinates, output, _selector)
 
         if output.shape == ():
             output.data = result
@@ -196,6 +353,45 @@ class Reduce(UnaryAlgorithm):
 
         return output
 
+    def _incremental(self, coordinates):
+        # reducing over time requires mergeable partial states
+        if "time" in self._dims and not self._mergeable:
+            return False
+        return super(Reduce, self)._incremental(coordinates)
+
+    def _reduce(self, coordinates, output, _selector=None):
+        """Reduce the source output for the requested coordinates, in chunks if necessary."""
+
+        if self.chunk_size and self.chunk_size < reduce(mul, coordinates.shape, 1):
+            try:
+                if self._mergeable:
+                    return self.reduce_parallel(coordinates, output, _selector)
+                else:
+                    return self.reduce_chunked(self.iteroutputs(coordinates, _selector), output)
+            except NotImplementedError:
+                warnings.warn("No reduce_chunked method defined, using one-step reduce")
+
+        source_output = self.source.eval(coordinates, _selector=_selector)
+        return self.reduce(source_output)
+
+    def _reduce_incremental(self, coordinates, output, _selector=None):
+        """Reduce the source output for the requested coordinates from the cached results of each time chunk.
+
+        When reducing over time, the partial state of each time chunk is cached and the states are combined.
+        Otherwise, the reduced output of each time chunk is cached and the outputs are concatenated.
+        """
+
+        chunks = self._time_chunks(coordinates)
+
+        if "time" in self._dims:
+            f = lambda chunk: self._reduce_state(chunk, _selector)
+            states = [self._cached_chunk("incremental_state", chunk, f) for chunk in chunks]
+            return self.finalize(self._tree_combine(states), output)
+
+        f = lambda chunk: self._reduce(chunk, self.create_output_array(chunk.drop(self._dims)), _selector)
+        results = [self._cached_chunk("incremental_output", chunk, f) for chunk in chunks]
+        return xr.concat(results, "time").transpose(*output.dims)
+
     def reduce(self, x):
         """
         Reduce a full array, e.g. x.mean(dims).
@@ -219,13 +415,197 @@ class Reduce(UnaryAlgorithm):
         """
         Reduce a list of xs with a memory-effecient iterative algorithm.
 
-        Optionally defined in each child.
+        By default, the partial states of the xs are combined one at a time. Optionally defined in each child.
 
         Parameters
         ----------
         xs : list, generator
             List of UnitsDataArray's that need to be reduced together.
 
+        Returns
+        -------
+        UnitsDataArray
+            Reduced output.
+
+        Raises
+        ------
+        NotImplementedError
+            If the child does not define a mergeable partial state.
+        """
+
+        if not self._mergeable:
+            raise NotImplementedError
+
+        state = None
+        for x in xs:
+            s = self.partial(x)
+            state = s if state is None else self.combine(state, s)
+        return self.finalize(state, output)
+
+    def reduce_parallel(self, coordinates, output, _selector=None):
+        """
+        Evaluate and reduce the chunks of the requested coordinates, concurrently if multithreading.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        output : UnitsDataArray
+            Reduced output array.
+        _selector : callable, optional
+            Source selector, only used by the 'thread' backend.
+
+        Returns
+        -------
+        UnitsDataArray
+            Reduced output.
+        """
+
+        return self.finalize(self._reduce_state(coordinates, _selector), output)
+
+    def _reduce_state(self, coordinates, _selector=None):
+        """
+        Evaluate and partially reduce the chunks of the requested coordinates, concurrently if multithreading.
+
+        Chunks are submitted in batches of at most ``max_in_flight`` chunks. The partial states of each batch are
+        tree-combined with the running state before the next batch is submitted. Within a process, the source is
+        evaluated into reused arrays (see :class:`podpac.core.managers.arena.BufferArena`) once its output layout is
+        known from the first chunk.
+
+        Parameters
+        ----------
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        _selector : callable, optional
+            Source selector, only used by the 'thread' backend.
+
+        Returns
+        -------
+        tuple
+            Merged partial state
+        """
+
+        if self.chunk_size and self.chunk_size < reduce(mul, coordinates.shape, 1):
+            chunk_shape = self._get_chunk_shape(coordinates)
+            chunks = list(coordinates.iterchunks(chunk_shape, grid=self._get_storage_grid(coordinates)))
+        else:
+            chunks = [coordinates]
+        layout = {}
+
+        def f(chunk):
+            state, layout["source"] = self._partial_chunk(chunk, layout.get("source"), _selector)
+            return state
+
+        n_threads = thread_manager.request_n_threads(len(chunks)) if self.multithreading else 0
+        if n_threads <= 1:
+            thread_manager.release_n_threads(n_threads)
+            state = None
+            for chunk in chunks:
+                s = f(chunk)
+                state = s if state is None else self.combine(state, s)
+            return state
+
+        if self.backend == "process":
+            # evaluate each chunk from the node definition
+            pool = multiprocessing.Pool(processes=n_threads)
+            f = _ProcessPartial(self.json, self._dims)
+            chunks = [chunk.compact_json for chunk in chunks]
+        else:
+            pool = thread_manager.get_thread_pool(processes=n_threads)
+
+        max_in_flight = self.max_in_flight or n_threads
+        state = None
+        try:
+            for i in range(0, len(chunks), max_in_flight):
+                states = pool.map(f, chunks[i : i + max_in_flight])
+                if state is not None:
+                    states.insert(0, state)
+                state = self._tree_combine(states)
+        finally:
+            pool.close()
+            thread_manager.release_n_threads(n_threads)
+
+        return state
+
+    def _partial_chunk(self, chunk, layout, _selector=None):
+        """Partial state of a chunk, and the layout of the chunk source output.
+
+        The source is evaluated into an array from the arena if its layout is known, which is released once the
+        partial state is computed.
+        """
+
+        out, buffer = buffer_arena.output_array(self.source, chunk, layout)
+        try:
+            x = self.source.eval(chunk, output=out, _selector=_selector)
+            state = self.partial(x)
+            if buffer is not None:
+                state = tuple(s.copy() if np.may_share_memory(s, buffer) else s for s in state)
+        finally:
+            buffer_arena.release(buffer)
+        return state, buffer_arena.get_layout(x, chunk)
+
+    def _tree_combine(self, states):
+        while len(states) > 1:
+            pairs = [states[i : i + 2] for i in range(0, len(states), 2)]
+            states = [self.combine(*pair) if len(pair) == 2 else pair[0] for pair in pairs]
+        return states[0]
+
+    @property
+    def _mergeable(self):
+        return type(self).partial is not Reduce.partial
+
+    def partial(self, x):
+        """
+        Compute the partial state of a chunk, e.g. (x.sum(dims), count(dims)).
+
+        Optionally defined in each child, together with :meth:`combine` and :meth:`finalize`.
+
+        Parameters
+        ----------
+        x : UnitsDataArray
+            Chunk that needs to be reduced.
+
+        Returns
+        -------
+        tuple
+            Partial state, a tuple of UnitsDataArrays with the reduced dimensions.
+
+        Raises
+        ------
+        NotImplementedError
+            If the child does not define a mergeable partial state.
+        """
+
+        raise NotImplementedError
+
+    def combine(self, a, b):
+        """
+        Merge two partial states.
+
+        Parameters
+        ----------
+        a, b : tuple
+            Partial states
+
+        Returns
+        -------
+        tuple
+            Merged partial state
+        """
+
+        raise NotImplementedError
+
+    def finalize(self, state, output):
+        """
+        Compute the reduced output from a merged partial state.
+
+        Parameters
+        ----------
+        state : tuple
+            Merged partial state
+        output : UnitsDataArray
+            Reduced output array.
+
         Returns
         -------
         UnitsDataArray
@@ -235,6 +615,100 @@ class Reduce(UnaryAlgorithm):
         raise NotImplementedError
 
 
+def _auto_chunk_size(n, overhead):
+    """Chunk size from the memory budget (see settings["CHUNK_MEMORY_FRACTION"]), shared by n chunks in flight that each
+    use about `overhead` chunk-sized float arrays."""
+
+    budget = settings["CHUNK_MEMORY_FRACTION"] * psutil.virtual_memory().available
+    return max(1, int(budget // (n * overhead * np.dtype(float).itemsize)))
+
+
+def _align_chunk(n, storage_chunk=None):
+    """Largest chunk length <= n that is a multiple or a divisor of the storage chunk length, so that chunks tile the
+    storage chunks."""
+
+    if not storage_chunk:
+        return n
+    if n >= storage_chunk:
+        return n // storage_chunk * storage_chunk
+    return max(k for k in range(1, n + 1) if storage_chunk % k == 0)
+
+
+def _doy_window_bounds(doys, win):
+    """First and last day-of-year of the window around each day-of-year, and whether the window wraps the year."""
+
+    # If either the start or end runs over the year, we need to do an OR on the bool index
+    # ----->s....<=e------   .in -out
+    # ..<=e----------->s..
+    doys = np.asarray(doys)
+    start = doys - win
+    end = doys + win
+    do_or = (start < 1) | (end > 365)
+    start = np.where(start < 1, start + 365, start)
+    end = np.where(end > 365, end - 365, end)
+    return start, end, do_or
+
+
+def _doy_window_masks(doys, source_doys, win):
+    """Boolean masks (doys x source times) of the source days within win days of each day-of-year."""
+
+    start, end, do_or = [a[:, None] for a in _doy_window_bounds(doys, win)]
+    source_doys = np.asarray(source_doys)[None, :]
+    return np.where(do_or, (source_doys >= start) | (source_doys <= end), (source_doys >= start) & (source_doys <= end))
+
+
+class _ProcessPartial(object):
+    """Picklable callable that computes the partial state of a chunk in a worker process."""
+
+    def __init__(self, definition, dims):
+        self.definition = definition
+        self.dims = dims
+
+    def __call__(self, coordinates):
+        node = Node.from_json(self.definition)
+        node._dims = self.dims
+        state = node.partial(node.source.eval(Coordinates.from_json(coordinates)))
+        return tuple(xr.DataArray(s) for s in state)
+
+
+def _moments(x, dims, order):
+    """Partial state (N, M1, M2, ...) with the count, mean, and central moment sums of x over dims."""
+
+    N = np.isfinite(x).sum(dim=dims)
+    M1 = x.mean(dim=dims)
+    E = x - M1
+    return (N, M1) + tuple((E**k).sum(dim=dims) for k in range(2, order + 1))
+
+
+def _merge_moments(a, b):
+    """Merge partial states (N, M1, M2, ...) of central moment sums, up to the fourth moment (Pebay, 2008)."""
+
+    Na, Nb = a[0].data, b[0].data
+    n = Na + Nb
+    NN = Na * Nb
+    d = b[1].data - a[1].data
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        M = [n, a[1].data + d * Nb / n]
+        if len(a) > 2:
+            M.append(a[2].data + b[2].data + d**2 * NN / n)
+        if len(a) > 3:
+            M.append(
+                a[3].data + b[3].data + d**3 * NN * (Na - Nb) / n**2 + 3 * d * (Na * b[2].data - Nb * a[2].data) / n
+            )
+        if len(a) > 4:
+            M.append(
+                a[4].data
+                + b[4].data
+                + d**4 * NN * (Na**2 - NN + Nb**2) / n**3
+                + 6 * d**2 * (Na**2 * b[2].data + Nb**2 * a[2].data) / n**2
+                + 4 * d * (Na * b[3].data - Nb * a[3].data) / n
+            )
+
+    # cells without data on one side keep the other side
+    return tuple(sa.copy(data=np.where(Nb == 0, sa.data, np.where(Na == 0, sb.data, m))) for sa, sb, m in zip(a, b, M))
+
+
 class ReduceOrthogonal(Reduce):
     """
     Extended Reduce class that enables chunks that are smaller than the reduced
@@ -259,6 +733,7 @@ class ReduceOrthogonal(Reduce):
             return None
 
         chunk_size = self.chunk_size
+        storage_chunks = self._get_storage_chunks(coords)
 
         # here, the minimum size is the reduce-dimensions size
         d = {k: coords[k].size for k in self._dims}
@@ -270,7 +745,7 @@ class ReduceOrthogonal(Reduce):
             if n == 0:
                 d[dim] = 1
             elif n < coords[dim].size:
-                d[dim] = n
+                d[dim] = _align_chunk(n, storage_chunks.get(dim))
             else:
                 d[dim] = coords[dim].size
             s *= d[dim]
@@ -287,7 +762,8 @@ class ReduceOrthogonal(Reduce):
         """
 
         chunk_shape = self._get_chunk_shape(coordinates)
-        for chunk, slices in coordinates.iterchunks(chunk_shape, return_slices=True):
+        grid = self._get_storage_grid(coordinates)
+        for chunk, slices in coordinates.iterchunks(chunk_shape, return_slices=True, grid=grid):
             yield self.source.eval(chunk, _selector=selector), slices
 
     def reduce_chunked(self, xs, output):
@@ -318,6 +794,156 @@ class ReduceOrthogonal(Reduce):
         return y
 
 
+class ReduceQuantile(ReduceOrthogonal):
+    """
+    Extended ReduceOrthogonal class for quantiles, with an optional streaming mode.
+
+    By default, quantiles are computed exactly, which requires each chunk to cover the entire reduce dimensions. In
+    streaming mode, a mergeable quantile sketch is kept for each output cell instead, so that chunks are split along
+    the reduce dimensions (like other Reduce nodes) and can be reduced concurrently. Each sketch holds a fixed number
+    of weighted centroids, and quantiles are interpolated between centroids. The result is exact as long as a cell has
+    no more finite values than centroids.
+
+    Attributes
+    ----------
+    streaming : bool
+        Use approximate streaming quantiles for chunked evaluations. Default False.
+    quantile_error : float
+        Approximate rank error of the streaming quantiles, as a fraction of the number of values. Each sketch uses
+        ``ceil(1 / quantile_error)`` centroids, so the memory per output cell is constant. Default 0.01.
+    """
+
+    streaming = tl.Bool(False).tag(attr=True)
+    quantile_error = tl.Float(0.01).tag(attr=True)
+
+    @property
+    def quantile(self):
+        """Quantile to compute, between 0 and 1."""
+        raise NotImplementedError
+
+    @property
+    def _mergeable(self):
+        return self.streaming
+
+    @property
+    def _sketch_size(self):
+        return int(np.ceil(1.0 / self.quantile_error))
+
+    def _get_chunk_shape(self, coords):
+        if self.streaming:
+            return Reduce._get_chunk_shape(self, coords)
+        return super(ReduceQuantile, self)._get_chunk_shape(coords)
+
+    def iteroutputs(self, coordinates, selector):
+        if self.streaming:
+            return Reduce.iteroutputs(self, coordinates, selector)
+        return super(ReduceQuantile, self).iteroutputs(coordinates, selector)
+
+    def reduce_chunked(self, xs, output):
+        if self.streaming:
+            return Reduce.reduce_chunked(self, xs, output)
+        return super(ReduceQuantile, self).reduce_chunked(xs, output)
+
+    def partial(self, x):
+        """Computes the quantile sketch of a chunk
+
+        Parameters
+        ----------
+        x : UnitsDataArray
+            Source data for this chunk.
+
+        Returns
+        -------
+        tuple
+            (centroid values, centroid weights, min, max), with the centroids along the last axis
+        """
+        keep = [dim for dim in x.dims if dim not in self._dims]
+        x = x.transpose(*(keep + list(self._dims)))
+        a = x.data.reshape(x.shape[: len(keep)] + (-1,))
+        return _quantile_sketch(a, self._sketch_size)
+
+    def combine(self, a, b):
+        return _merge_quantile_sketches(a, b, self._sketch_size)
+
+    def finalize(self, state, output):
+        return _sketch_quantile(state, self.quantile)
+
+
+def _compress_centroids(values, weights, k):
+    """Compress weighted centroids along the last axis into k (approximately) equal-weight centroids."""
+
+    shape = values.shape[:-1]
+    values = values.reshape(-1, values.shape[-1])
+    weights = weights.reshape(values.shape)
+    m = values.shape[0]
+
+    # sort by value, empty centroids (nan) last
+    order = np.argsort(values, axis=-1)
+    values = np.take_along_axis(values, order, -1)
+    weights = np.take_along_axis(weights, order, -1)
+
+    # assign each centroid to a bin by its cumulative weight
+    total = weights.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        b = np.floor(k * (np.cumsum(weights, axis=-1) - weights / 2) / total)
+    b = np.clip(np.nan_to_num(b), 0, k - 1).astype(int) + k * np.arange(m)[:, None]
+
+    w = np.bincount(b.ravel(), weights=weights.ravel(), minlength=m * k).reshape(m, k)
+    s = np.bincount(b.ravel(), weights=np.where(weights > 0, values * weights, 0).ravel(), minlength=m * k)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        v = np.where(w > 0, s.reshape(m, k) / w, np.nan)
+
+    # empty bins last
+    order = np.argsort(v, axis=-1)
+    v = np.take_along_axis(v, order, -1)
+    w = np.take_along_axis(w, order, -1)
+    return v.reshape(shape + (k,)), w.reshape(shape + (k,))
+
+
+def _quantile_sketch(a, k):
+    """Quantile sketch (centroid values, centroid weights, min, max) of the finite values of a along the last axis."""
+
+    a = np.asarray(a, dtype=float)
+    finite = np.isfinite(a)
+    v, w = _compress_centroids(np.where(finite, a, np.nan), finite.astype(float), k)
+    return v, w, np.fmin.reduce(a, axis=-1), np.fmax.reduce(a, axis=-1)
+
+
+def _merge_quantile_sketches(a, b, k):
+    """Merge two quantile sketches with k centroids."""
+
+    v, w = _compress_centroids(
+        np.concatenate([np.asarray(a[0]), np.asarray(b[0])], axis=-1),
+        np.concatenate([np.asarray(a[1]), np.asarray(b[1])], axis=-1),
+        k,
+    )
+    return v, w, np.fmin(a[2], b[2]), np.fmax(a[3], b[3])
+
+
+def _sketch_quantile(state, q):
+    """Interpolate the q-quantile (0 <= q <= 1) from a quantile sketch, using the same definition as np.percentile."""
+
+    v, w, lo, hi = [np.asarray(s) for s in state]
+    total = w.sum(axis=-1)
+    n = (w > 0).sum(axis=-1)
+
+    # rank of each centroid center, with the min and max at the first and last rank
+    c = np.where(w > 0, np.cumsum(w, axis=-1) - (w + 1) / 2, np.inf)
+    x = np.concatenate([np.zeros(total.shape + (1,)), c, np.full(total.shape + (1,), np.inf)], axis=-1)
+    y = np.concatenate([lo[..., None], v, np.full(total.shape + (1,), np.nan)], axis=-1)
+    np.put_along_axis(x, n[..., None] + 1, (total - 1)[..., None], -1)
+    np.put_along_axis(y, n[..., None] + 1, hi[..., None], -1)
+
+    # linear interpolation between the neighboring centroids
+    t = q * (total - 1)
+    j = np.clip((x <= t[..., None]).sum(axis=-1), 1, n + 1)[..., None]
+    x0, x1 = np.take_along_axis(x, j - 1, -1)[..., 0], np.take_along_axis(x, j, -1)[..., 0]
+    y0, y1 = np.take_along_axis(y, j - 1, -1)[..., 0], np.take_along_axis(y, j, -1)[..., 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f = np.where(x1 > x0, (t - x0) / (x1 - x0), 0)
+    return np.where(total > 0, y0 + f * (y1 - y0), np.nan)
+
+
 class Min(Reduce):
     """Computes the minimum across dimension(s)"""
 
@@ -336,24 +962,27 @@ class Min(Reduce):
         """
         return x.min(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the minimum across a chunk
+    def partial(self, x):
+        """Computes the minimum of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Minimum of the source data over dims
+        tuple
+            (minimum,)
         """
+        return (x.min(dim=self._dims),)
+
+    def combine(self, a, b):
         # note: np.fmin ignores NaNs, np.minimum propagates NaNs
-        y = xr.full_like(output, np.nan)
-        for x in xs:
-            y = np.fmin(y, x.min(dim=self._dims))
-        return y
+        return (np.fmin(a[0], b[0]),)
+
+    def finalize(self, state, output):
+        return state[0]
 
 
 class Max(Reduce):
@@ -374,24 +1003,27 @@ class Max(Reduce):
         """
         return x.max(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the maximum across a chunk
+    def partial(self, x):
+        """Computes the maximum of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Maximum of the source data over dims
+        tuple
+            (maximum,)
         """
+        return (x.max(dim=self._dims),)
+
+    def combine(self, a, b):
         # note: np.fmax ignores NaNs, np.maximum propagates NaNs
-        y = xr.full_like(output, np.nan)
-        for x in xs:
-            y = np.fmax(y, x.max(dim=self._dims))
-        return y
+        return (np.fmax(a[0], b[0]),)
+
+    def finalize(self, state, output):
+        return state[0]
 
 
 class Sum(Reduce):
@@ -412,23 +1044,26 @@ class Sum(Reduce):
         """
         return x.sum(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the sum across a chunk
+    def partial(self, x):
+        """Computes the sum of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Sum of the source data over dims
+        tuple
+            (sum,)
         """
-        s = xr.zeros_like(output)
-        for x in xs:
-            s += x.sum(dim=self._dims)
-        return s
+        return (x.sum(dim=self._dims),)
+
+    def combine(self, a, b):
+        return (a[0] + b[0],)
+
+    def finalize(self, state, output):
+        return state[0]
 
 
 class Count(Reduce):
@@ -449,23 +1084,26 @@ class Count(Reduce):
         """
         return np.isfinite(x).sum(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Counts the finite values across a chunk
+    def partial(self, x):
+        """Counts the finite values of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Number of finite values of the source data over dims
+        tuple
+            (count,)
         """
-        n = xr.zeros_like(output)
-        for x in xs:
-            n += np.isfinite(x).sum(dim=self._dims)
-        return n
+        return (np.isfinite(x).sum(dim=self._dims),)
+
+    def combine(self, a, b):
+        return (a[0] + b[0],)
+
+    def finalize(self, state, output):
+        return state[0]
 
 
 class Mean(Reduce):
@@ -486,27 +1124,27 @@ class Mean(Reduce):
         """
         return x.mean(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the mean across a chunk
+    def partial(self, x):
+        """Computes the sum and the number of finite values of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Mean of the source data over dims
+        tuple
+            (sum, count)
         """
-        s = xr.zeros_like(output)
-        n = xr.zeros_like(output)
-        for x in xs:
-            # TODO efficency
-            s += x.sum(dim=self._dims)
-            n += np.isfinite(x).sum(dim=self._dims)
-        output = s / n
-        return output
+        return x.sum(dim=self._dims), np.isfinite(x).sum(dim=self._dims)
+
+    def combine(self, a, b):
+        return a[0] + b[0], a[1] + b[1]
+
+    def finalize(self, state, output):
+        s, n = state
+        return s / n
 
 
 class Variance(Reduce):
@@ -527,32 +1165,27 @@ class Variance(Reduce):
         """
         return x.var(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the variance across a chunk
+    def partial(self, x):
+        """Computes the count, mean, and sum of squared deviations of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Variance of the source data over dims
+        tuple
+            (N, M1, M2)
         """
-        n = xr.zeros_like(output)
-        m = xr.zeros_like(output)
-        m2 = xr.zeros_like(output)
+        return _moments(x, self._dims, 2)
 
-        # Welford, adapted to handle multiple data points in each iteration
-        for x in xs:
-            n += np.isfinite(x).sum(dim=self._dims)
-            d = x - m
-            m += (d / n).sum(dim=self._dims)
-            d2 = x - m
-            m2 += (d * d2).sum(dim=self._dims)
+    def combine(self, a, b):
+        return _merge_moments(a, b)
 
-        return m2 / n
+    def finalize(self, state, output):
+        N, M1, M2 = state
+        return M2 / N
 
 
 class Skew(Reduce):
@@ -588,56 +1221,26 @@ class Skew(Reduce):
         skew = scipy.stats.skew(a, nan_policy="omit")
         return skew
 
-    def reduce_chunked(self, xs, output):
-        """Computes the skew across a chunk
+    def partial(self, x):
+        """Computes the count, mean, and central moment sums of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Skew of the source data over dims
+        tuple
+            (N, M1, M2, M3)
         """
-        N = xr.zeros_like(output)
-        M1 = xr.zeros_like(output)
-        M2 = xr.zeros_like(output)
-        M3 = xr.zeros_like(output)
-        check_empty = True
+        return _moments(x, self._dims, 3)
 
-        for x in xs:
-            Nx = np.isfinite(x).sum(dim=self._dims)
-            M1x = x.mean(dim=self._dims)
-            Ex = x - M1x
-            Ex2 = Ex**2
-            Ex3 = Ex2 * Ex
-            M2x = (Ex2).sum(dim=self._dims)
-            M3x = (Ex3).sum(dim=self._dims)
-
-            # premask to omit NaNs
-            b = Nx.data > 0
-            Nx = Nx.data[b]
-            M1x = M1x.data[b]
-            M2x = M2x.data[b]
-            M3x = M3x.data[b]
-
-            Nb = N.data[b]
-            M1b = M1.data[b]
-            M2b = M2.data[b]
-
-            # merge
-            d = M1x - M1b
-            n = Nb + Nx
-            NNx = Nb * Nx
-
-            M3.data[b] += M3x + d**3 * NNx * (Nb - Nx) / n**2 + 3 * d * (Nb * M2x - Nx * M2b) / n
-            M2.data[b] += M2x + d**2 * NNx / n
-            M1.data[b] += d * Nx / n
-            N.data[b] = n
-
-        # calculate skew
+    def combine(self, a, b):
+        return _merge_moments(a, b)
+
+    def finalize(self, state, output):
+        N, M1, M2, M3 = state
         skew = np.sqrt(N) * M3 / np.sqrt(M2**3)
         return skew
 
@@ -674,67 +1277,26 @@ class Kurtosis(Reduce):
         kurtosis = scipy.stats.kurtosis(a, nan_policy="omit")
         return kurtosis
 
-    def reduce_chunked(self, xs, output):
-        """Computes the kurtosis across a chunk
+    def partial(self, x):
+        """Computes the count, mean, and central moment sums of a chunk
 
         Parameters
         ----------
-        xs : iterable
-            Iterable of sources
+        x : UnitsDataArray
+            Source data for this chunk.
 
         Returns
         -------
-        UnitsDataArray
-            Kurtosis of the source data over dims
+        tuple
+            (N, M1, M2, M3, M4)
         """
-        N = xr.zeros_like(output)
-        M1 = xr.zeros_like(output)
-        M2 = xr.zeros_like(output)
-        M3 = xr.zeros_like(output)
-        M4 = xr.zeros_like(output)
+        return _moments(x, self._dims, 4)
 
-        for x in xs:
-            Nx = np.isfinite(x).sum(dim=self._dims)
-            M1x = x.mean(dim=self._dims)
-            Ex = x - M1x
-            Ex2 = Ex**2
-            Ex3 = Ex2 * Ex
-            Ex4 = Ex2**2
-            M2x = (Ex2).sum(dim=self._dims)
-            M3x = (Ex3).sum(dim=self._dims)
-            M4x = (Ex4).sum(dim=self._dims)
-
-            # premask to omit NaNs
-            b = Nx.data > 0
-            Nx = Nx.data[b]
-            M1x = M1x.data[b]
-            M2x = M2x.data[b]
-            M3x = M3x.data[b]
-            M4x = M4x.data[b]
-
-            Nb = N.data[b]
-            M1b = M1.data[b]
-            M2b = M2.data[b]
-            M3b = M3.data[b]
-
-            # merge
-            d = M1x - M1b
-            n = Nb + Nx
-            NNx = Nb * Nx
-
-            M4.data[b] += (
-                M4x
-                + d**4 * NNx * (Nb**2 - NNx + Nx**2) / n**3
-                + 6 * d**2 * (Nb**2 * M2x + Nx**2 * M2b) / n**2
-                + 4 * d * (Nb * M3x - Nx * M3b) / n
-            )
-
-            M3.data[b] += M3x + d**3 * NNx * (Nb - Nx) / n**2 + 3 * d * (Nb * M2x - Nx * M2b) / n
-            M2.data[b] += M2x + d**2 * NNx / n
-            M1.data[b] += d * Nx / n
-            N.data[b] = n
+    def combine(self, a, b):
+        return _merge_moments(a, b)
 
-        # calculate kurtosis
+    def finalize(self, state, output):
+        N, M1, M2, M3, M4 = state
         kurtosis = N * M4 / M2**2 - 3
         return kurtosis
 
@@ -757,24 +1319,12 @@ class StandardDeviation(Variance):
         """
         return x.std(dim=self._dims)
 
-    def reduce_chunked(self, xs, output):
-        """Computes the standard deviation across a chunk
-
-        Parameters
-        ----------
-        xs : iterable
-            Iterable of sources
-
-        Returns
-        -------
-        UnitsDataArray
-            Standard deviation of the source data over dims
-        """
-        var = super(StandardDeviation, self).reduce_chunked(xs, output)
+    def finalize(self, state, output):
+        var = super(StandardDeviation, self).finalize(state, output)
         return np.sqrt(var)
 
 
-class Median(ReduceOrthogonal):
+class Median(ReduceQuantile):
     """Computes the median across dimension(s)
 
     Example
@@ -785,6 +1335,8 @@ class Median(ReduceOrthogonal):
     o.dims == ['time']
     """
 
+    quantile = 0.5
+
     def reduce(self, x):
         """Computes the median across dimension(s)
 
@@ -801,17 +1353,21 @@ class Median(ReduceOrthogonal):
         return x.median(dim=self._dims)
 
 
-class Percentile(ReduceOrthogonal):
+class Percentile(ReduceQuantile):
     """Computes the percentile across dimension(s)
 
     Attributes
     ----------
-    percentile : TYPE
-        Description
+    percentile : float
+        Percentile to compute, between 0 and 100. Default 50.
     """
 
     percentile = tl.Float(default_value=50.0).tag(attr=True)
 
+    @property
+    def quantile(self):
+        return self.percentile / 100.0
+
     def reduce(self, x):
         """Computes the percentile across dimension(s)
 
@@ -835,8 +1391,293 @@ class Percentile(ReduceOrthogonal):
 
 _REDUCE_FUNCTIONS = ["all", "any", "count", "max", "mean", "median", "min", "prod", "std", "sum", "var", "custom"]
 
+# values of the partial state of a group that has no data, for reduce functions with mergeable partial states
+_GROUP_STATE_FILL = {
+    "all": (True,),
+    "any": (False,),
+    "count": (0,),
+    "max": (np.nan,),
+    "mean": (0, 0),
+    "min": (np.nan,),
+    "prod": (1,),
+    "std": (0, np.nan, 0),
+    "sum": (0,),
+    "var": (0, np.nan, 0),
+}
+
+_GROUP_STATE_COMBINE = {
+    "all": np.logical_and,
+    "any": np.logical_or,
+    "count": np.add,
+    "max": np.fmax,
+    "mean": np.add,
+    "min": np.fmin,
+    "prod": np.multiply,
+    "sum": np.add,
+}
+
+
+# segment reductions used for the partial state of each reduce function with a mergeable partial state
+_GROUP_STATE_SEGMENTS = {"mean": ["sum", "count"], "std": ["count", "mean", "m2"], "var": ["count", "mean", "m2"]}
+
+# approximate number of chunk-sized arrays in memory while reducing a chunk (source output, sorted copy, temporaries)
+_GROUP_CHUNK_OVERHEAD = 4
+
+
+def _segments(labels, groups):
+    """Sort order of the times by group, and the start of each group in sorted order.
+
+    Parameters
+    ----------
+    labels : np.ndarray
+        Group label of each time.
+    groups : np.ndarray
+        Sorted group labels.
+
+    Returns
+    -------
+    order : np.ndarray
+        Stable sort order of the times by group.
+    present : np.ndarray
+        Index of each group with at least one time, in `groups`.
+    index : np.ndarray
+        Start of each present group in sorted order, for `np.ufunc.reduceat`.
+    """
+
+    inverse = np.searchsorted(groups, labels)
+    order = np.argsort(inverse, kind="stable")
+    present, index = np.unique(inverse[order], return_index=True)
+    return order, present, index
+
+
+def _segment_reduce(a, index, reduce_fn):
+    """Reduce contiguous segments of the columns of a 2D array, with the same NaN handling as xarray.
+
+    Parameters
+    ----------
+    a : np.ndarray
+        Array with shape (cells, times), with the times sorted by segment.
+    index : np.ndarray
+        Start of each segment, see `_segments`.
+    reduce_fn : str
+        Reduce function, one of _REDUCE_FUNCTIONS except 'custom', or 'm2' for the sum of the squared deviations from
+        the segment mean.
+
+    Returns
+    -------
+    np.ndarray
+        Reduced array with shape (cells, segments).
+    """
+
+    if reduce_fn == "max":
+        return np.fmax.reduceat(a, index, axis=1)
+    if reduce_fn == "min":
+        return np.fmin.reduceat(a, index, axis=1)
+    if reduce_fn == "prod":
+        return np.multiply.reduceat(np.where(np.isnan(a), 1, a), index, axis=1)
+    if reduce_fn == "all":
+        return np.logical_and.reduceat(a != 0, index, axis=1)
+    if reduce_fn == "any":
+        return np.logical_or.reduceat(a != 0, index, axis=1)
+    if reduce_fn == "median":
+        bounds = list(index) + [a.shape[1]]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.stack([np.nanmedian(a[:, i:j], axis=1) for i, j in zip(bounds[:-1], bounds[1:])], axis=1)
+
+    finite = np.isfinite(a)
+    n = np.add.reduceat(finite, index, axis=1)
+    if reduce_fn == "count":
+        return n
+    s = np.add.reduceat(np.where(finite, a, 0), index, axis=1)
+    if reduce_fn == "sum":
+        return s
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = s / n
+    if reduce_fn == "mean":
+        return mean
+
+    d = np.where(finite, a - np.repeat(mean, np.diff(list(index) + [a.shape[1]]), axis=1), 0)
+    m2 = np.add.reduceat(d**2, index, axis=1)
+    if reduce_fn == "m2":
+        return m2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        var = m2 / n
+    return np.sqrt(var) if reduce_fn == "std" else var
+
+
+def _group_reduce_array(x, labels, groups, reduce_fns):
+    """Grouped reductions over time of an array, using segment reductions.
+
+    Parameters
+    ----------
+    x : xr.DataArray
+        Source output
+    labels : xr.DataArray
+        Group label of each time in x, named by the group dimension.
+    groups : np.ndarray
+        Sorted group labels of the output. Groups without any time in x are NaN.
+    reduce_fns : list
+        Reduce functions, see `_segment_reduce`.
+
+    Returns
+    -------
+    tuple
+        Reduced arrays, with the group dimension in place of the time dimension.
+    """
+
+    order, present, index = _segments(labels.data, groups)
+    x = x.transpose(*([dim for dim in x.dims if dim != "time"] + ["time"]))
+    a = x.data.reshape(-1, x.shape[-1])[:, order]
+    dims = list(x.dims[:-1]) + [labels.name]
+    coords = {labels.name: groups}
+    if "output" in x.dims:
+        coords["output"] = x["output"].data
+
+    results = []
+    for reduce_fn in reduce_fns:
+        r = _segment_reduce(a, index, reduce_fn)
+        if present.size < len(groups):
+            full = np.full((r.shape[0], len(groups)), np.nan)
+            full[:, present] = r
+            r = full
+        results.append(xr.DataArray(r.reshape(x.shape[:-1] + (len(groups),)), dims=dims, coords=coords, attrs=x.attrs))
+    return tuple(results)
+
+
+def _group_chunk_shape(coordinates):
+    """Shape of chunks over the non-time dims with all of the times, see settings["CHUNK_SIZE"].
+
+    Returns
+    -------
+    list, None
+        List of integers giving the shape of each chunk, or None if the coordinates are not chunked.
+    """
+
+    chunk_size = settings["CHUNK_SIZE"]
+    if chunk_size == "auto":
+        chunk_size = _auto_chunk_size(1, _GROUP_CHUNK_OVERHEAD)
+    if not chunk_size or chunk_size >= reduce(mul, coordinates.shape, 1):
+        return None
+
+    d = {"time": coordinates["time"].size}
+    s = d["time"]
+    for dim in coordinates.dims[::-1]:
+        if dim == "time":
+            continue
+        d[dim] = max(1, min(chunk_size // s, coordinates[dim].size))
+        s *= d[dim]
+    return [d[dim] for dim in coordinates.dims]
+
+
+def _group_reduce(node, coordinates, labels, groups, _selector=None):
+    """Grouped reduction over time of the node source, evaluated in chunks over the non-time dims.
 
-class GroupReduce(UnaryAlgorithm):
+    Parameters
+    ----------
+    node : GroupReduce, ResampleReduce
+        Grouped reduce node
+    coordinates : podpac.Coordinates
+        Requested coordinates.
+    labels : xr.DataArray
+        Group label of each requested time, named by the group dimension.
+    groups : np.ndarray
+        Sorted group labels of the output.
+    _selector : callable, optional
+        Source selector.
+
+    Returns
+    -------
+    xr.DataArray
+        Reduced output, with the group dimension in place of the time dimension.
+    """
+
+    chunk_shape = _group_chunk_shape(coordinates)
+    if chunk_shape is None:
+        x = node.source.eval(coordinates, _selector=_selector)
+        return _group_reduce_array(x, labels, groups, [node.reduce_fn])[0]
+
+    out = None
+    for chunk, slices in coordinates.iterchunks(chunk_shape, return_slices=True):
+        x = node.source.eval(chunk, _selector=_selector)
+        r = _group_reduce_array(x, labels, groups, [node.reduce_fn])[0]
+        if out is None:
+            shape = [len(groups) if dim == labels.name else r.sizes[dim] for dim in r.dims]
+            for k, dim in enumerate(r.dims):
+                if dim in coordinates.dims:
+                    shape[k] = coordinates[dim].size
+            out = xr.DataArray(np.empty(shape, dtype=r.dtype), dims=r.dims, coords=r.coords, attrs=r.attrs)
+        index = tuple(slices[coordinates.dims.index(dim)] if dim in coordinates.dims else slice(None) for dim in r.dims)
+        out.data[index] = r.data
+    return out
+
+
+def _group_partial(x, labels, reduce_fn):
+    """Partial state of a grouped reduction over time, for the groups in labels."""
+
+    groups = np.unique(labels.data)
+    return _group_reduce_array(x, labels, groups, _GROUP_STATE_SEGMENTS.get(reduce_fn, [reduce_fn]))
+
+
+def _group_combine(a, b, reduce_fn):
+    """Merge partial states of a grouped reduction, which may have different groups."""
+
+    pairs = [xr.align(sa, sb, join="outer", fill_value=f) for sa, sb, f in zip(a, b, _GROUP_STATE_FILL[reduce_fn])]
+    a, b = tuple(sa for sa, sb in pairs), tuple(sb for sa, sb in pairs)
+    if reduce_fn in ["var", "std"]:
+        return _merge_moments(a, b)
+    return tuple(_GROUP_STATE_COMBINE[reduce_fn](sa, sb) for sa, sb in zip(a, b))
+
+
+def _group_finalize(state, reduce_fn):
+    """Grouped reduction from a merged partial state, with the source attributes."""
+
+    if reduce_fn == "mean":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = state[0] / state[1]
+    elif reduce_fn in ["var", "std"]:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = state[2] / state[0]
+        out = np.sqrt(var) if reduce_fn == "std" else var
+    else:
+        out = state[0]
+    return out.assign_attrs(state[0].attrs)
+
+
+def _group_reduce_incremental(node, coordinates, labels, key, _selector=None):
+    """Grouped reduction of the node source, from the cached partial states of the time chunks.
+
+    Parameters
+    ----------
+    node : GroupReduce, ResampleReduce
+        Incremental node
+    coordinates : podpac.Coordinates
+        Requested coordinates.
+    labels : xr.DataArray
+        Group label of each requested time.
+    key : str
+        Cache key for the partial states.
+    _selector : callable, optional
+        Source selector.
+
+    Returns
+    -------
+    xr.DataArray
+        Reduced output, with the groups along the labels dimension.
+    """
+
+    def f(chunk):
+        x = node.source.eval(chunk, _selector=_selector)
+        return _group_partial(x, labels.sel(time=chunk["time"].coordinates), node.reduce_fn)
+
+    states = [node._cached_chunk(key, chunk, f) for chunk in node._time_chunks(coordinates)]
+    state = states[0]
+    for s in states[1:]:
+        state = _group_combine(state, s, node.reduce_fn)
+    return _group_finalize(state, node.reduce_fn)
+
+
+class GroupReduce(IncrementalMixin, UnaryAlgorithm):
     """
     Group a time-dependent source node and then compute a statistic for each result.
 
@@ -850,6 +1691,16 @@ class GroupReduce(UnaryAlgorithm):
         builtin xarray groupby reduce function, or 'custom'.
     source : podpac.Node
         Source node
+
+    Notes
+    -----
+    Except for the 'custom' reduce function, the group of each requested time is computed once, and each group is
+    reduced with vectorized segment reductions of the times sorted by group. The source is evaluated in chunks over the
+    non-time dimensions, see ``settings["CHUNK_SIZE"]``.
+
+    In incremental mode (see :class:`IncrementalMixin`), the grouped partial state of each time chunk is cached for
+    the 'all', 'any', 'count', 'max', 'mean', 'min', 'prod', 'std', 'sum', and 'var' reduce functions, and the source
+    output of each time chunk is cached for the other reduce functions.
     """
 
     _repr_keys = ["source", "groupby", "reduce_fn"]
@@ -889,17 +1740,21 @@ class GroupReduce(UnaryAlgorithm):
             If source it not time-depended (required by this node).
         """
 
-        source_output = self.source.eval(coordinates)
-
-        # group
-        grouped = source_output.groupby("time.%s" % self.groupby)
-
-        # reduce
+        labels = self._labels(coordinates)
+        groups = np.unique(labels.data)
         if self.reduce_fn == "custom":
-            out = grouped.apply(self.custom_reduce_fn, "time")
+            if self._incremental(coordinates):
+                out = self._reduce(self._eval_incremental(self.source, "incremental_source", coordinates))
+            else:
+                out = self._reduce(self.source.eval(coordinates))
+        elif self._incremental(coordinates) and self.reduce_fn in _GROUP_STATE_FILL:
+            out = _group_reduce_incremental(self, coordinates, labels, "incremental_state")
+            out = out.reindex({self.groupby: groups})
+        elif self._incremental(coordinates):
+            source_output = self._eval_incremental(self.source, "incremental_source", coordinates)
+            out = _group_reduce_array(source_output, labels, groups, [self.reduce_fn])[0]
         else:
-            # standard, e.g. grouped.median('time')
-            out = getattr(grouped, self.reduce_fn)("time")
+            out = _group_reduce(self, coordinates, labels, groups)
 
         out = out.rename({self.groupby: "time"})
         if output is None:
@@ -919,6 +1774,23 @@ class GroupReduce(UnaryAlgorithm):
 
         return output
 
+    def _reduce(self, source_output):
+        # group
+        grouped = source_output.groupby("time.%s" % self.groupby)
+
+        # reduce
+        if self.reduce_fn == "custom":
+            return grouped.apply(self.custom_reduce_fn, "time")
+        else:
+            # standard, e.g. grouped.median('time')
+            return getattr(grouped, self.reduce_fn)("time")
+
+    def _labels(self, coordinates):
+        """Group label of each requested time."""
+
+        times = coordinates["time"].coordinates
+        return xr.DataArray(times, coords={"time": times}, dims=["time"])["time.%s" % self.groupby]
+
     @property
     def base_ref(self):
         """
@@ -932,7 +1804,7 @@ class GroupReduce(UnaryAlgorithm):
         return "%s.%s.%s" % (self.source.base_ref, self.groupby, self.reduce_fn)
 
 
-class ResampleReduce(UnaryAlgorithm):
+class ResampleReduce(IncrementalMixin, UnaryAlgorithm):
     """
     Resample a time-dependent source node using a statistical operation to achieve the result.
 
@@ -946,6 +1818,15 @@ class ResampleReduce(UnaryAlgorithm):
         builtin xarray groupby reduce function, or 'custom'.
     source : podpac.Node
         Source node
+
+    Notes
+    -----
+    Except for the 'custom' reduce function, the time bins are reduced with the same vectorized segment reductions and
+    chunking as :class:`GroupReduce`.
+
+    In incremental mode (see :class:`IncrementalMixin`), the partial state of the resampled time bins of each time
+    chunk is cached for the same reduce functions as :class:`GroupReduce`, and the source output of each time chunk is
+    cached for the other reduce functions.
     """
 
     _repr_keys = ["source", "resample", "reduce_fn"]
@@ -985,21 +1866,37 @@ class ResampleReduce(UnaryAlgorithm):
             If source it not time-dependent (required by this node).
         """
 
-        source_output = self.source.eval(coordinates, _selector=_selector)
+        if self.reduce_fn == "custom":
+            if self._incremental(coordinates):
+                source_output = self._eval_incremental(self.source, "incremental_source", coordinates, _selector)
+            else:
+                source_output = self.source.eval(coordinates, _selector=_selector)
+            out = self._reduce(source_output)
 
-        # group
-        grouped = source_output.resample(time=self.resample)
+            if output is None:
+                output = podpac.UnitsDataArray(out)
+                output.attrs = source_output.attrs
+            else:
+                output.data[:] = out.data[:]
+            return output
 
-        # reduce
-        if self.reduce_fn == "custom":
-            out = grouped.reduce(self.custom_reduce_fn)
+        labels, bins = self._labels(coordinates)
+        if self._incremental(coordinates) and self.reduce_fn in _GROUP_STATE_FILL:
+            # the bins depend on the first requested time
+            key = "incremental_state_%s" % bins[0]
+            out = _group_reduce_incremental(self, coordinates, labels, key, _selector).reindex(bin=bins)
+        elif self._incremental(coordinates):
+            source_output = self._eval_incremental(self.source, "incremental_source", coordinates, _selector)
+            out = _group_reduce_array(source_output, labels, bins, [self.reduce_fn])[0]
         else:
-            # standard, e.g. grouped.median('time')
-            out = getattr(grouped, self.reduce_fn)()
+            out = _group_reduce(self, coordinates, labels, bins, _selector)
 
+        out = out.rename({"bin": "time"})
         if output is None:
-            output = podpac.UnitsDataArray(out)
-            output.attrs = source_output.attrs
+            coords = podpac.coordinates.merge_dims([coordinates.drop("time"), Coordinates([bins], ["time"])])
+            coords = coords.transpose(*out.dims)
+            output = self.create_output_array(coords, data=out.data)
+            output.attrs.update(out.attrs)  # source attributes, e.g. units
         else:
             output.data[:] = out.data[:]
 
@@ -1011,6 +1908,36 @@ class ResampleReduce(UnaryAlgorithm):
 
         return output
 
+    def _reduce(self, source_output):
+        # group
+        grouped = source_output.resample(time=self.resample)
+
+        # reduce
+        if self.reduce_fn == "custom":
+            return grouped.reduce(self.custom_reduce_fn)
+        else:
+            # standard, e.g. grouped.median('time')
+            return getattr(grouped, self.reduce_fn)()
+
+    def _labels(self, coordinates):
+        """Resampled time bin of each requested time, and all of the time bins.
+
+        Returns
+        -------
+        labels : xr.DataArray
+            Time bin of each requested time, along the time dimension.
+        bins : np.ndarray
+            Time bins, including empty bins.
+        """
+
+        times = coordinates["time"].coordinates
+        index = xr.DataArray(np.arange(times.size), coords={"time": times}, dims=["time"])
+        first = index.resample(time=self.resample).min()
+        valid = np.isfinite(first.data)
+        starts, bins = first.data[valid].astype(int), first["time"].data[valid]
+        labels = bins[np.searchsorted(starts, np.arange(times.size), side="right") - 1]
+        return xr.DataArray(labels, coords={"time": times}, dims=["time"], name="bin"), first["time"].data
+
     @property
     def base_ref(self):
         """
@@ -1041,13 +1968,19 @@ class DayOfYear(GroupReduce):
     groupby = "dayofyear"
 
 
-class DayOfYearWindow(Algorithm):
+class DayOfYearWindow(IncrementalMixin, Algorithm):
     """
     This applies a function over a moving window around day-of-year in the requested coordinates.
     It includes the ability to rescale the input/outputs. Note if, the input coordinates include multiple years, the
     moving window will include all of the data inside the day-of-year window.
 
-    Users need to implement the 'function' method.
+    Users need to implement the 'function' method, and may implement the 'vectorized_function' method to process many
+    cells at once. Statistics that only depend on the count, mean, and central moments of the windowed data may
+    implement the 'running_function' method instead, which is computed from running sums over the days of the year
+    (see 'sliding_window'), so the cost does not grow with the window size.
+
+    In incremental mode (see :class:`IncrementalMixin`), the outputs of the input nodes are cached for each time chunk,
+    so that only new time chunks are evaluated when the time axis is extended.
 
     Attributes
     -----------
@@ -1070,6 +2003,15 @@ class DayOfYearWindow(Algorithm):
         If None and scale_max/scale_min are not defined, the data is not scaled in any way.
     rescale: bool, optional
         Rescales the output data after being scaled from scale_float or scale_min/max
+    cell_block_size: int, optional
+        Default is 4096. Number of cells (non-time coordinates) that are gathered and processed together.
+    multithreading: bool, optional
+        Default is settings["MULTITHREADING"]. Process blocks of cells concurrently.
+    sliding_window: bool, optional
+        Default is True. Use 'running_function' with running sums, if implemented. Otherwise, the windowed data is
+        gathered for each day-of-year and 'vectorized_function' or 'function' is applied.
+    running_order: int
+        Highest central moment passed to 'running_function'. Default is 2.
     """
 
     source = tl.Instance(podpac.Node).tag(attr=True)
@@ -1078,6 +2020,22 @@ class DayOfYearWindow(Algorithm):
     scale_min = tl.Instance(podpac.Node, default_value=None, allow_none=True).tag(attr=True)
     scale_float = tl.List(default_value=None, allow_none=True).tag(attr=True)
     rescale = tl.Bool(False).tag(attr=True)
+    cell_block_size = tl.Int(4096)
+    multithreading = tl.Bool(False)
+    sliding_window = tl.Bool(True)
+    running_order = 2
+
+    @tl.default("multithreading")
+    def _default_multithreading(self):
+        return settings["MULTITHREADING"]
+
+    def _eval_inputs(self, nodes, coordinates, outputs=None, _selector=None):
+        if not self._incremental(coordinates):
+            return super(DayOfYearWindow, self)._eval_inputs(nodes, coordinates, outputs=outputs, _selector=_selector)
+        return {
+            key: self._eval_incremental(node, "incremental_%s" % key, coordinates, _selector)
+            for key, node in nodes.items()
+        }
 
     def algorithm(self, inputs, coordinates):
         win = self.window // 2
@@ -1117,67 +2075,166 @@ class DayOfYearWindow(Algorithm):
         if np.all(np.isnan(source)):
             return output
 
-        # convert source time coords to day-of-year as well
-        sdoy = source.time.dt.dayofyear
-
-        # loop over each day of year and compute window
-        for i, doy in enumerate(dsdoy):
-            _log.debug("Working on doy {doy} ({i}/{ld})".format(doy=doy, i=i + 1, ld=len(dsdoy)))
-
-            # If either the start or end runs over the year, we need to do an OR on the bool index
-            # ----->s....<=e------   .in -out
-            # ..<=e----------->s..
-            do_or = False
+        # gather the source into a dense (cells x time) array
+        cell_dims = [dim for dim in source.dims if dim != "time"]
+        x = source.transpose(*(cell_dims + ["time"])).data.reshape(-1, source.time.size)
 
-            start = doy - win
-            if start < 1:
-                start += 365
-                do_or = True
+        outputs = [None] if self.outputs is None else self.outputs
+        result = np.full((x.shape[0], len(dsdoy), len(outputs)), np.nan)
 
-            end = doy + win
-            if end > 365:
-                end -= 365
-                do_or = True
+        blocks = [slice(i, i + self.cell_block_size) for i in range(0, x.shape[0], self.cell_block_size)]
+        sdoy = source.time.dt.dayofyear.data
+        if self._running:
+            f = lambda block: self._apply_running(x[block], sdoy, dsdoy, win, result[block])
+        else:
+            # boolean day-of-year window for each output day (rows) over the source times (columns)
+            masks = _doy_window_masks(dsdoy, sdoy, win)
+            f = lambda block: self._apply_window(x[block], masks, result[block])
+
+        if self.multithreading:
+            n_threads = thread_manager.request_n_threads(len(blocks))
+            if n_threads == 1:
+                thread_manager.release_n_threads(n_threads)
+        else:
+            n_threads = 0
 
-            if do_or:
-                I = (sdoy >= start) | (sdoy <= end)
-            else:
-                I = (sdoy >= start) & (sdoy <= end)
-
-            # Scipy's beta function doesn's support multi-dimensional arrays, so we have to loop over lat/lon/alt
-            lat_f = lon_f = alt_f = [None]
-            dims = ["lat", "lon", "alt"]
-            if "lat" in source.dims:
-                lat_f = source["lat"].data
-            if "lon" in source.dims:
-                lon_f = source["lon"].data
-            if "alt" in source.dims:
-                alt_f = source["alt"].data
-
-            for alt in alt_f:
-                for lat in lat_f:
-                    for lon in lon_f:
-                        # _log.debug(f'lat, lon, alt = {lat}, {lon}, {alt})
-                        loc_dict = {k: v for k, v in zip(dims, [lat, lon, alt]) if v is not None}
-
-                        data = source.sel(time=I, **loc_dict).dropna("time").data
-                        if np.all(np.isnan(data)):
-                            continue
-
-                        # Fit function to the particular point
-                        output.loc[loc_dict][{"time": i}] = self.function(data, output.loc[loc_dict][{"time": i}])
+        if self.multithreading and n_threads > 1:
+            pool = thread_manager.get_thread_pool(processes=n_threads)
+            pool.map(f, blocks)
+            pool.close()
+            thread_manager.release_n_threads(n_threads)
+        else:
+            for block in blocks:
+                f(block)
+
+        # scatter the results into the output
+        shape = [source[dim].size for dim in cell_dims] + [len(dsdoy)]
+        dims = cell_dims + ["time"]
+        if self.outputs is None:
+            result = xr.DataArray(result.reshape(shape), dims=dims)
+        else:
+            result = xr.DataArray(result.reshape(shape + [len(outputs)]), dims=dims + ["output"])
+        output.data[:] = result.broadcast_like(output).transpose(*output.dims).data
 
         # Rescale the outputs
         if self.rescale:
             output = self.rescale_outputs(output, scale_max, scale_min)
         return output
 
+    def _apply_window(self, x, masks, result):
+        """Apply the function to each day-of-year window for a block of cells, filling result (cells, doy, outputs)"""
+
+        for i, I in enumerate(masks):
+            _log.debug("Working on doy {i}/{ld}".format(i=i + 1, ld=len(masks)))
+
+            data = x[:, I]
+            valid = np.isfinite(data).any(axis=1)
+            if not valid.any():
+                continue
+
+            if self._vectorized:
+                r = np.asarray(self.vectorized_function(data[valid]), dtype=float)
+                result[valid, i] = r.reshape(r.shape[0], -1)
+                continue
+
+            # Fit function to each particular point
+            for j in np.where(valid)[0]:
+                d = data[j][np.isfinite(data[j])]
+                result[j, i] = np.asarray(self.function(d, self._cell_output()), dtype=float).reshape(-1)
+
+    def _apply_running(self, x, sdoy, doys, win, result):
+        """Apply the running function to each day-of-year window for a block of cells, using running sums"""
+
+        # shift by the mean of each cell, for numerical stability
+        finite = np.isfinite(x)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            shift = np.nan_to_num(np.nanmean(x, axis=1))
+        y = np.where(finite, x - shift[:, None], 0)
+
+        # power sums for each source day-of-year (over all years), indexed by day-of-year 0-366
+        order = np.argsort(sdoy, kind="stable")
+        days, index = np.unique(sdoy[order], return_index=True)
+        sums = np.zeros((self.running_order + 1, x.shape[0], 367))
+        sums[0][:, days] = np.add.reduceat(finite[:, order], index, axis=1)
+        for k in range(1, self.running_order + 1):
+            sums[k][:, days] = np.add.reduceat(y[:, order] ** k, index, axis=1)
+
+        # running sums over the days of the year, so that each window is the difference of two running sums
+        sums = np.cumsum(sums, axis=-1)
+        start, end, do_or = _doy_window_bounds(doys, win)
+        window_sums = sums[..., end] - sums[..., start - 1]
+        window_sums[..., do_or] += sums[..., 366:367]
+        window_sums[..., do_or & (start <= end + 1)] = sums[..., 366:367]  # the window covers the whole year
+
+        # count, mean, and central moment sums
+        S = window_sums
+        N = S[0]
+        valid = N > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            m = np.where(valid, S[1] / N, np.nan)
+        moments = [N, shift[:, None] + m]
+        for k in range(2, self.running_order + 1):
+            moments.append(sum(scipy.special.comb(k, j) * S[j] * (-m) ** (k - j) for j in range(k + 1)))
+
+        r = np.asarray(self.running_function(tuple(moments)), dtype=float)
+        r = r.reshape(r.shape[:2] + (-1,))
+        result[valid] = r[valid]
+
+    def _cell_output(self):
+        if self.outputs is None:
+            return xr.DataArray(np.nan)
+        return xr.DataArray(np.full(len(self.outputs), np.nan), dims=["output"], coords={"output": self.outputs})
+
+    @property
+    def _vectorized(self):
+        return type(self).vectorized_function is not DayOfYearWindow.vectorized_function
+
+    @property
+    def _running(self):
+        return self.sliding_window and type(self).running_function is not DayOfYearWindow.running_function
+
     def function(self, data, output):
         raise NotImplementedError(
             "Child classes need to implement this function. It is applied over the data and needs"
             " to populate the output."
         )
 
+    def vectorized_function(self, data):
+        """
+        Optional vectorized version of `function`, applied to the windowed data of many cells at once.
+
+        Parameters
+        ----------
+        data : np.ndarray
+            Windowed data with shape (cells, samples). Missing samples are nan, and each cell has at least one finite
+            sample.
+
+        Returns
+        -------
+        np.ndarray
+            Function result with shape (cells,) or (cells, outputs).
+        """
+        raise NotImplementedError
+
+    def running_function(self, moments):
+        """
+        Optional version of `function` computed from the count, mean, and central moments of the windowed data.
+
+        Parameters
+        ----------
+        moments : tuple
+            (N, M1, M2, ..., Mk) for k = `running_order`, where N is the number of finite samples in each window, M1 is
+            the mean, and Mi is the sum of the i-th power of the deviations from the mean. Each has shape (cells, doys).
+            Windows without any finite samples are ignored.
+
+        Returns
+        -------
+        np.ndarray
+            Function result with shape (cells, doys) or (cells, doys, outputs).
+        """
+        raise NotImplementedError
+
     def rescale_outputs(self, output, scale_max, scale_min):
         output = (output * (scale_max - scale_min)) + scale_min
         return output
@@ -9,12 +9,21 @@ import xarray as xr
 
 import podpac
 from podpac.core.algorithm.utility import Arange, SinCoords
+from podpac.core.data.array_source import Array
 from podpac.core.algorithm.generic import GenericInputs, Arithmetic, Generic, Mask, Combine
 
 if sys.version_info.major == 2:
     from podpac.core.algorithm.generic import PermissionError
 
 
+class CountingArray(Array):
+    n_reads = 0
+
+    def get_data(self, coordinates, coordinates_index):
+        self.n_reads += 1
+        return super(CountingArray, self).get_data(coordinates, coordinates_index)
+
+
 class TestGenericInputs(object):
     def test_init(self):
         node = GenericInputs(a=Arange(), b=SinCoords())
@@ -75,6 +84,90 @@ class TestArithmetic(object):
             with pytest.raises(PermissionError):
                 node.eval(coords)
 
+    def test_evaluate_output(self):
+        coords = podpac.Coordinates([podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        a = Array(source=np.ones(coords.shape), coordinates=coords)
+        b = Array(source=np.ones(coords.shape) * 3, coordinates=coords)
+
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+            for fuse in [True, False]:
+                node = Arithmetic(A=a, B=b, eqn="A - B", fuse=fuse)
+                output = node.create_output_array(coords)
+                o = node.eval(coords, output=output)
+                np.testing.assert_array_equal(output, -2)
+                assert np.shares_memory(o.data, output.data)
+
+    def test_fused(self):
+        coords = podpac.Coordinates([podpac.clinspace(0, 1, 40), podpac.clinspace(0, 1, 30)], dims=["lat", "lon"])
+        a = Array(source=np.random.random(coords.shape), coordinates=coords)
+        b = Array(source=np.random.random(coords.shape), coordinates=coords)
+
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+
+            def build(fuse):
+                c = Arithmetic(A=a, B=b, eqn="A * B + {offset}", params={"offset": 1}, fuse=fuse)
+                return Arithmetic(C=c, A=a, eqn="sqrt(C) - A", fuse=fuse)
+
+            node = build(True)
+            terms = []
+            assert node._expression(terms) == "sqrt((__t0 * __t1 + 1)) - __t0"
+            assert terms == [a, b]
+
+            expected = build(False).eval(coords)
+            np.testing.assert_allclose(expected, np.sqrt(a.source * b.source + 1) - a.source)
+            np.testing.assert_array_equal(node.eval(coords), expected)
+
+            # chunked
+            podpac.settings["CHUNK_SIZE"] = 100
+            output = node.eval(coords)
+            assert output.dims == expected.dims
+            np.testing.assert_array_equal(output, expected)
+
+    def test_fused_broadcast(self):
+        coords = podpac.Coordinates(
+            [podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3), ["2018-01-01", "2018-01-02"]],
+            dims=["lat", "lon", "time"],
+        )
+        a = CountingArray(source=np.random.random(coords.shape), coordinates=coords)
+        b = CountingArray(source=np.random.random(coords.shape[:2]), coordinates=coords.drop("time"))
+
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+            expected = Arithmetic(A=a, B=b, eqn="A - B", fuse=False).eval(coords)
+            np.testing.assert_allclose(expected, a.source - b.source[:, :, None])
+
+            # each input is evaluated once
+            a.n_reads = b.n_reads = 0
+            output = Arithmetic(A=a, B=b, eqn="A - B").eval(coords)
+            assert output.dims == expected.dims
+            np.testing.assert_array_equal(output, expected)
+            assert a.n_reads == 1
+            assert b.n_reads == 1
+
+            # chunked, each input is evaluated once per chunk
+            podpac.settings["CHUNK_SIZE"] = 12
+            a.n_reads = b.n_reads = 0
+            output = Arithmetic(A=a, B=b, eqn="A - B").eval(coords)
+            np.testing.assert_array_equal(output, expected)
+            assert a.n_reads == 2
+            assert b.n_reads == 2
+
+    def test_not_fused(self):
+        coords = podpac.Coordinates([podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        a = Array(source=np.random.random(coords.shape), coordinates=coords)
+
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+
+            c = Arithmetic(A=a, eqn="A * 3", fuse=False)
+            node = Arithmetic(C=c, eqn="2 * C")
+            terms = []
+            assert node._expression(terms) == "2 * __t0"
+            assert terms == [c]
+            np.testing.assert_allclose(node.eval(coords), 6 * a.source)
+
     def test_missing_equation(self):
         sine_node = SinCoords()
         with pytest.raises(ValueError), warnings.catch_warnings():
@@ -195,6 +288,33 @@ class TestMask(object):
 
         np.testing.assert_allclose(output, a)
 
+    def test_fused(self):
+        coords = podpac.Coordinates([podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        a = Array(source=np.random.random(coords.shape), coordinates=coords)
+
+        with podpac.settings:
+            podpac.settings.set_unsafe_eval(True)
+            mask = Arithmetic(A=a, eqn="A > 0.5")
+
+            node = Mask(source=a, mask=mask, masked_val=-1)
+            terms = []
+            assert node._expression(terms) == "where((__t0 > 0.5) == __t1, __t2, __t0)"
+            assert terms == [a, 1.0, -1.0]
+
+            expected = a.source.copy()
+            expected[a.source > 0.5] = -1
+            np.testing.assert_array_equal(node.eval(coords), expected)
+            np.testing.assert_array_equal(Mask(source=a, mask=mask, masked_val=-1, fuse=False).eval(coords), expected)
+
+    def test_fused_attrs(self):
+        coords = podpac.Coordinates([podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
+        a = Array(source=np.random.random(coords.shape), coordinates=coords, units="m")
+        mask = Array(source=(np.random.random(coords.shape) > 0.5).astype(float), coordinates=coords)
+
+        for fuse in [True, False]:
+            output = Mask(source=a, mask=mask, fuse=fuse).eval(coords)
+            assert output.attrs["units"] == podpac.core.units.ureg.m
+
     def test_in_place(self):
         coords = podpac.Coordinates([podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 3)], dims=["lat", "lon"])
         sine_node = Arange()
@@ -10,7 +10,7 @@ import podpac
 from podpac import Coordinates, clinspace, crange
 from podpac.algorithm import Arange
 from podpac.data import Array
-from podpac.core.algorithm.signal import Convolution
+from podpac.core.algorithm.signal import Convolution, _separable_factors
 
 
 class TestConvolution(object):
@@ -99,6 +99,82 @@ class TestConvolution(object):
 
         o = node.eval(coords[8:12, 7:13])
 
+        # nan propagates to every output that the kernel overlaps (same as direct convolution)
+        expected = np.ones(o.shape) * 4
+        expected[2, 2:5] = np.nan
+        assert_array_equal(o.data, expected)
+
+    def test_eval_nan_normalize(self):
+        lat = clinspace(45, 66, 30, name="lat")
+        lon = clinspace(-80, 70, 40, name="lon")
+        coords = Coordinates([lat, lon])
+
+        data = np.random.random(coords.shape)
+        data[10, 10] = np.nan
+        data[20:, 20:] = np.nan
+        source = Array(source=data, coordinates=coords)
+        node = Convolution(source=source, kernel=[[1, 2, 1]], kernel_dims=["lat", "lon"], nan_policy="normalize")
+        o = node.eval(coords)
+
+        # the kernel is rescaled by the valid fraction of its weight
+        np.testing.assert_allclose(o.data[5, 5], data[5, 4] + 2 * data[5, 5] + data[5, 6])
+        np.testing.assert_allclose(o.data[10, 9], (data[10, 8] * 1 + data[10, 9] * 2) * 4 / 3)
+        np.testing.assert_allclose(o.data[10, 10], (data[10, 9] + data[10, 11]) * 4 / 2)
+        np.testing.assert_allclose(o.data[25, 20], data[25, 19] * 4)
+        assert np.isnan(o.data[25, 25])
+        assert not np.isnan(o.data[25, 20])
+
+    def test_eval_tiled(self):
+        lat = clinspace(45, 66, 30, name="lat")
+        lon = clinspace(-80, 70, 40, name="lon")
+        coords = Coordinates([lat, lon])
+
+        data = np.random.random(coords.shape)
+        data[10, 10] = np.nan
+        source = Array(source=data, coordinates=coords)
+
+        for nan_policy in ["propagate", "normalize"]:
+            node = Convolution(
+                source=source, kernel_type="gaussian, 5, 1", kernel_dims=["lat", "lon"], nan_policy=nan_policy
+            )
+            expected = node.eval(coords[4:-4, 4:-4])
+            assert node._get_tile_shape(coords[4:-4, 4:-4]) is None
+
+            node = Convolution(
+                source=source,
+                kernel_type="gaussian, 5, 1",
+                kernel_dims=["lat", "lon"],
+                nan_policy=nan_policy,
+                tile_size=50,
+                multithreading=False,
+            )
+            assert node._get_tile_shape(coords[4:-4, 4:-4]) == [6, 8]
+            o = node.eval(coords[4:-4, 4:-4])
+            np.testing.assert_allclose(o.data, expected.data, rtol=1e-12, atol=1e-14)
+
+            with podpac.settings:
+                podpac.settings["MULTITHREADING"] = True
+                podpac.settings["N_THREADS"] = 4
+                node = Convolution(
+                    source=source,
+                    kernel_type="gaussian, 5, 1",
+                    kernel_dims=["lat", "lon"],
+                    nan_policy=nan_policy,
+                    tile_size=50,
+                )
+                o = node.eval(coords[4:-4, 4:-4])
+                np.testing.assert_allclose(o.data, expected.data, rtol=1e-12, atol=1e-14)
+
+    def test_separable_factors(self):
+        kernel = Convolution._make_kernel("gaussian, 5, 1", 3)
+        factors = _separable_factors(kernel)
+        assert len(factors) == 3
+        np.testing.assert_allclose(np.multiply.outer(np.multiply.outer(*factors[:2]), factors[2]), kernel)
+
+        assert _separable_factors(np.array([1.0, 2.0, 1.0])) is None
+        assert _separable_factors(np.array([[1.0, 2.0], [3.0, 4.0]])) is None
+        assert _separable_factors(np.zeros((3, 3))) is None
+
     def test_eval_with_output_argument(self):
         lat = clinspace(45, 66, 30, name="lat")
         lon = clinspace(-80, 70, 40, name="lon")
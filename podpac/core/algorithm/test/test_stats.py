@@ -13,7 +13,7 @@ from podpac.core.algorithm.stats import Reduce
 from podpac.core.algorithm.stats import Min, Max, Sum, Count, Mean, Variance, Skew, Kurtosis, StandardDeviation
 from podpac.core.algorithm.generic import Arithmetic
 from podpac.core.algorithm.stats import Median, Percentile
-from podpac.core.algorithm.stats import GroupReduce, DayOfYear, DayOfYearWindow
+from podpac.core.algorithm.stats import GroupReduce, ResampleReduce, DayOfYear, DayOfYearWindow
 
 
 def setup_module():
@@ -35,6 +35,43 @@ def setup_module():
     bdata = 2 * data
 
 
+class CountingArray(Array):
+    """Array source that counts its evaluations"""
+
+    n_evals = 0
+
+    def eval(self, coordinates, **kwargs):
+        self.n_evals += 1
+        return super(CountingArray, self).eval(coordinates, **kwargs)
+
+
+def incremental_source():
+    c = podpac.Coordinates(
+        [[0, 1], [0, 1, 2], podpac.crange("2018-01-01", "2018-03-31", "1,D")], dims=["lat", "lon", "time"]
+    )
+    a = np.random.random(c.shape)
+    a[0, 0, 5] = np.nan
+    a[1, 1, :40] = np.nan
+    return c, CountingArray(source=a, coordinates=c, cache_output=False)
+
+
+def check_incremental(node, expected_node, c):
+    """Evaluate the node incrementally, extending the time axis by one day, and compare with the expected node"""
+
+    with podpac.settings:
+        podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+
+        # January and February
+        output = node.eval(c[:, :, :45])
+        np.testing.assert_allclose(output, expected_node.eval(c[:, :, :45]), equal_nan=True)
+
+        # only the last (February) chunk is evaluated again
+        n = node.source.n_evals
+        output = node.eval(c[:, :, :46])
+        assert node.source.n_evals == n + 1
+        np.testing.assert_allclose(output, expected_node.eval(c[:, :, :46]), equal_nan=True)
+
+
 class TestReduce(object):
     """Tests the Reduce class"""
 
@@ -47,6 +84,62 @@ class TestReduce(object):
             podpac.settings["CHUNK_SIZE"] = "auto"
             node.eval(coords)
 
+            # the memory budget is shared by the chunks in flight
+            podpac.settings["N_THREADS"] = 4
+            assert node.chunk_size > 0
+            assert Min(source=source, multithreading=True).chunk_size < node.chunk_size
+
+    def test_chunk_shape_storage_aligned(self):
+        class ChunkedArray(Array):
+            @property
+            def storage_chunks(self):
+                return {"lat": 4, "lon": 4, "time": 3}
+
+        chunked_source = ChunkedArray(source=source.source, coordinates=coords)
+
+        with podpac.settings:
+            podpac.settings["CHUNK_SIZE"] = 500
+            node = Mean(source=chunked_source, dims="time")
+            node._dims = ["time"]
+            assert node._get_chunk_shape(coords) == [10, 10, 3]
+
+            podpac.settings["CHUNK_SIZE"] = 30
+            node = Median(source=chunked_source, dims="time")
+            node._dims = ["time"]
+            assert node._get_chunk_shape(coords) == [1, 2, 10]
+
+            # requested at half the source resolution
+            podpac.settings["CHUNK_SIZE"] = 15
+            c = podpac.Coordinates([coords["lat"][::2], coords["lon"][::2], coords["time"][::2]])
+            node = Median(source=chunked_source, dims="time")
+            node._dims = ["time"]
+            assert node._get_chunk_shape(c) == [1, 2, 5]
+
+    def test_chunks_storage_grid(self):
+        class ChunkedArray(Array):
+            chunks = tl.List()
+
+            @property
+            def storage_chunks(self):
+                return {"lat": 4, "lon": 10, "time": 10}
+
+            def eval(self, coordinates, **kwargs):
+                self.chunks.append(coordinates["lat"].coordinates)
+                return super(ChunkedArray, self).eval(coordinates, **kwargs)
+
+        chunked_source = ChunkedArray(source=source.source, coordinates=coords)
+
+        # the request starts in the middle of the first storage chunk
+        c = coords[1:]
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 400
+            node = Mean(source=chunked_source, dims="lat")
+            output = node.eval(c)
+
+        assert [len(lat) for lat in chunked_source.chunks] == [3, 4, 2]
+        np.testing.assert_allclose(output, Mean(source=source, dims="lat").eval(c))
+
     def test_chunked_fallback(self):
         with podpac.settings:
             podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
@@ -133,6 +226,21 @@ class BaseTests(object):
             # xr.testing.assert_allclose(output, self.expected_time)
             np.testing.assert_allclose(output.data, self.expected_time.data)
 
+    def test_chunked_multithreaded(self):
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 200
+            podpac.settings["MULTITHREADING"] = True
+            podpac.settings["N_THREADS"] = 4
+
+            node = self.NodeClass(source=source, dims=coords.dims, max_in_flight=3)
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, self.expected_full.data)
+
+            node = self.NodeClass(source=source, dims=["lat", "lon"], max_in_flight=3)
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, self.expected_latlon.data)
+
     def test_multiple_outputs(self):
         with podpac.settings:
             podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
@@ -195,12 +303,51 @@ class TestMean(BaseTests):
         cls.expected_time = data.mean(dim="time")
 
     def test_chunk_sizes(self):
-        for n in [20, 21, 1000, 1001]:
-            podpac.settings["CHUNK_SIZE"] = n
-            node = self.NodeClass(source=source, dims=coords.dims)
+        with podpac.settings:
+            for n in [20, 21, 1000, 1001]:
+                podpac.settings["CHUNK_SIZE"] = n
+                node = self.NodeClass(source=source, dims=coords.dims)
+                output = node.eval(coords)
+                # xr.testing.assert_allclose(output, self.expected_full)
+                np.testing.assert_allclose(output.data, self.expected_full.data)
+
+    def test_chunked_buffers(self):
+        from podpac.core.managers.arena import buffer_arena
+
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 200
+            buffer_arena.clear()
+
+            # the source of each chunk after the first is evaluated into a reused array
+            node = self.NodeClass(source=source, dims=["lat", "lon"])
             output = node.eval(coords)
-            # xr.testing.assert_allclose(output, self.expected_full)
-            np.testing.assert_allclose(output.data, self.expected_full.data)
+            np.testing.assert_allclose(output.data, self.expected_latlon.data)
+            assert buffer_arena.nbytes > 0
+
+            node = self.NodeClass(source=multisource, dims=["lat", "lon"])
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.sel(output="b").data, self.expected_latlon_b.data)
+            buffer_arena.clear()
+
+    def test_incremental(self):
+        c, node = incremental_source()
+        check_incremental(
+            Mean(source=node, dims="time", incremental=True, cache_ctrl=["ram"]), Mean(source=node, dims="time"), c
+        )
+        check_incremental(
+            Mean(source=node, dims=["lat"], incremental=True, cache_ctrl=["ram"]), Mean(source=node, dims=["lat"]), c
+        )
+
+    def test_chunked_process_backend(self):
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 200
+            podpac.settings["MULTITHREADING"] = True
+            podpac.settings["N_THREADS"] = 2
+            node = self.NodeClass(source=source, dims="time", backend="process")
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, self.expected_time.data)
 
 
 class TestVariance(BaseTests):
@@ -255,6 +402,35 @@ class TestMedian(BaseTests):
         cls.expected_latlon_b = bdata.median(dim=["lat", "lon"])
         cls.expected_time = data.median(dim="time")
 
+    def test_streaming(self):
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 200
+
+            # exact when each cell has fewer values than centroids
+            node = Median(source=source, dims="time", streaming=True)
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, self.expected_time.data)
+
+            node = Percentile(source=source, dims=["lat", "lon"], percentile=90, streaming=True, quantile_error=0.001)
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, np.nanpercentile(data, 90, axis=(0, 1)))
+
+            # approximate rank
+            node = Median(source=source, dims=coords.dims, streaming=True, quantile_error=0.05)
+            output = node.eval(coords)
+            assert abs(np.nanmean(data.data < output.data) - 0.5) < 0.05
+
+    def test_streaming_multithreaded(self):
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = 200
+            podpac.settings["MULTITHREADING"] = True
+            podpac.settings["N_THREADS"] = 4
+            node = Median(source=source, dims="time", streaming=True)
+            output = node.eval(coords)
+            np.testing.assert_allclose(output.data, self.expected_time.data)
+
 
 @pytest.mark.skip("TODO")
 class TestPercentile(BaseTests):
@@ -265,11 +441,90 @@ class TestPercentile(BaseTests):
 
 
 class TestGroupReduce(object):
-    pass
+    @pytest.mark.parametrize("reduce_fn", ["all", "any", "count", "max", "mean", "median", "min", "prod", "std", "sum"])
+    @pytest.mark.parametrize("chunk_size", [None, 100])
+    def test_reduce_fn(self, reduce_fn, chunk_size):
+        c = podpac.Coordinates(
+            [[0, 1], [0, 1, 2], podpac.crange("2018-01-01", "2019-01-31", "1,D")], dims=["lat", "lon", "time"]
+        )
+        a = np.random.random(c.shape)
+        a[0, 0, :40] = np.nan
+        a[1, 1, ::3] = 0
+        node = Array(source=a, coordinates=c)
+        x = xr.DataArray(node.eval(c))
+        expected = getattr(x.groupby("time.dayofyear"), reduce_fn)("time").rename({"dayofyear": "time"})
+
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = chunk_size
+            output = GroupReduce(source=node, groupby="dayofyear", reduce_fn=reduce_fn).eval(c)
+        np.testing.assert_array_equal(output["time"], expected["time"])
+        np.testing.assert_allclose(output.transpose(*expected.dims), expected, equal_nan=True)
+
+    def test_custom(self):
+        c, node = incremental_source()
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            output = GroupReduce(
+                source=node, groupby="month", reduce_fn="custom", custom_reduce_fn=lambda x: x.max("time")
+            ).eval(c)
+            expected = GroupReduce(source=node, groupby="month", reduce_fn="max").eval(c)
+        np.testing.assert_allclose(output, expected)
+
+    @pytest.mark.parametrize("reduce_fn", ["mean", "std", "max", "count", "median"])
+    def test_incremental(self, reduce_fn):
+        c, node = incremental_source()
+        check_incremental(
+            GroupReduce(source=node, groupby="month", reduce_fn=reduce_fn, incremental=True, cache_ctrl=["ram"]),
+            GroupReduce(source=node, groupby="month", reduce_fn=reduce_fn),
+            c,
+        )
 
 
 class TestResampleReduce(object):
-    pass
+    @pytest.mark.parametrize("resample", ["7D", "1M"])
+    @pytest.mark.parametrize("reduce_fn", ["count", "mean", "median", "var"])
+    @pytest.mark.parametrize("chunk_size", [None, 100])
+    def test_reduce_fn(self, resample, reduce_fn, chunk_size):
+        c, node = incremental_source()
+        c = c[:, :, 3:]
+        x = xr.DataArray(node.eval(c))
+        expected = getattr(x.resample(time=resample), reduce_fn)()
+
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            podpac.settings["CHUNK_SIZE"] = chunk_size
+            output = ResampleReduce(source=node, resample=resample, reduce_fn=reduce_fn).eval(c)
+        np.testing.assert_array_equal(output["time"], expected["time"])
+        np.testing.assert_allclose(output.transpose(*expected.dims), expected, equal_nan=True)
+
+    @pytest.mark.parametrize("resample", ["7D", "1M"])
+    @pytest.mark.parametrize("reduce_fn", ["sum", "var", "median"])
+    def test_incremental(self, resample, reduce_fn):
+        c, node = incremental_source()
+        check_incremental(
+            ResampleReduce(source=node, resample=resample, reduce_fn=reduce_fn, incremental=True, cache_ctrl=["ram"]),
+            ResampleReduce(source=node, resample=resample, reduce_fn=reduce_fn),
+            c,
+        )
+
+    @pytest.mark.parametrize("reduce_fn", ["mean", "std", "median"])
+    def test_units(self, reduce_fn):
+        c, _ = incremental_source()
+        node = Array(source=np.random.random(c.shape), coordinates=c, units="m")
+
+        with podpac.settings:
+            podpac.settings["CACHE_NODE_OUTPUT_DEFAULT"] = False
+            output = ResampleReduce(source=node, resample="1M", reduce_fn=reduce_fn).eval(c)
+            assert output.attrs["units"] == podpac.core.units.ureg.m
+
+            podpac.settings["CHUNK_SIZE"] = 100
+            output = ResampleReduce(source=node, resample="1M", reduce_fn=reduce_fn).eval(c)
+            assert output.attrs["units"] == podpac.core.units.ureg.m
+
+            podpac.settings["CHUNK_SIZE"] = None
+            node = ResampleReduce(source=node, resample="1M", reduce_fn=reduce_fn, incremental=True, cache_ctrl=["ram"])
+            assert node.eval(c).attrs["units"] == podpac.core.units.ureg.m
 
 
 class TestDayOfYear(object):
@@ -292,6 +547,33 @@ class FM(DayOfYearWindow):
         return np.mean(data)
 
 
+class FV(DayOfYearWindow):
+    cache_output = tl.Bool(False)
+    force_eval = tl.Bool(True)
+
+    def vectorized_function(self, data):
+        return np.nanmean(data, axis=1)
+
+
+class FR(DayOfYearWindow):
+    cache_output = tl.Bool(False)
+    force_eval = tl.Bool(True)
+
+    def running_function(self, moments):
+        N, M1, M2 = moments
+        return np.stack([M1, M2 / N], axis=-1)
+
+    @property
+    def outputs(self):
+        return ["mean", "var"]
+
+
+class FMV(FR):
+    def function(self, data, output):
+        output[:] = [np.mean(data), np.var(data)]
+        return output
+
+
 class TestDayOfYearWindow(object):
     def test_doy_window1(self):
         coords = podpac.coordinates.concat(
@@ -367,3 +649,61 @@ class TestDayOfYearWindow(object):
             o_s = nodedoywindow_s.eval(coords)
 
             np.testing.assert_array_almost_equal([0.5] * o_s.size, o_s)
+
+    def test_doy_window2_vectorized(self):
+        coords = podpac.coordinates.concat(
+            [
+                podpac.Coordinates([podpac.crange("1999-12-29", "2000-01-03", "1,D", "time")]),
+                podpac.Coordinates([podpac.crange("2001-12-30", "2002-01-02", "1,D", "time")]),
+            ]
+        )
+
+        node = Arange()
+        o = FM(source=node, window=2).eval(coords)
+        o_v = FV(source=node, window=2).eval(coords)
+        np.testing.assert_array_almost_equal(o, o_v)
+
+    def test_doy_window_cell_blocks(self):
+        c = podpac.Coordinates(
+            [podpac.clinspace(0, 1, 4), podpac.clinspace(0, 1, 5), podpac.crange("2000-12-25", "2001-01-05", "1,D")],
+            dims=["lat", "lon", "time"],
+        )
+        a = np.random.random(c.shape)
+        a[0, 0, :] = np.nan
+        a[1, 1, ::2] = np.nan
+        node = Array(source=a, coordinates=c)
+
+        expected = FM(source=node, window=3).eval(c)
+        assert np.isnan(expected[0, 0]).all()
+        assert np.isfinite(expected[1:]).all()
+
+        with podpac.settings:
+            podpac.settings["N_THREADS"] = 4
+            o = FM(source=node, window=3, cell_block_size=3, multithreading=True).eval(c)
+            np.testing.assert_array_almost_equal(o, expected)
+
+            o = FV(source=node, window=3, cell_block_size=3, multithreading=True).eval(c)
+            np.testing.assert_array_almost_equal(o, expected)
+
+    @pytest.mark.parametrize("window", [0, 3, 30, 400])
+    def test_doy_window_running(self, window):
+        c = podpac.Coordinates(
+            [podpac.clinspace(0, 1, 3), podpac.clinspace(0, 1, 2), podpac.crange("2003-12-01", "2005-02-01", "1,D")],
+            dims=["lat", "lon", "time"],
+        )
+        a = 100 + np.random.random(c.shape)
+        a[0, 0, :] = np.nan
+        a[1, 1, ::2] = np.nan
+        node = Array(source=a, coordinates=c)
+
+        expected = FMV(source=node, window=window, sliding_window=False).eval(c)
+        o = FR(source=node, window=window).eval(c)
+        np.testing.assert_allclose(o, expected, atol=1e-10)
+
+    def test_incremental(self):
+        c, node = incremental_source()
+        check_incremental(
+            FR(source=node, window=5, incremental=True, cache_ctrl=["ram"], force_eval=False),
+            FR(source=node, window=5),
+            c,
+        )
@@ -105,7 +105,7 @@ class FileCacheStore(CacheStore):
                 s = f.getvalue()
         elif isinstance(data, podpac.Coordinates):
             ext = "coords.json"
-            s = data.json.encode()
+            s = data.compact_json.encode()
         elif isinstance(data, podpac.Node):
             ext = "node.json"
             s = data.json.encode()
@@ -50,7 +50,7 @@ class RamCacheStore(CacheStore):
         super(CacheStore, self).__init__()
 
     def _get_full_key(self, node, key, coordinates):
-        return (node.json, key, coordinates.json if coordinates is not None else None)
+        return (node.json, key, coordinates.compact_json if coordinates is not None else None)
 
     @property
     def size(self):
@@ -187,7 +187,7 @@ class RamCacheStore(CacheStore):
         node_key = node.json
 
         if not isinstance(coordinates, CacheWildCard):
-            coordinates_key = coordinates.json if coordinates is not None else None
+            coordinates_key = coordinates.compact_json if coordinates is not None else None
 
         # loop through keys looking for matches
         rem_keys = []
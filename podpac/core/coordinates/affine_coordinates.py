@@ -134,32 +134,40 @@ class AffineCoordinates(StackedCoordinates):
         return True
 
     def _getsubset(self, index):
-        if isinstance(index, tuple) and isinstance(index[0], slice) and isinstance(index[1], slice):
-            lat = self["lat"].coordinates[index]
-            lon = self["lon"].coordinates[index]
-
-            # We don't have to check every point in lat/lon for the same step
-            # since the self.is_affine call did that already
-            dlati = (lat[-1, 0] - lat[0, 0]) / (lat.shape[0] - 1)
-            dlatj = (lat[0, -1] - lat[0, 0]) / (lat.shape[1] - 1)
-            dloni = (lon[-1, 0] - lon[0, 0]) / (lon.shape[0] - 1)
-            dlonj = (lon[0, -1] - lon[0, 0]) / (lon.shape[1] - 1)
-
-            # origin point
-            p0 = np.array([lat[0, 0], lon[0, 0]]) - np.array([[dlati, dlatj], [dloni, dlonj]]) @ np.ones(2) / 2
-
-            # This is defined as x ulc, x width, x height, y ulc, y width, y height
-            # x and y are defined by the CRS. Here we are assuming that it's always
-            # lon and lat == x and y
-            geotransform = [p0[1], dlonj, dloni, p0[0], dlatj, dlati]
-
-            # get shape from indexed coordinates
-            shape = lat.shape
-
-            return AffineCoordinates(geotransform=geotransform, shape=lat.shape)
-
-        else:
-            return super(AffineCoordinates, self)._getsubset(index).simplify()
+        if isinstance(index, slice):
+            index = index, slice(None)
+
+        if isinstance(index, (tuple, list)) and len(index) == 2 and all(isinstance(s, slice) for s in index):
+            # window, by index arithmetic: same rotation, new origin and (scaled) step
+            (i0, i1, di), (j0, j1, dj) = [s.indices(n) for s, n in zip(index, self.shape)]
+            I, J = np.arange(i0, i1, di), np.arange(j0, j1, dj)
+            if isinstance(index, tuple) and I.size > 0 and J.size > 0:
+                # the center of the first pixel of the window is the center of pixel (i0, j0)
+                translation = affine.Affine.translation(j0 + 0.5 - 0.5 * dj, i0 + 0.5 - 0.5 * di)
+                transform = self.affine * translation * affine.Affine.scale(dj, di)
+                return AffineCoordinates(geotransform=transform.to_gdal(), shape=(I.size, J.size))
+
+            lat, lon = np.broadcast_arrays(*self._values(I[:, np.newaxis], J[np.newaxis, :]))
+            coords = [ArrayCoordinates1d(lat, name="lat"), ArrayCoordinates1d(lon, name="lon")]
+            return StackedCoordinates(coords).simplify()
+
+        elif np.ndim(index) == 2 and np.shape(index) == self.shape and np.asarray(index).dtype == bool:
+            # points, only computing the selected coordinate values
+            lat, lon = self._values(*np.nonzero(index))
+            coords = [ArrayCoordinates1d(lat, name="lat"), ArrayCoordinates1d(lon, name="lon")]
+            return StackedCoordinates(coords).simplify()
+
+        elif (
+            isinstance(index, tuple)
+            and len(index) == 2
+            and all(np.ndim(I) == 1 and np.asarray(I).dtype.kind in "iu" for I in index)
+        ):
+            # points by (rows, columns), only computing the selected coordinate values
+            lat, lon = self._values(*index)
+            coords = [ArrayCoordinates1d(lat, name="lat"), ArrayCoordinates1d(lon, name="lon")]
+            return StackedCoordinates(coords).simplify()
+
+        return super(AffineCoordinates, self)._getsubset(index).simplify()
 
     # ------------------------------------------------------------------------------------------------------------------
     # Properties
@@ -177,6 +185,10 @@ class AffineCoordinates(StackedCoordinates):
     def ndim(self):
         return 2
 
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
     @property
     def affine(self):
         """:affine.Affine: affine transformation for computing the coordinates from indexing values."""
@@ -197,17 +209,22 @@ class AffineCoordinates(StackedCoordinates):
             origin = origin[::-1]
         return origin
 
+    @property
+    def bounds(self):
+        """:dict: Dictionary of (low, high) coordinates bounds in each dimension, from the corner pixels."""
+
+        lat, lon = self._values([[0], [self.shape[0] - 1]], [[0, self.shape[1] - 1]])
+        return {"lat": (np.min(lat), np.max(lat)), "lon": (np.min(lon), np.max(lon))}
+
     @property
     def coordinates(self):
         """:tuple: computed coordinate values for each dimension."""
 
-        I = np.arange(self.shape[1]) + 0.5
-        J = np.arange(self.shape[0]) + 0.5
-        x, y = self.affine * np.meshgrid(I, J)
+        lat, lon = self._values(np.arange(self.shape[0])[:, np.newaxis], np.arange(self.shape[1])[np.newaxis, :])
         if self.dims == ("lat", "lon"):
-            c = np.stack([y, x])
+            c = np.stack(np.broadcast_arrays(lat, lon))
         else:
-            c = np.stack([x, y])
+            c = np.stack(np.broadcast_arrays(lon, lat))
         return c.transpose(1, 2, 0)
 
     @property
@@ -236,6 +253,65 @@ class AffineCoordinates(StackedCoordinates):
         """
         return AffineCoordinates(self.geotransform, self.shape)
 
+    def astype(self, dtype):
+        # the affine coordinates values are computed, not stored
+        return self
+
+    def _set_name(self, value):
+        # the dims are fixed, check the name without computing the coordinates
+        if tuple(value.split("_")) != self.dims:
+            super(AffineCoordinates, self)._set_name(value)
+
+    def _values(self, I, J):
+        """lat and lon values of the pixel centers at the given row and column indices (broadcast together)."""
+
+        x, y = self.affine * (np.asarray(J) + 0.5, np.asarray(I) + 0.5)
+        return y, x
+
+    def _inside(self, I, J, bounds):
+        lat, lon = self._values(I, J)
+        inside = np.ones(np.shape(lat), dtype=bool)
+        for values, b in [(lat, bounds["lat"]), (lon, bounds["lon"])]:
+            inside &= (values >= b[0]) & (values <= b[1])
+        return inside
+
+    def _select_intervals(self, bounds):
+        """
+        Column index intervals of the pixels within the given bounds in each row, by inverse-affine index arithmetic.
+
+        Each bound is a linear constraint on the column index in a given row, so that the pixels within the bounds are
+        a single interval in each row. The interval ends are checked using the computed coordinate values.
+
+        Returns
+        -------
+        jlo, jhi : np.ndarray
+            First and last column index in each row, ``jlo > jhi`` for rows without any pixels within the bounds.
+        """
+
+        m, n = self.shape
+        a, b, c, d, e, f = self.affine[:6]
+        r = np.arange(m) + 0.5
+        lo = np.full(m, 0.0)
+        hi = np.full(m, n - 1.0)
+        for (lower, upper), k, base in [(bounds["lat"], d, r * e + f), (bounds["lon"], a, r * b + c)]:
+            if k == 0:
+                hi[(base < lower) | (base > upper)] = -1.0
+            else:
+                j0 = (lower - base) / k - 0.5
+                j1 = (upper - base) / k - 0.5
+                lo = np.maximum(lo, np.minimum(j0, j1))
+                hi = np.minimum(hi, np.maximum(j0, j1))
+
+        # the tolerance only adds candidates that are then checked
+        jlo = np.clip(np.ceil(lo - 1e-6), 0, n).astype(int)
+        jhi = np.clip(np.floor(hi + 1e-6), -1, n - 1).astype(int)
+        I = np.arange(m)
+        bad = (jlo <= jhi) & ~self._inside(I, jlo.clip(0, n - 1), bounds)
+        jlo[bad] += 1
+        bad = (jlo <= jhi) & ~self._inside(I, jhi.clip(0, n - 1), bounds)
+        jhi[bad] -= 1
+        return jlo, jhi
+
     def get_area_bounds(self, boundary):
         """Get coordinate area bounds, including boundary information, for each unstacked dimension.
 
@@ -252,7 +328,15 @@ class AffineCoordinates(StackedCoordinates):
 
         # TODO the boundary offsets need to be transformed
         warnings.warn("AffineCoordinates area_bounds are not yet correctly implemented.")
-        return super(AffineCoordinates, self).get_area_bounds(boundary)
+
+        if any(np.ndim(boundary.get(dim)) > 1 for dim in self.dims):
+            # boundary for each coordinate
+            return super(AffineCoordinates, self).get_area_bounds(boundary)
+
+        # the coordinates bounds are at the corner pixels
+        lat, lon = self._values([[0], [self.shape[0] - 1]], [[0, self.shape[1] - 1]])
+        corners = {"lat": lat.ravel(), "lon": lon.ravel()}
+        return {dim: ArrayCoordinates1d(corners[dim], name=dim).get_area_bounds(boundary.get(dim)) for dim in self.dims}
 
     def select(self, bounds, outer=False, return_index=False):
         """
@@ -273,49 +357,50 @@ class AffineCoordinates(StackedCoordinates):
         -------
         selection : :class:`StackedCoordinates`, :class:`AffineCoordinates`
             coordinates consisting of the selection in all dimensions.
-        selection_index : list
-            index for the selected coordinates, only if ``return_index`` is True.
+        selection_index : tuple
+            index for the selected coordinates, only if ``return_index`` is True: a tuple of slices for a window, or a
+            tuple of integer arrays (rows, columns) for the points of a rotated inner selection.
         """
 
-        if not outer:
-            # if the geotransform is rotated, the inner selection is not a grid
-            # returning the general stacked coordinates is a general solution
-            return super(AffineCoordinates, self).select(bounds, outer=outer, return_index=return_index)
-
-        # same rotation and step, new origin and shape
-        lat = self.coordinates[:, :, 0]
-        lon = self.coordinates[:, :, 1]
-        b = (
-            (lat >= bounds["lat"][0])
-            & (lat <= bounds["lat"][1])
-            & (lon >= bounds["lon"][0])
-            & (lon <= bounds["lon"][1])
-        )
+        bounds = {dim: bounds.get(dim) for dim in self.dims}
+        bounds = {dim: (-np.inf, np.inf) if b is None else (float(b[0]), float(b[1])) for dim, b in bounds.items()}
 
-        I, J = np.where(b)
-        imin = max(0, np.min(I) - 1)
-        jmin = max(0, np.min(J) - 1)
-        imax = min(self.shape[0] - 1, np.max(I) + 1)
-        jmax = min(self.shape[1] - 1, np.max(J) + 1)
+        jlo, jhi = self._select_intervals(bounds)
+        rows = np.flatnonzero(jlo <= jhi)
 
-        origin = np.array([lat[imin, jmin], lon[imin, jmin]])
-        origin -= np.array([lat[0, 0], lon[0, 0]]) - self.origin
+        selected = None
+        my_bounds = self.bounds
+        if (outer and rows.size == 0) or any(
+            my_bounds[d][0] > b[1] or my_bounds[d][1] < b[0] for d, b in bounds.items()
+        ):
+            index = slice(0, 0), slice(0, 0)
 
-        shape = int(imax - imin + 1), int(jmax - jmin + 1)
+        elif not outer and np.all(jlo == 0) and np.all(jhi == self.shape[1] - 1):
+            # full
+            index = slice(None, None), slice(None, None)
+            selected = self
 
-        geotransform = (
-            origin[1],
-            self.geotransform[1],
-            self.geotransform[2],
-            origin[0],
-            self.geotransform[4],
-            self.geotransform[5],
-        )
+        elif outer:
+            # same rotation and step, new origin and shape
+            imin = max(0, rows[0] - 1)
+            imax = min(self.shape[0] - 1, rows[-1] + 1)
+            jmin = max(0, np.min(jlo[rows]) - 1)
+            jmax = min(self.shape[1] - 1, np.max(jhi[rows]) + 1)
+            index = slice(int(imin), int(imax + 1)), slice(int(jmin), int(jmax + 1))
+
+        else:
+            # if the geotransform is rotated, the inner selection is not a grid
+            # returning the general stacked coordinates is a general solution, with a point index (row-major)
+            counts = jhi[rows] - jlo[rows] + 1
+            I = np.repeat(rows, counts)
+            J = np.repeat(jlo[rows] - np.cumsum(counts) + counts, counts) + np.arange(I.size)
+            index = I, J
 
-        selected = AffineCoordinates(geotransform=geotransform, shape=shape)
+        if selected is None:
+            selected = self[index]
 
         if return_index:
-            return selected, (slice(imin, imax + 1), slice(jmin, jmax + 1))
+            return selected, index
         else:
             return selected
 
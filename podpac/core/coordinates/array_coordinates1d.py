@@ -12,7 +12,7 @@ import numpy as np
 import traitlets as tl
 from collections import OrderedDict
 
-from podpac.core.utils import ArrayTrait
+from podpac.core.utils import ArrayTrait, cached_property, is_encoded_array, decode_array
 from podpac.core.coordinates.utils import make_coord_array, higher_precision_time_bounds
 from podpac.core.coordinates.coordinates1d import Coordinates1d
 
@@ -26,6 +26,10 @@ class ArrayCoordinates1d(Coordinates1d):
     For convenience, podpac automatically converts datetime strings such as ``'2018-01-01'`` to ``datetime64``. The
     coordinate values must all be of the same type.
 
+    The numerical coordinate values can be stored with reduced precision (e.g. ``np.float32``) to halve the memory
+    of very large coordinates (see the ``dtype`` argument and :meth:`astype`). The precision is kept by indexing,
+    selection and serialization with ``compact_json``, and it is part of the ``hash``.
+
     Parameters
     ----------
     name : str
@@ -47,7 +51,7 @@ class ArrayCoordinates1d(Coordinates1d):
     _start = None
     _stop = None
 
-    def __init__(self, coordinates, name=None, **kwargs):
+    def __init__(self, coordinates, name=None, dtype=float, **kwargs):
         """
         Create 1d coordinates from an array.
 
@@ -57,13 +61,28 @@ class ArrayCoordinates1d(Coordinates1d):
             coordinate values.
         name : str, optional
             Dimension name, one of 'lat', 'lon', 'time', or 'alt'.
+        dtype : dtype, optional
+            Floating point dtype of numerical coordinate values, e.g. ``np.float32``. Default ``float``.
         """
 
         # validate and set coordinates
-        coordinates = make_coord_array(coordinates)
+        coordinates = make_coord_array(coordinates, dtype=dtype)
         self.set_trait("coordinates", coordinates)
         self.not_a_trait = coordinates
 
+        self._precalculate()
+
+        # set common properties
+        super(ArrayCoordinates1d, self).__init__(name=name, **kwargs)
+
+    @classmethod
+    def _new(cls, coordinates, name=None):
+        obj = super(ArrayCoordinates1d, cls)._new(name=name, coordinates=coordinates)
+        obj.not_a_trait = coordinates
+        obj._precalculate()
+        return obj
+
+    def _precalculate(self):
         # precalculate once
         if self.coordinates.size == 0:
             pass
@@ -78,7 +97,7 @@ class ArrayCoordinates1d(Coordinates1d):
 
         else:
             deltas = self.deltas
-            if np.any(deltas <= 0):
+            if np.any(deltas <= 0) or np.any(np.isnan(deltas)):  # nan/nat coordinates are not monotonic
                 self._is_monotonic = False
                 self._is_descending = False
                 self._is_uniform = False
@@ -91,9 +110,6 @@ class ArrayCoordinates1d(Coordinates1d):
                     self._stop = self.coordinates[-1]
                     self._step = (self._stop - self._start) / (self.coordinates.size - 1)
 
-        # set common properties
-        super(ArrayCoordinates1d, self).__init__(name=name, **kwargs)
-
     def __eq__(self, other):
         if not self._eq_base(other):
             return False
@@ -143,6 +159,8 @@ class ArrayCoordinates1d(Coordinates1d):
                 "name": "lat"
             })
 
+        The values may also be a binary-encoded array (see :func:`podpac.core.utils.encode_array`).
+
         Arguments
         ---------
         d : dict
@@ -163,6 +181,10 @@ class ArrayCoordinates1d(Coordinates1d):
 
         coordinates = d["values"]
         kwargs = {k: v for k, v in d.items() if k != "values"}
+        if is_encoded_array(coordinates):
+            coordinates = decode_array(coordinates)
+            if np.issubdtype(coordinates.dtype, np.floating):
+                kwargs["dtype"] = coordinates.dtype
         return cls(coordinates, **kwargs)
 
     def copy(self):
@@ -175,7 +197,28 @@ class ArrayCoordinates1d(Coordinates1d):
             Copy of the coordinates.
         """
 
-        return ArrayCoordinates1d(self.coordinates, **self.properties)
+        return ArrayCoordinates1d._new(self.coordinates, name=self.name)
+
+    def astype(self, dtype):
+        """
+        Get the coordinates with the numerical coordinate values stored with the given floating point dtype.
+
+        Datetime coordinates are returned unchanged.
+
+        Arguments
+        ---------
+        dtype : dtype
+            Floating point dtype, e.g. ``np.float32``.
+
+        Returns
+        -------
+        :class:`ArrayCoordinates1d`
+            Coordinates with the given storage dtype.
+        """
+
+        if self.coordinates.dtype == dtype or self.dtype != float:
+            return self
+        return ArrayCoordinates1d._new(make_coord_array(self.coordinates, dtype=dtype), name=self.name)
 
     def unique(self, return_index=False):
         """
@@ -236,7 +279,7 @@ class ArrayCoordinates1d(Coordinates1d):
         if self.ndim == 1:
             return self.copy()
 
-        return ArrayCoordinates1d(self.coordinates.flatten(), **self.properties)
+        return ArrayCoordinates1d(self.coordinates.flatten(), dtype=self._float_dtype, **self.properties)
 
     def reshape(self, newshape):
         """
@@ -253,7 +296,7 @@ class ArrayCoordinates1d(Coordinates1d):
             Reshaped coordinates.
         """
 
-        return ArrayCoordinates1d(self.coordinates.reshape(newshape), **self.properties)
+        return ArrayCoordinates1d(self.coordinates.reshape(newshape), dtype=self._float_dtype, **self.properties)
 
     # ------------------------------------------------------------------------------------------------------------------
     # standard methods, array-like
@@ -264,11 +307,13 @@ class ArrayCoordinates1d(Coordinates1d):
         if self.ndim == 1 and np.ndim(index) > 1 and np.array(index).dtype == int:
             index = np.array(index).flatten().tolist()
         try:
-            return ArrayCoordinates1d(self.coordinates[index], **self.properties)
+            coordinates = self.coordinates[index]
         except IndexError as e:  # This happens when index is a list, but should be a tuple
             if isinstance(index, list):
-                return ArrayCoordinates1d(self.coordinates[tuple(index)], **self.properties)
-            raise (e)
+                coordinates = self.coordinates[tuple(index)]
+            else:
+                raise (e)
+        return ArrayCoordinates1d._new(np.atleast_1d(coordinates), name=self.name)
 
     # ------------------------------------------------------------------------------------------------------------------
     # Properties
@@ -302,11 +347,18 @@ class ArrayCoordinates1d(Coordinates1d):
 
         if self.size == 0:
             return None
-        elif self.coordinates.dtype == float:
+        elif np.issubdtype(self.coordinates.dtype, np.floating):
             return float
         elif np.issubdtype(self.coordinates.dtype, np.datetime64):
             return np.datetime64
 
+    @property
+    def _float_dtype(self):
+        # storage dtype of numerical coordinates, to keep the precision in new coordinates
+        if np.issubdtype(self.coordinates.dtype, np.floating):
+            return self.coordinates.dtype
+        return float
+
     @property
     def is_monotonic(self):
         return self._is_monotonic
@@ -331,7 +383,7 @@ class ArrayCoordinates1d(Coordinates1d):
     def step(self):
         return self._step
 
-    @property
+    @cached_property
     def bounds(self):
         """Low and high coordinate bounds."""
 
@@ -369,49 +421,84 @@ class ArrayCoordinates1d(Coordinates1d):
     # Methods
     # ------------------------------------------------------------------------------------------------------------------
 
-    def _select(self, bounds, return_index, outer):
+    @cached_property
+    def _argsort(self):
+        """Sort order and sorted values of the flattened coordinates, excluding nan and NaT values. Computed once and
+        used to select non-monotonic coordinates with binary searches.
+        """
+
+        values = self.coordinates.ravel()
+        order = np.argsort(values, kind="stable")
         if self.dtype == np.datetime64:
-            _, bounds = higher_precision_time_bounds(self.bounds, bounds, outer)
+            n = np.count_nonzero(~np.isnat(values))
+        else:
+            n = np.count_nonzero(~np.isnan(values))
+        order = order[:n]
+        return order, values[order]
 
-        if not outer:
-            gt = self.coordinates >= bounds[0]
-            lt = self.coordinates <= bounds[1]
-            b = gt & lt
+    @cached_property
+    def _has_nan(self):
+        """Whether any coordinate is nan or NaT. Monotonic coordinates have none, see `_precalculate`."""
 
-        elif self.is_monotonic:
-            gt = np.where(self.coordinates >= bounds[0])[0]
-            lt = np.where(self.coordinates <= bounds[1])[0]
-            lo, hi = bounds[0], bounds[1]
-            if self.is_descending:
-                lt, gt = gt, lt
-                lo, hi = hi, lo
-            if self.coordinates[gt[0]] != lo:
-                gt[0] -= 1
-            if self.coordinates[lt[-1]] != hi:
-                lt[-1] += 1
-            start = max(0, gt[0])
-            stop = min(self.size - 1, lt[-1])
-            b = slice(start, stop + 1)
+        if self.is_monotonic and self.size > 1:
+            return False
+        return self._argsort[0].size < self.size
+
+    def _outer_bounds(self, bounds):
+        """Nearest coordinate values outside of (or equal to) the given bounds, None where there is no such value."""
 
+        _, values = self._argsort
+        i = np.searchsorted(values, bounds[0], side="right")
+        j = np.searchsorted(values, bounds[1], side="left")
+        lo = values[i - 1] if i > 0 else None
+        hi = values[j] if j < values.size else None
+        return lo, hi
+
+    def _select(self, bounds, return_index, outer):
+        if self.dtype == np.datetime64:
+            _, bounds = higher_precision_time_bounds(self.bounds, bounds, outer)
+
+        if self.is_monotonic and not self._has_nan:
+            b = self._select_monotonic(bounds, outer)
         else:
-            try:
-                gt = self.coordinates >= max(self.coordinates[self.coordinates <= bounds[0]])
-            except ValueError as e:
-                if self.dtype == np.datetime64:
-                    gt = ~np.isnat(self.coordinates)
-                else:
-                    gt = self.coordinates >= -np.inf
-            try:
-                lt = self.coordinates <= min(self.coordinates[self.coordinates >= bounds[1]])
-            except ValueError as e:
-                if self.dtype == np.datetime64:
-                    lt = ~np.isnat(self.coordinates)
-                else:
-                    lt = self.coordinates <= np.inf
-
-            b = gt & lt
+            b = self._select_sorted(bounds, outer)
 
         if return_index:
             return self[b], b
         else:
             return self[b]
+
+    def _select_monotonic(self, bounds, outer):
+        values = self.coordinates[::-1] if self.is_descending else self.coordinates
+
+        if outer:
+            start = max(0, np.searchsorted(values, bounds[0], side="right") - 1)
+            stop = np.searchsorted(values, bounds[1], side="left") + 1
+        else:
+            start = np.searchsorted(values, bounds[0], side="left")
+            stop = np.searchsorted(values, bounds[1], side="right")
+        stop = max(start, min(stop, self.size))
+
+        if self.is_descending:
+            start, stop = self.size - stop, self.size - start
+        return slice(int(start), int(stop))
+
+    def _select_sorted(self, bounds, outer):
+        order, values = self._argsort
+
+        if outer:
+            lo, hi = self._outer_bounds(bounds)
+            start = 0 if lo is None else np.searchsorted(values, lo, side="left")
+            stop = values.size if hi is None else np.searchsorted(values, hi, side="right")
+        else:
+            start = np.searchsorted(values, bounds[0], side="left")
+            stop = np.searchsorted(values, bounds[1], side="right")
+
+        # selected indices in their original order
+        index = np.sort(order[start : max(start, stop)])
+
+        if self.ndim > 1:
+            mask = np.zeros(self.size, dtype=bool)
+            mask[index] = True
+            return mask.reshape(self.shape)
+        return index
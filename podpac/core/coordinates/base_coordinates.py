@@ -7,6 +7,19 @@ import traitlets as tl
 class BaseCoordinates(tl.HasTraits):
     """Base class for single or stacked one-dimensional coordinates."""
 
+    @classmethod
+    def _new(cls, **traits):
+        """
+        Fast constructor for trusted internal use, e.g. for subsets or reordered copies of existing coordinates.
+
+        The trait values are stored directly, without validation or change notifications, so they must already be
+        valid. User input should always go through the validating constructor.
+        """
+
+        obj = cls.__new__(cls)
+        obj._trait_values.update(traits)
+        return obj
+
     def _set_name(self, value):
         raise NotImplementedError
 
@@ -83,6 +96,10 @@ class BaseCoordinates(tl.HasTraits):
         """Deep copy of the coordinates and their properties."""
         raise NotImplementedError
 
+    def astype(self, dtype):
+        """Coordinates with the numerical coordinate values stored with the given floating point dtype."""
+        raise NotImplementedError
+
     def unique(self, return_index=False):
         """Remove duplicate coordinate values."""
         raise NotImplementedError
@@ -9,7 +9,10 @@ from copy import deepcopy
 import sys
 import itertools
 import json
+import threading
+import weakref
 from collections import OrderedDict
+from functools import lru_cache
 
 import numpy as np
 import traitlets as tl
@@ -45,6 +48,17 @@ rasterio = lazy_module("rasterio")
 _logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _get_CRS(crs):
+    # parsing a crs is expensive, and Coordinates with the same crs string are compared and hashed often
+    return pyproj.CRS(crs)
+
+
+# canonical Coordinates by hash, see Coordinates.intern
+_INTERNED = weakref.WeakValueDictionary()
+_INTERNED_LOCK = threading.Lock()
+
+
 class Coordinates(tl.HasTraits):
     """
     Multidimensional Coordinates.
@@ -178,10 +192,100 @@ class Coordinates(tl.HasTraits):
 
         return val
 
+    @tl.observe("_coords", "crs")
+    def _observe_coords(self, d):
+        self._clear_cache()
+
     @tl.default("crs")
     def _default_crs(self):
         return settings["DEFAULT_CRS"]
 
+    def _clear_cache(self):
+        """
+        Clear the cached properties (e.g. hash) and the memoized derived coordinates (e.g. transposed). This must be
+        called when the coordinates are modified in place.
+        """
+
+        for key in [key for key in self.__dict__ if key.startswith("_podpac_cached_property_")]:
+            del self.__dict__[key]
+        self.__dict__.pop("_derived", None)
+        self.__dict__["_modified"] = self.__dict__.get("_modified", 0) + 1
+
+    def _derive(self, key, f, copy=False):
+        """
+        Get memoized coordinates derived from these coordinates, e.g. transposed or simplified coordinates.
+
+        By default, the derived coordinates are shared by the callers, and they are recomputed if they are modified in
+        place. With ``copy``, each caller gets a new instance instead, with the hash and the memoized derived
+        coordinates (e.g. simplified) of the shared instance.
+
+        Parameters
+        ----------
+        key : tuple
+            Derivation key, e.g. ``("transpose", dims)``
+        f : callable()
+            Computes the derived coordinates.
+        copy : bool, optional
+            Return a new instance of the derived coordinates. Default False.
+        """
+
+        derived = self.__dict__.setdefault("_derived", {})
+        if key in derived and derived[key][0].__dict__.get("_modified", 0) == derived[key][1]:
+            c = derived[key][0]
+        else:
+            c = f()
+            derived[key] = (c, c.__dict__.get("_modified", 0))
+
+        if not copy:
+            return c
+
+        d = Coordinates._new(list(c._coords.values()), c.crs)
+        d.__dict__["_podpac_cached_property_hash"] = c.hash
+        d.__dict__["_derived"] = c.__dict__.setdefault("_derived", {})
+        return d
+
+    def __getstate__(self):
+        # the memoized derived coordinates are not pickled, e.g. when sending coordinates to other processes
+        d = super(Coordinates, self).__getstate__()
+        d.pop("_derived", None)
+        return d
+
+    def intern(self):
+        """
+        Get the canonical instance of these coordinates.
+
+        Structurally equal coordinates (with the same ``hash``) share one instance while it is in use, along with its
+        cached properties (``hash``, ``bounds``, ``xcoords``, ``geotransform``, ...) and memoized derived coordinates
+        (``transpose``, ``simplify``, ``drop``). The canonical instance should not be modified in place.
+
+        Returns
+        -------
+        interned : :class:`Coordinates`
+            The canonical instance, which may be these coordinates.
+        """
+
+        key = self.hash
+        with _INTERNED_LOCK:
+            c = _INTERNED.get(key)
+            # the canonical instance may have been modified in place since it was interned
+            if c is None or c.hash != key:
+                _INTERNED[key] = c = self
+        return c
+
+    @classmethod
+    def _new(cls, coords, crs):
+        """
+        Fast constructor for trusted internal use, e.g. for subsets or reordered copies of existing Coordinates.
+
+        The coords must be named and have unique dimensions, and the crs must already be validated. The trait values
+        are stored directly, without validation or change notifications.
+        """
+
+        obj = cls.__new__(cls)
+        obj._trait_values["_coords"] = OrderedDict((c.name, c) for c in coords)
+        obj._trait_values["crs"] = crs
+        return obj
+
     # ------------------------------------------------------------------------------------------------------------------
     # Alternate constructors
     # ------------------------------------------------------------------------------------------------------------------
@@ -417,6 +521,8 @@ class Coordinates(tl.HasTraits):
                 }
             ]
 
+        The values may also be binary-encoded, see :attr:`compact_json`.
+
         Arguments
         ---------
         s : str
@@ -429,7 +535,7 @@ class Coordinates(tl.HasTraits):
 
         See Also
         --------
-        json
+        json, compact_json
         """
 
         d = json.loads(s)
@@ -610,7 +716,7 @@ class Coordinates(tl.HasTraits):
                 i += c.ndim
 
             cs = [c[I] for c, I in zip(self._coords.values(), indices)]
-            return Coordinates(cs, validate_crs=False, **self.properties)
+            return Coordinates._new(cs, self.crs)
 
     def __setitem__(self, dim, c):
 
@@ -634,6 +740,7 @@ class Coordinates(tl.HasTraits):
         elif dim in self.udims:
             stacked_dim = [sd for sd in self.dims if dim in sd][0]
             self._coords[stacked_dim][dim] = c
+            self._clear_cache()
         else:
             raise KeyError("Cannot set dimension '%s' in Coordinates %s" % (dim, self.dims))
 
@@ -642,6 +749,7 @@ class Coordinates(tl.HasTraits):
             raise KeyError("Cannot delete dimension '%s' in Coordinates %s" % (dim, self.dims))
 
         del self._coords[dim]
+        self._clear_cache()
 
     def __len__(self):
         return len(self._coords)
@@ -771,6 +879,10 @@ class Coordinates(tl.HasTraits):
     @property
     def bounds(self):
         """:dict: Dictionary of (low, high) coordinates bounds in each unstacked dimension"""
+        return dict(self._bounds)
+
+    @cached_property
+    def _bounds(self):
         return {dim: self[dim].bounds for dim in self.udims}
 
     @property
@@ -779,6 +891,10 @@ class Coordinates(tl.HasTraits):
         :dict: xarray coords
         """
 
+        return OrderedDict(self._xcoords)
+
+    @cached_property
+    def _xcoords(self):
         xcoords = OrderedDict()
         for c in self._coords.values():
             xcoords.update(c.xcoords)
@@ -786,7 +902,7 @@ class Coordinates(tl.HasTraits):
 
     @property
     def CRS(self):
-        return pyproj.CRS(self.crs)
+        return _get_CRS(self.crs)
 
     @property
     def alt_units(self):
@@ -834,7 +950,7 @@ class Coordinates(tl.HasTraits):
         d["crs"] = self.CRS.to_wkt()
         return d
 
-    @property
+    @cached_property
     def json(self):
         """:str: JSON-serialized coordinates definition.
 
@@ -853,15 +969,36 @@ class Coordinates(tl.HasTraits):
 
         return json.dumps(self.definition, separators=(",", ":"), cls=podpac.core.utils.JSONEncoder)
 
+    @cached_property
+    def compact_json(self):
+        """:str: JSON-serialized coordinates definition with binary-encoded coordinate values.
+
+        Array coordinate values are encoded as raw little-endian bytes in base64 (see
+        :func:`podpac.core.utils.encode_array`), which is much smaller and faster to create and parse than the ``json``
+        for large coordinates. This is the format used to transport coordinates to other processes and to AWS Lambda
+        functions.
+
+        The ``compact_json`` can also be used to create new Coordinates::
+
+            c = podapc.Coordinates(...)
+            c2 = podpac.Coordinates.from_json(c.compact_json)
+
+        See Also
+        --------
+        json, from_json
+        """
+
+        return json.dumps(self.definition, separators=(",", ":"), cls=podpac.core.utils.CompactJSONEncoder)
+
     @cached_property
     def hash(self):
         """:str: Coordinates hash value."""
         # We can't use self.json for the hash because the CRS is not standardized.
-        # As such, we json.dumps the full definition.
-        json_d = json.dumps(self.full_definition, separators=(",", ":"), cls=podpac.core.utils.JSONEncoder)
+        # As such, we json.dumps the full definition (with binary-encoded values, which is much faster for large arrays).
+        json_d = json.dumps(self.full_definition, separators=(",", ":"), cls=podpac.core.utils.CompactJSONEncoder)
         return hash_alg(json_d.encode("utf-8")).hexdigest()
 
-    @property
+    @cached_property
     def geotransform(self):
         """:tuple: GDAL geotransform."""
         # Make sure we only have 1 time and alt dimension
@@ -969,8 +1106,10 @@ class Coordinates(tl.HasTraits):
             if dim not in self.dims and not ignore_missing:
                 raise KeyError("Dimension '%s' not found in Coordinates with dims %s" % (dim, self.dims))
 
-        return Coordinates(
-            [c for c in self._coords.values() if c.name not in dims], validate_crs=False, **self.properties
+        return self._derive(
+            ("drop", tuple(dims)),
+            lambda: Coordinates._new([c for c in self._coords.values() if c.name not in dims], self.crs),
+            copy=True,
         )
 
     def udrop(self, dims, ignore_missing=False):
@@ -1040,7 +1179,7 @@ class Coordinates(tl.HasTraits):
                 elif len(stacked) == 1:
                     cs.append(stacked[0])
 
-        return Coordinates(cs, validate_crs=False, **self.properties)
+        return Coordinates._new(cs, self.crs)
 
     def intersect(self, other, dims=None, outer=False, return_index=False):
         """
@@ -1162,13 +1301,13 @@ class Coordinates(tl.HasTraits):
 
     def _make_selected_coordinates(self, selections, return_index):
         if return_index:
-            coords = Coordinates([c for c, I in selections], validate_crs=False, **self.properties)
-            # unbundle shaped indices
-            I = [I if c.ndim > 1 else [I] for c, I in selections]
+            coords = Coordinates._new([c for c, I in selections], self.crs)
+            # unbundle shaped indices, and point indices into shaped coordinates (e.g. rotated affine selections)
+            I = [I if c.ndim > 1 or isinstance(I, tuple) else [I] for c, I in selections]
             I = [e for l in I for e in l]
             return coords, tuple(I)
         else:
-            return Coordinates(selections, validate_crs=False, **self.properties)
+            return Coordinates._new(selections, self.crs)
 
     def unique(self, return_index=False):
         """
@@ -1193,7 +1332,7 @@ class Coordinates(tl.HasTraits):
                 return self[:]
 
         cs, I = zip(*[c.unique(return_index=True) for c in self.values()])
-        unique = Coordinates(cs, validate_crs=False, **self.properties)
+        unique = Coordinates._new(cs, self.crs)
 
         if return_index:
             return unique, I
@@ -1214,9 +1353,9 @@ class Coordinates(tl.HasTraits):
         xr.DataArray.unstack
         """
 
-        return Coordinates([self[dim] for dim in self.udims], validate_crs=False, **self.properties)
+        return Coordinates._new([self[dim] for dim in self.udims], self.crs)
 
-    def iterchunks(self, shape, return_slices=False):
+    def iterchunks(self, shape, return_slices=False, halo=None, grid=None):
         """
         Get a generator that yields Coordinates no larger than the given shape until the entire Coordinates is covered.
 
@@ -1226,25 +1365,72 @@ class Coordinates(tl.HasTraits):
             The maximum shape of the chunk, with sizes corresponding to the `dims`.
         return_slice : boolean, optional
             Return slice in addition to Coordinates chunk.
+        halo : dict, optional
+            Number of neighboring coordinates to add on each side of the chunks, by dim. The padded chunks are clipped
+            to the bounds of the coordinates, and they can be larger than the given shape.
+        grid : dict, optional
+            Storage grid to snap the chunk edges to, by dim, as an ``(origin, length)`` tuple in coordinate units.
+            The storage blocks span ``[origin + k * length, origin + (k + 1) * length)``. Chunks contain as many whole
+            storage blocks as fit in the given shape. Storage blocks that are larger than the shape are split, starting
+            at the block edge. Only applies to unstacked dimensions.
 
         Yields
         ------
         coords : :class:`Coordinates`
-            A Coordinates object with one chunk of the coordinates.
-        slices : list
-            slices for this Coordinates chunk, only if ``return_slices`` is True
+            A Coordinates object with one chunk of the coordinates, padded with the halo (if applicable).
+        slices : tuple
+            slices for this Coordinates chunk (without the halo), only if ``return_slices`` is True
+        interior : tuple
+            slices of the chunk within the padded coords, only if a ``halo`` is given
+
+        Examples
+        --------
+        Chunk-wise evaluation of a neighborhood operation, without edge artifacts::
+
+            for coords, slices, interior in coordinates.iterchunks(shape, return_slices=True, halo={'lat': 2}):
+                output[slices] = node.eval(coords)[interior]
         """
 
-        l = [[slice(i, i + n) for i in range(0, m, n)] for m, n in zip(self.shape, shape)]
-        for slices in itertools.product(*l):
-            coords = Coordinates(
-                [self._coords[dim][slc] for dim, slc in zip(self.dims, slices)], validate_crs=False, **self.properties
-            )
-            if return_slices:
+        halo = halo or {}
+
+        for slices in itertools.product(*self._get_chunk_slices(shape, grid)):
+            if halo:
+                padded = []
+                interior = []
+                for dim, m, slc in zip(self.dims, self.shape, slices):
+                    start = max(0, slc.start - halo.get(dim, 0))
+                    stop = min(m, slc.stop + halo.get(dim, 0))
+                    padded.append(slice(start, stop))
+                    interior.append(slice(slc.start - start, slc.stop - start))
+                interior = tuple(interior)
+            else:
+                padded = slices
+
+            coords = Coordinates._new([self._coords[dim][slc] for dim, slc in zip(self.dims, padded)], self.crs)
+            if return_slices and halo:
+                yield coords, slices, interior
+            elif return_slices:
                 yield coords, slices
+            elif halo:
+                yield coords, interior
             else:
                 yield coords
 
+    def _get_chunk_slices(self, shape, grid=None):
+        """Chunk slices along each dim, see `iterchunks`. The number of chunks is the product of their lengths."""
+
+        grid = grid or {}
+
+        l = []
+        for dim, m, n in zip(self.dims, self.shape, shape):
+            if dim in grid and isinstance(self._coords[dim], Coordinates1d):
+                origin, length = grid[dim]
+                blocks = np.floor((self._coords[dim].coordinates - origin) / length)
+                l.append(_chunk_slices(m, n, edges=np.flatnonzero(np.diff(blocks)) + 1))
+            else:
+                l.append(_chunk_slices(m, n))
+        return l
+
     def transpose(self, *dims, **kwargs):
         """
         Transpose (re-order) the dimensions of the Coordinates.
@@ -1291,7 +1477,29 @@ class Coordinates(tl.HasTraits):
             self._coords = OrderedDict(zip(dims, coords))
             return self
         else:
-            return Coordinates(coords, validate_crs=False, **self.properties)
+            return self._derive(("transpose", tuple(dims)), lambda: Coordinates._new(coords, self.crs), copy=True)
+
+    def astype(self, dtype):
+        """
+        Get the coordinates with the numerical coordinate values stored with the given floating point dtype.
+
+        This is an opt-in reduced precision policy for very large coordinates, e.g. stacked point clouds, where
+        ``np.float32`` halves the memory. Uniform and affine coordinates are computed rather than stored, and are
+        unchanged. The precision is kept by indexing and selection, it is part of the ``hash``, and it is transported
+        by ``compact_json``.
+
+        Arguments
+        ---------
+        dtype : dtype
+            Floating point dtype, e.g. ``np.float32``.
+
+        Returns
+        -------
+        :class:`Coordinates`
+            Coordinates with the given storage dtype.
+        """
+
+        return Coordinates._new([c.astype(dtype) for c in self._coords.values()], self.crs)
 
     def transform_time(self, units):
         if "time" not in self.dims:
@@ -1406,9 +1614,9 @@ class Coordinates(tl.HasTraits):
                 else:
                     raise RuntimeError("lat and lon dimensions should be adjacent")
 
-                c = StackedCoordinates(
-                    np.meshgrid(c1.coordinates, c2.coordinates, indexing="ij"), dims=[c1.name, c2.name]
-                )
+                # broadcast (read-only) views of the grid, the transform only materializes one chunk at a time
+                grid = np.broadcast_arrays(c1.coordinates[:, np.newaxis], c2.coordinates[np.newaxis, :])
+                c = StackedCoordinates(grid, dims=[c1.name, c2.name])
 
                 # replace 'lat' and 'lon' entries with single 'lat_lon' entry
                 i = min(ilat, ilon)
@@ -1471,9 +1679,13 @@ class Coordinates(tl.HasTraits):
         Returns
         -------
         simplified : Coordinates
-            Simplified coordinates.
+            Simplified coordinates. The result is memoized and shared by the callers, so it should not be modified in
+            place (it is recomputed if it is).
         """
 
+        return self._derive(("simplify",), self._simplify)
+
+    def _simplify(self):
         cs = []
         for c in self._coords.values():
             c2 = c.simplify()
@@ -1602,6 +1814,32 @@ class Coordinates(tl.HasTraits):
         return rep
 
 
+def _chunk_slices(size, n, edges=None):
+    """Slices of at most n elements that cover size elements.
+
+    If storage block edges (indices) are given, each slice consists of whole blocks, splitting blocks larger than n.
+    """
+
+    if edges is None:
+        return [slice(i, min(i + n, size)) for i in range(0, size, n)]
+
+    edges = [0] + list(edges) + [size]
+    slices = []
+    start = 0
+    for a, b in zip(edges[:-1], edges[1:]):
+        if b - start <= n:
+            continue
+        if a > start:
+            slices.append(slice(start, a))
+            start = a
+        if b - a > n:
+            slices.extend(slice(i, min(i + n, b)) for i in range(a, b, n))
+            start = b
+    if start < size:
+        slices.append(slice(start, size))
+    return slices
+
+
 def merge_dims(coords_list, validate_crs=True):
     """
     Merge the coordinates.
@@ -16,6 +16,7 @@ from podpac.core.coordinates.utils import make_coord_value, make_coord_delta, ma
 from podpac.core.coordinates.utils import add_coord, divide_delta, lower_precision_time_bounds
 from podpac.core.coordinates.utils import Dimension
 from podpac.core.coordinates.utils import calculate_distance
+from podpac.core.coordinates.utils import transform_coordinates
 from podpac.core.coordinates.base_coordinates import BaseCoordinates
 
 
@@ -53,6 +54,14 @@ class Coordinates1d(BaseCoordinates):
         elif self.name != value:
             raise ValueError("Dimension mismatch, %s != %s" % (value, self.name))
 
+    @classmethod
+    def _new(cls, name=None, **traits):
+        obj = super(Coordinates1d, cls)._new(**traits)
+        if name is not None:
+            obj._trait_values["name"] = name
+            obj._trait_values["_properties"] = {"name"}
+        return obj
+
     # ------------------------------------------------------------------------------------------------------------------
     # standard methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -148,6 +157,11 @@ class Coordinates1d(BaseCoordinates):
     def is_uniform(self):
         raise NotImplementedError
 
+    @property
+    def _has_nan(self):
+        """Whether any coordinate is nan or NaT."""
+        return False
+
     @property
     def start(self):
         raise NotImplementedError
@@ -209,6 +223,25 @@ class Coordinates1d(BaseCoordinates):
 
         raise NotImplementedError
 
+    def astype(self, dtype):
+        """
+        Get the coordinates with the numerical coordinate values stored with the given floating point dtype.
+
+        Coordinates that are not stored as an array of values (e.g. uniform coordinates) are returned unchanged.
+
+        Arguments
+        ---------
+        dtype : dtype
+            Floating point dtype, e.g. ``np.float32``.
+
+        Returns
+        -------
+        :class:`Coordinates1d`
+            Coordinates with the given storage dtype.
+        """
+
+        return self
+
     def simplify(self):
         """Get the simplified/optimized representation of these coordinates.
 
@@ -327,7 +360,7 @@ class Coordinates1d(BaseCoordinates):
         -------
         selection : :class:`Coordinates1d`
             Coordinates1d object with coordinates within the bounds.
-        I : slice, boolean array
+        I : slice, boolean array, integer array
             index or slice for the selected coordinates (only if return_index=True)
         """
 
@@ -358,8 +391,8 @@ class Coordinates1d(BaseCoordinates):
         if self.dtype == np.datetime64:
             my_bounds, bounds = lower_precision_time_bounds(my_bounds, bounds, outer)
 
-        # full
-        if my_bounds[0] >= bounds[0] and my_bounds[1] <= bounds[1]:
+        # full (nan coordinates are not within any bounds)
+        if my_bounds[0] >= bounds[0] and my_bounds[1] <= bounds[1] and not self._has_nan:
             return self._select_full(return_index)
 
         # none
@@ -380,7 +413,7 @@ class Coordinates1d(BaseCoordinates):
         # transform "alt" coordinates
         from podpac.core.coordinates.array_coordinates1d import ArrayCoordinates1d
 
-        _, _, tcoordinates = transformer.transform(np.zeros(self.shape), np.zeros(self.shape), self.coordinates)
+        _, _, tcoordinates = transform_coordinates(transformer, 0.0, 0.0, self.coordinates)
         return ArrayCoordinates1d(tcoordinates, **self.properties)
 
     def issubset(self, other):
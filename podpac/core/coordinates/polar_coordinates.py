@@ -199,6 +199,10 @@ class PolarCoordinates(StackedCoordinates):
     def copy(self):
         return PolarCoordinates(self.center, self.radius, self.theta, dims=self.dims)
 
+    def astype(self, dtype):
+        # the polar coordinates values are computed, not stored
+        return self
+
     # TODO return PolarCoordinates when possible
     # def select(self, other, outer=False):
     #     raise NotImplementedError("TODO")
@@ -18,6 +18,7 @@ from podpac.core.coordinates.array_coordinates1d import ArrayCoordinates1d
 from podpac.core.coordinates.uniform_coordinates1d import UniformCoordinates1d
 from podpac.core.coordinates.utils import make_coord_value
 from podpac.core.coordinates.utils import calculate_distance
+from podpac.core.coordinates.utils import transform_coordinates, is_separable
 
 
 class StackedCoordinates(BaseCoordinates):
@@ -65,6 +66,7 @@ class StackedCoordinates(BaseCoordinates):
     """
 
     _coords = tl.List(trait=tl.Instance(Coordinates1d), read_only=True)
+    _grid_indices = None
 
     def __init__(self, coords, name=None, dims=None):
         """
@@ -229,7 +231,7 @@ class StackedCoordinates(BaseCoordinates):
             return self._getsubset(index)
 
     def _getsubset(self, index):
-        return StackedCoordinates([c[index] for c in self._coords])
+        return StackedCoordinates._new(_coords=[c[index] for c in self._coords])
 
     def __setitem__(self, dim, c):
         if not dim in self.dims:
@@ -381,6 +383,23 @@ class StackedCoordinates(BaseCoordinates):
 
         return StackedCoordinates(self._coords)
 
+    def astype(self, dtype):
+        """
+        Get the stacked coordinates with the numerical coordinate values stored with the given floating point dtype.
+
+        Arguments
+        ---------
+        dtype : dtype
+            Floating point dtype, e.g. ``np.float32``, which halves the memory of very large point coordinates.
+
+        Returns
+        -------
+        :class:`StackedCoordinates`
+            Stacked coordinates with the given storage dtype.
+        """
+
+        return StackedCoordinates._new(_coords=[c.astype(dtype) for c in self._coords])
+
     def unique(self, return_index=False):
         """
         Remove duplicate stacked coordinate values.
@@ -442,19 +461,85 @@ class StackedCoordinates(BaseCoordinates):
         -------
         selection : :class:`StackedCoordinates`
             StackedCoordinates object consisting of the selection in all dimensions.
-        selection_index : slice, boolean array
+        selection_index : slice, boolean array, integer array
             Slice or index for the selected coordinates, only if ``return_index`` is True.
         """
 
-        # logical AND of the selection in each dimension
-        indices = [c.select(bounds, outer=outer, return_index=True)[1] for c in self._coords]
-        index = self._and_indices(indices)
+        index = self._select_grid(bounds, outer)
+        if index is None:
+            # logical AND of the selection in each dimension
+            indices = [c.select(bounds, outer=outer, return_index=True)[1] for c in self._coords]
+            index = self._and_indices(indices)
 
         if return_index:
             return self[index], index
         else:
             return self[index]
 
+    def _select_grid(self, bounds, outer):
+        """Select point coordinates in two or more dimensions using a grid-bucket index of the points.
+
+        The index is only used for 1d stacked numerical array coordinates, when at least two of the dimensions are
+        selected. The points in the grid cells that overlap the selection bounds are then checked individually, so that
+        the cost of the selection scales with the number of selected points rather than the number of points.
+
+        Returns
+        -------
+        index : integer array, slice, None
+            Index for the selected coordinates, or None if the grid-bucket index cannot be used.
+        """
+
+        if self.ndim != 1 or not isinstance(bounds, dict):
+            return None
+
+        coords = [c for c in self._coords if bounds.get(c.name) is not None]
+        if not all(isinstance(c, ArrayCoordinates1d) and c.dtype is float for c in coords):
+            return None
+
+        # selection bounds, in the same dimension order as the grid, skipping fully selected dimensions
+        selected, lo, hi = [], [], []
+        for c in coords:
+            b = make_coord_value(bounds[c.name][0]), make_coord_value(bounds[c.name][1])
+            if not all(isinstance(value, float) for value in b):
+                return None
+            if c.bounds[0] > b[1] or c.bounds[1] < b[0]:
+                return slice(0, 0)
+            if c.bounds[0] >= b[0] and c.bounds[1] <= b[1]:
+                continue
+            if outer:
+                b = c._outer_bounds(b)
+                b = -np.inf if b[0] is None else b[0], np.inf if b[1] is None else b[1]
+            selected.append(c)
+            lo.append(b[0])
+            hi.append(b[1])
+
+        if len(selected) < 2:
+            return None
+
+        grid = self._get_grid_index(selected)
+        candidates = grid.query(lo, hi)
+
+        # exact selection
+        mask = np.ones(candidates.size, dtype=bool)
+        for c, l, h in zip(selected, lo, hi):
+            values = c.coordinates[candidates]
+            mask &= (values >= l) & (values <= h)
+        index = np.sort(candidates[mask])
+
+        # for consistency
+        if index.size == self.size:
+            index = slice(None, None)
+        return index
+
+    def _get_grid_index(self, coords):
+        # the index is cached and rebuilt when the coordinates are replaced
+        if self._grid_indices is None:
+            self._grid_indices = {}
+        key = tuple(c.name for c in coords)
+        if key not in self._grid_indices or any(a is not b for a, b in zip(self._grid_indices[key].coords, coords)):
+            self._grid_indices[key] = _GridIndex(coords)
+        return self._grid_indices[key]
+
     def _and_indices(self, indices):
         def _index_len(index):
             if isinstance(index, slice):
@@ -483,6 +568,21 @@ class StackedCoordinates(BaseCoordinates):
                     index = slice(None, None)
         elif any(_index_len(index) == 0 for index in indices):
             index = slice(0, 0)
+        elif self.ndim == 1:
+            # intersect the (sorted) integer indices, within the slices
+            slices = [index for index in indices if isinstance(index, slice)]
+            start = max([index.start or 0 for index in slices], default=0)
+            stop = min([index.stop or self.size for index in slices], default=self.size)
+            arrays = [np.asarray(index) for index in indices if not isinstance(index, slice)]
+            arrays = [np.flatnonzero(a) if a.dtype == bool else a for a in arrays]
+            arrays.sort(key=len)
+            index = arrays[0][(arrays[0] >= start) & (arrays[0] < stop)]
+            for other in arrays[1:]:
+                index = np.intersect1d(index, other, assume_unique=True)
+
+            # for consistency
+            if index.size == self.size:
+                index = slice(None, None)
         else:
             # convert any slices to boolean array
             for i, index in enumerate(indices):
@@ -516,7 +616,7 @@ class StackedCoordinates(BaseCoordinates):
             lat = coords[ilat]
             lon = coords[ilon]
             alt = coords[ialt]
-            tlon, tlat, talt = transformer.transform(lon.coordinates, lat.coordinates, alt.coordinates)
+            tlon, tlat, talt = transform_coordinates(transformer, lon.coordinates, lat.coordinates, alt.coordinates)
 
             coords[ilat] = ArrayCoordinates1d(tlat, "lat").simplify()
             coords[ilon] = ArrayCoordinates1d(tlon, "lon").simplify()
@@ -528,13 +628,9 @@ class StackedCoordinates(BaseCoordinates):
 
             lat = coords[ilat]
             lon = coords[ilon]
-            tlon, tlat = transformer.transform(lon.coordinates, lat.coordinates)
+            tlon, tlat = transform_coordinates(transformer, lon.coordinates, lat.coordinates)
 
-            if (
-                self.ndim == 2
-                and all(np.allclose(a, tlat[:, 0]) for a in tlat.T)
-                and all(np.allclose(a, tlon[0]) for a in tlon)
-            ):
+            if self.ndim == 2 and is_separable(tlat, tlon):
                 coords[ilat] = ArrayCoordinates1d(tlat[:, 0], name="lat").simplify()
                 coords[ilon] = ArrayCoordinates1d(tlon[0], name="lon").simplify()
                 return coords
@@ -546,7 +642,7 @@ class StackedCoordinates(BaseCoordinates):
             ialt = self.dims.index("alt")
 
             alt = coords[ialt]
-            _, _, talt = transformer.transform(np.zeros(self.size), np.zeros(self.size), alt.coordinates)
+            _, _, talt = transform_coordinates(transformer, 0.0, 0.0, alt.coordinates)
 
             coords[ialt] = ArrayCoordinates1d(talt, "alt").simplify()
 
@@ -584,7 +680,7 @@ class StackedCoordinates(BaseCoordinates):
             self.set_trait("_coords", coordinates)
             return self
         else:
-            return StackedCoordinates(coordinates)
+            return StackedCoordinates._new(_coords=coordinates)
 
     def flatten(self):
         return StackedCoordinates([c.flatten() for c in self._coords])
@@ -798,3 +894,69 @@ class StackedCoordinates(BaseCoordinates):
             return full_stacked_resolution()
         else:
             raise ValueError("Invalid value for type: {}".format(restype))
+
+
+class _GridIndex(object):
+    """Grid-bucket index of 1d point coordinates in two or more dimensions.
+
+    The bounding box of the points is divided into a regular grid with about ``POINTS_PER_CELL`` points per cell, and
+    the points are sorted by grid cell so that the points in a block of grid cells can be gathered without a scan.
+
+    Parameters
+    ----------
+    coords : list
+        ArrayCoordinates1d objects with the (float) coordinate values of the points in each dimension.
+    """
+
+    POINTS_PER_CELL = 16
+
+    def __init__(self, coords):
+        self.coords = coords
+        values = [c.coordinates for c in coords]
+
+        # points with nan values are never selected
+        valid = np.logical_and.reduce([np.isfinite(v) for v in values])
+        n = np.count_nonzero(valid)
+        self.ncells = max(1, int((n / self.POINTS_PER_CELL) ** (1.0 / len(values))))
+        self.lo = np.array([np.min(v[valid]) if n else 0.0 for v in values])
+        self.hi = np.array([np.max(v[valid]) if n else 0.0 for v in values])
+        with np.errstate(divide="ignore"):
+            self.scale = np.where(self.hi > self.lo, self.ncells / (self.hi - self.lo), 0.0)
+
+        cell = np.zeros(valid.size, dtype=int)
+        for i, v in enumerate(values):
+            cell = cell * self.ncells + self._cell(i, np.where(valid, v, self.lo[i]))
+        cell[~valid] = self.ncells ** len(values)
+
+        self.order = np.argsort(cell, kind="stable")
+        self.starts = np.searchsorted(cell[self.order], np.arange(self.ncells ** len(values) + 1))
+
+    def _cell(self, i, values):
+        values = np.clip(values, self.lo[i], self.hi[i])
+        return np.minimum(np.floor((values - self.lo[i]) * self.scale[i]), self.ncells - 1).astype(int)
+
+    def query(self, lo, hi):
+        """Indices of the points in the grid cells that overlap the given bounds (a superset of the selection).
+
+        Parameters
+        ----------
+        lo, hi : list
+            Lower and upper selection bounds in each dimension. Infinite bounds are allowed.
+
+        Returns
+        -------
+        candidates : integer array
+            Point indices.
+        """
+
+        if any(l > h for l, h in zip(lo, hi)):
+            return np.array([], dtype=int)
+
+        ranges = [np.arange(self._cell(i, l), self._cell(i, h) + 1) for i, (l, h) in enumerate(zip(lo, hi))]
+        cells = np.ravel_multi_index(np.meshgrid(*ranges, indexing="ij"), (self.ncells,) * len(ranges)).ravel()
+
+        # gather the points of each cell
+        starts = self.starts[cells]
+        counts = self.starts[cells + 1] - starts
+        offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        return self.order[offsets + np.arange(offsets.size)]
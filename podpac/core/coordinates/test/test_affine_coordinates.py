@@ -214,6 +214,77 @@ class TestAffineCoordinatesProperties(object):
     #     )
 
 
+class TestAffineCoordinatesIndexing(object):
+    def test_bounds(self):
+        c = AffineCoordinates(geotransform=GEOTRANSFORM_ROTATED, shape=(3, 4))
+        assert c.bounds["lat"] == (c.coordinates[:, :, 0].min(), c.coordinates[:, :, 0].max())
+        assert c.bounds["lon"] == (c.coordinates[:, :, 1].min(), c.coordinates[:, :, 1].max())
+
+    def test_getsubset_window(self):
+        c = AffineCoordinates(geotransform=GEOTRANSFORM_ROTATED, shape=(5, 6))
+
+        for index in [
+            (slice(1, 3), slice(0, 4)),
+            (slice(None, None, 2), slice(1, None, 3)),
+            (slice(4, 0, -1), slice(2, 3)),
+        ]:
+            s = c[index]
+            assert isinstance(s, AffineCoordinates)
+            np.testing.assert_allclose(s.coordinates, c.coordinates[index])
+
+    def test_select(self):
+        c = AffineCoordinates(geotransform=GEOTRANSFORM_ROTATED, shape=(7, 9))
+        lat, lon = c.coordinates[:, :, 0], c.coordinates[:, :, 1]
+
+        bounds = {"lat": [26.0, 32.0], "lon": [12.0, 18.0]}
+        B = (lat >= 26.0) & (lat <= 32.0) & (lon >= 12.0) & (lon <= 18.0)
+
+        # inner, selected points by (rows, columns), without a full-size mask
+        s, I = c.select(bounds, return_index=True)
+        assert isinstance(I, tuple)
+        np.testing.assert_array_equal(I, np.nonzero(B))
+        np.testing.assert_allclose(s["lat"].coordinates, lat[B])
+        np.testing.assert_allclose(s["lon"].coordinates, lon[B])
+        assert c[I] == s
+
+        # outer, window containing the selected points and their neighbors
+        s, I = c.select(bounds, outer=True, return_index=True)
+        rows, cols = np.where(B)
+        assert I == (slice(rows.min() - 1, rows.max() + 2), slice(cols.min() - 1, cols.max() + 2))
+        assert isinstance(s, AffineCoordinates)
+        np.testing.assert_allclose(s.coordinates, c.coordinates[I])
+
+        # no points within the bounds
+        s, I = c.select({"lat": [25.0, 25.1], "lon": [0.0, 0.1]}, outer=True, return_index=True)
+        assert s.size == 0
+
+    def test_select_coordinates(self):
+        for geotransform in [GEOTRANSFORM_NORTHUP, GEOTRANSFORM_ROTATED]:
+            c = Coordinates([AffineCoordinates(geotransform=geotransform, shape=(7, 9))])
+
+            # full
+            for outer in [False, True]:
+                s, I = c.select({"lat": [-100.0, 100.0], "lon": [-100.0, 100.0]}, outer=outer, return_index=True)
+                assert s == c
+                np.testing.assert_allclose(s["lat_lon"].coordinates, c["lat_lon"].coordinates[I])
+
+            # none
+            for outer in [False, True]:
+                s, I = c.select({"lat": [500.0, 600.0], "lon": [0.0, 1.0]}, outer=outer, return_index=True)
+                assert s.size == 0
+                assert I == (slice(0, 0), slice(0, 0))
+
+        # rotated inner selection, indexing the data with the point index
+        c = Coordinates([AffineCoordinates(geotransform=GEOTRANSFORM_ROTATED, shape=(7, 9))])
+        lat, lon = c["lat_lon"].coordinates[:, :, 0], c["lat_lon"].coordinates[:, :, 1]
+        data = np.arange(63).reshape(7, 9)
+        s, I = c.select({"lat": [26.0, 32.0], "lon": [12.0, 18.0]}, return_index=True)
+        B = (lat >= 26.0) & (lat <= 32.0) & (lon >= 12.0) & (lon <= 18.0)
+        assert len(I) == 2
+        np.testing.assert_array_equal(data[I], data[B])
+        np.testing.assert_allclose(s["lat"].coordinates, lat[B])
+
+
 # class TestRotatedCoordinatesIndexing(object):
 #     def test_get_dim(self):
 #         c = RotatedCoordinates(shape=(3, 4), theta=np.pi / 4, origin=[10, 20], step=[1.0, 2.0], dims=["lat", "lon"])
@@ -374,6 +374,48 @@ class TestArrayCoordinatesInit(object):
         with pytest.raises(tl.TraitError):
             c._set_name("depth")
 
+    def test_new(self):
+        for values in [[], [1.0, 2.0, 4.0], [3.0, 2.0, 1.0], [1.0, 3.0, 2.0], [[1.0, 2.0], [3.0, 4.0]], ["2018-01-01"]]:
+            a = make_coord_array(values)
+            c = ArrayCoordinates1d._new(a, name="lat")
+            c2 = ArrayCoordinates1d(a, name="lat")
+            assert c == c2
+            assert c.properties == c2.properties
+            for name in ["is_monotonic", "is_descending", "is_uniform", "start", "stop", "step"]:
+                assert getattr(c, name) == getattr(c2, name)
+
+        # unnamed, the name can still be set
+        c = ArrayCoordinates1d._new(make_coord_array([1, 2]))
+        assert c.name is None
+        assert c.properties == {}
+        c._set_name("lat")
+        assert c.name == "lat"
+
+    def test_dtype(self):
+        c = ArrayCoordinates1d([[1.0, 2.0], [3.0, 4.0]], name="lat", dtype=np.float32)
+        assert c.coordinates.dtype == np.float32
+        assert c.dtype == float
+        assert c.is_monotonic is None
+
+        # kept by indexing and reshaping
+        assert c[0].coordinates.dtype == np.float32
+        assert c.flatten().coordinates.dtype == np.float32
+        assert c.flatten().reshape((4, 1)).coordinates.dtype == np.float32
+        assert c.copy().coordinates.dtype == np.float32
+
+    def test_astype(self):
+        c = ArrayCoordinates1d([1.0, 2.0, 4.0], name="lat")
+        c32 = c.astype(np.float32)
+        assert c32.coordinates.dtype == np.float32
+        assert c32.name == "lat"
+        assert c32.is_monotonic
+        assert c32.astype(np.float32) is c32
+        assert c32.astype(np.float64).coordinates.dtype == np.float64
+
+        # datetimes are unchanged
+        c = ArrayCoordinates1d(["2018-01-01", "2018-01-02"])
+        assert c.astype(np.float32) is c
+
 
 class TestArrayCoordinatesEq(object):
     def test_eq_type(self):
@@ -472,6 +514,15 @@ class TestArrayCoordinatesSerialization(object):
         c2 = ArrayCoordinates1d.from_definition(d)  # test from_definition
         assert c2 == c
 
+    def test_definition_dtype(self):
+        c = ArrayCoordinates1d([0.1, 1, 2], name="lat", dtype=np.float32)
+
+        # encoded values keep the dtype
+        d = json.loads(json.dumps(c.definition, cls=podpac.core.utils.CompactJSONEncoder))
+        c2 = ArrayCoordinates1d.from_definition(d)
+        assert c2.coordinates.dtype == np.float32
+        assert c2 == c
+
     def test_definition_shaped(self):
         # numerical
         c = ArrayCoordinates1d([[0, 1, 2], [3, 4, 5]], name="lat")
@@ -1124,6 +1175,81 @@ class TestArrayCoordinatesSelection(object):
         assert_equal(s.coordinates, [])
         assert_equal(c.coordinates[I], [])
 
+    def test_select_index_type(self):
+        # monotonic coordinates are selected with a slice
+        c = ArrayCoordinates1d([10.0, 20.0, 40.0, 50.0, 60.0, 90.0])
+        s, I = c.select([30.0, 55.0], return_index=True)
+        assert I == slice(2, 4)
+
+        c = ArrayCoordinates1d([90.0, 60.0, 50.0, 40.0, 20.0, 10.0])
+        s, I = c.select([30.0, 55.0], outer=True, return_index=True)
+        assert I == slice(1, 5)
+
+        # non-monotonic coordinates are selected with sorted integer indices
+        c = ArrayCoordinates1d([20.0, 50.0, 60.0, 90.0, 40.0, 10.0])
+        s, I = c.select([30.0, 55.0], return_index=True)
+        assert_equal(I, [1, 4])
+
+    def test_select_nonmonotonic_duplicates_nan(self):
+        c = ArrayCoordinates1d([20.0, 50.0, np.nan, 60.0, 20.0, 90.0, 50.0, 10.0])
+
+        s, I = c.select([30.0, 55.0], return_index=True)
+        assert_equal(I, [1, 6])
+
+        # outer selections include every coordinate equal to the nearest coordinates outside of the bounds
+        s, I = c.select([30.0, 55.0], outer=True, return_index=True)
+        assert_equal(I, [0, 1, 3, 4, 6])
+
+    def test_select_nan(self):
+        # monotonic apart from the nan
+        c = ArrayCoordinates1d([1.0, 2.0, np.nan, 4.0, 5.0])
+        assert not c.is_monotonic
+
+        s, I = c.select([1.5, 4.5], return_index=True)
+        assert_equal(I, [1, 3])
+        assert_equal(s.coordinates, [2.0, 4.0])
+
+        s, I = c.select([1.5, 4.5], outer=True, return_index=True)
+        assert_equal(I, [0, 1, 3, 4])
+
+        s, I = c.select([0.0, 6.0], return_index=True)
+        assert_equal(I, [0, 1, 3, 4])
+
+        # nonmonotonic
+        c = ArrayCoordinates1d([1.0, np.nan, 3.0, 2.0, 5.0])
+
+        s, I = c.select([1.5, 3.5], return_index=True)
+        assert_equal(I, [2, 3])
+        assert_equal(s.coordinates, [3.0, 2.0])
+
+        s, I = c.select([1.5, 3.5], outer=True, return_index=True)
+        assert_equal(I, [0, 2, 3, 4])
+
+        # datetimes
+        c = ArrayCoordinates1d(["2018-01-01", "2018-01-02", "NaT", "2018-01-04"])
+        s, I = c.select(["2018-01-01T12", "2018-01-05"], return_index=True)
+        assert_equal(I, [1, 3])
+
+        s, I = c.select(["2018-01-01T12", "2018-01-05"], outer=True, return_index=True)
+        assert_equal(I, [0, 1, 3])
+
+    def test_select_random(self):
+        np.random.seed(0)
+        values = np.round(np.random.uniform(0, 100, 1000))
+        for x in [values, np.unique(values), np.unique(values)[::-1]]:
+            c = ArrayCoordinates1d(x)
+            for lo, hi in np.random.uniform(-10, 110, (20, 2)):
+                s, I = c.select([lo, hi], return_index=True)
+                assert_equal(c.coordinates[I], x[(x >= lo) & (x <= hi)])
+
+                s, I = c.select([lo, hi], outer=True, return_index=True)
+                olo = x[x <= lo].max() if np.any(x <= lo) else -np.inf
+                ohi = x[x >= hi].min() if np.any(x >= hi) else np.inf
+                if x.max() < lo or x.min() > hi:
+                    assert s.size == 0
+                else:
+                    assert_equal(c.coordinates[I], x[(x >= olo) & (x <= ohi)])
+
 
 class TestArrayCoordinatesMethods(object):
     def test_unique(self):
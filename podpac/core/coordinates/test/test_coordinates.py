@@ -291,6 +291,19 @@ class TestCoordinateCreation(object):
         with pytest.raises(TypeError, match="Invalid coords"):
             Coordinates({"lat": lat, "lon": lon})
 
+    def test_new(self):
+        c = Coordinates([[[0, 1, 2], [10, 20, 30]], clinspace(0, 1, 5)], dims=["lat_lon", "alt"], crs="EPSG:4979")
+        c2 = Coordinates._new(list(c.values()), c.crs)
+        assert c2 == c
+        assert c2.dims == c.dims
+        assert c2.crs == c.crs
+        assert c2.hash == c.hash
+
+        # internal methods return the same coordinates as the validated constructor
+        assert c[1:, 1:] == Coordinates([c["lat_lon"][1:], c["alt"][1:]], crs=c.crs)
+        assert c.transpose() == Coordinates([c["alt"], c["lat_lon"]], crs=c.crs)
+        assert c.drop("alt") == Coordinates([c["lat_lon"]], crs=c.crs)
+
     def test_base_coordinates(self):
         lat = [0, 1, 2]
         lon = [10, 20, 30]
@@ -701,6 +714,33 @@ class TestCoordinatesSerialization(object):
         c2 = Coordinates.from_json(s)
         assert c2 == c
 
+    def test_compact_json(self):
+        lat = np.random.random(1000)
+        lon = np.random.random(1000)
+        c = Coordinates(
+            [[lat, lon], ["2018-01-01", "2018-01-02"], crange(0, 10, 0.5)],
+            dims=["lat_lon", "time", "alt"],
+            crs="+proj=merc +vunits=us-ft",
+        )
+
+        s = c.compact_json
+        assert len(s) < len(c.json)
+        c2 = Coordinates.from_json(s)
+        assert c2 == c
+        assert_array_equal(c2["lat"].coordinates, lat)
+        assert_array_equal(c2["time"].coordinates, c["time"].coordinates)
+
+        # shaped
+        c = Coordinates([[lat.reshape(20, 50), lon.reshape(20, 50)]], dims=["lat_lon"])
+        c2 = Coordinates.from_json(c.compact_json)
+        assert c2 == c
+
+        # reduced precision
+        c = c.astype(np.float32)
+        c2 = Coordinates.from_json(c.compact_json)
+        assert c2["lat"].coordinates.dtype == np.float32
+        assert c2 == c
+
 
 class TestCoordinatesProperties(object):
     def test_xarray_coords(self):
@@ -1233,6 +1273,40 @@ class TestCoordinatesMethods(object):
             assert len(slices) == 3
             assert all(isinstance(slc, slice) for slc in slices)
 
+    def test_iterchunks_halo(self):
+        c = Coordinates([clinspace(0, 9, 10), clinspace(0, 4, 5)], dims=["lat", "lon"])
+
+        chunks = list(c.iterchunks(shape=(4, 5), halo={"lat": 1}))
+        assert len(chunks) == 3
+        assert [chunk.shape for chunk, interior in chunks] == [(5, 5), (6, 5), (3, 5)]
+        assert [interior[0] for chunk, interior in chunks] == [slice(0, 4), slice(1, 5), slice(1, 3)]
+
+        for chunk, slices, interior in c.iterchunks(shape=(4, 5), return_slices=True, halo={"lat": 1}):
+            assert chunk[interior] == c[slices]
+
+    def test_iterchunks_grid(self):
+        c = Coordinates([clinspace(1, 10, 10), clinspace(0, 4, 5)], dims=["lat", "lon"])
+
+        # storage blocks [0.5, 3.5), [3.5, 6.5), [6.5, 9.5), [9.5, 12.5)
+        grid = {"lat": (0.5, 3)}
+        slices = [s[0] for chunk, s in c.iterchunks(shape=(3, 5), return_slices=True, grid=grid)]
+        assert slices == [slice(0, 3), slice(3, 6), slice(6, 9), slice(9, 10)]
+
+        slices = [s[0] for chunk, s in c.iterchunks(shape=(4, 5), return_slices=True, grid=grid)]
+        assert slices == [slice(0, 3), slice(3, 6), slice(6, 10)]
+
+        slices = [s[0] for chunk, s in c.iterchunks(shape=(7, 5), return_slices=True, grid=grid)]
+        assert slices == [slice(0, 6), slice(6, 10)]
+
+        # blocks larger than the chunk shape are split
+        slices = [s[0] for chunk, s in c.iterchunks(shape=(2, 5), return_slices=True, grid=grid)]
+        assert slices == [slice(0, 2), slice(2, 3), slice(3, 5), slice(5, 6), slice(6, 8), slice(8, 9), slice(9, 10)]
+
+        # descending coordinates
+        c = Coordinates([clinspace(10, 1, 10), clinspace(0, 4, 5)], dims=["lat", "lon"])
+        slices = [s[0] for chunk, s in c.iterchunks(shape=(4, 5), return_slices=True, grid=grid)]
+        assert slices == [slice(0, 4), slice(4, 7), slice(7, 10)]
+
     def test_iterchunks_properties(self):
         c = Coordinates(
             [clinspace(0, 1, 100), clinspace(0, 1, 200), ["2018-01-01", "2018-01-02"]],
@@ -1271,6 +1345,88 @@ class TestCoordinatesMethods(object):
         with pytest.raises(ValueError, match="Invalid transpose dimensions"):
             c.transpose("lat", "lon", "alt")
 
+    def test_astype(self):
+        lat = np.linspace(0, 1, 12)
+        lon = np.linspace(10, 20, 12)
+        c = Coordinates([[lat, lon], ["2018-01-01", "2018-01-02"], clinspace(0, 1, 5)], dims=["lat_lon", "time", "alt"])
+
+        c32 = c.astype(np.float32)
+        assert c32.dims == c.dims
+        assert c32["lat"].coordinates.dtype == np.float32
+        assert c32["lon"].coordinates.dtype == np.float32
+        assert c32["time"] == c["time"]
+        assert c32["alt"] == c["alt"]
+        assert c32.hash != c.hash
+
+        # kept by selection
+        s = c32.select({"lat": [0.2, 0.6]})
+        assert s["lat"].size == 4
+        assert s["lat"].coordinates.dtype == np.float32
+
+    def test_memoized_derived(self):
+        c = Coordinates([[0, 1], [10, 20], ["2018-01-01", "2018-01-02"]], dims=["lat", "lon", "time"])
+
+        # memoized
+        t = c.transpose("lon", "lat", "time")
+        assert c.transpose("lon", "lat", "time") == t
+        assert c.transpose("lon", "lat", "time").__dict__["_podpac_cached_property_hash"] == t.hash
+        assert c.transpose("lon", "lat", "time").simplify() is t.simplify()
+        assert c.transpose("time", "lat", "lon") != t
+        assert c.simplify() is c.simplify()
+        assert c.drop("time") == c.drop("time")
+
+        # transposed and dropped coordinates are new instances, in-place changes do not affect the other callers
+        t2 = c.transpose("lon", "lat", "time")
+        assert t2 is not t
+        t.transpose("lat", "lon", "time", in_place=True)
+        assert t2.dims == ("lon", "lat", "time")
+        assert c.transpose("lon", "lat", "time").dims == ("lon", "lat", "time")
+
+        d = c.drop("time")
+        d["lat"] = [2, 3]
+        assert c.drop("time")["lat"].coordinates[0] == 0
+        assert c.drop("time").hash != d.hash
+
+        # recomputed after the shared simplified coordinates are modified in place
+        s = c.simplify()
+        s.transpose("time", "lon", "lat", in_place=True)
+        assert c.simplify() is not s
+        assert c.simplify().dims == ("lat", "lon", "time")
+
+        # cleared after the coordinates are modified in place
+        h = c.hash
+        b = c.bounds
+        c.transpose("lon", "lat", "time", in_place=True)
+        assert c.transpose("lon", "lat", "time") is not t2
+        assert c.hash != h
+
+        c["lat"] = [2, 3]
+        assert c.bounds["lat"][0] == 2
+        assert b["lat"][0] == 0
+
+        del c["time"]
+        assert c.drop("lat").dims == ("lon",)
+
+        # returned dicts are copies
+        c.xcoords["other"] = 1
+        c.bounds["lat"] = None
+        assert "other" not in c.xcoords
+        assert c.bounds["lat"] is not None
+
+    def test_intern(self):
+        c1 = Coordinates([[0, 1], [10, 20]], dims=["lat", "lon"])
+        c2 = Coordinates([[0, 1], [10, 20]], dims=["lat", "lon"])
+        c3 = Coordinates([[0, 1], [10, 30]], dims=["lat", "lon"])
+
+        assert c1 is not c2
+        assert c1.intern() is c1
+        assert c2.intern() is c1
+        assert c3.intern() is c3
+
+        # the canonical instance was modified in place
+        c1["lon"] = [10, 30]
+        assert c2.intern() is c2
+
     def test_transpose_stacked_shaped(self):
         lat = np.linspace(0, 1, 12).reshape((3, 4))
         lon = np.linspace(10, 20, 12).reshape((3, 4))
@@ -2142,6 +2298,23 @@ class TestCoordinatesMethodTransform(object):
         c2 = c1.transform("EPSG:4326")
         assert c2.shape == c1.shape
 
+    def test_transform_chunked(self):
+        # non-separable grid transform, in small chunks and multithreaded
+        c = Coordinates([clinspace(40, 50, 21, "lat"), clinspace(-100, -90, 31, "lon")], crs="EPSG:4326")
+        expected = c.transform("EPSG:32615")
+        assert expected.dims == ("lat_lon",)
+
+        with podpac.settings:
+            podpac.settings["TRANSFORM_CHUNK_SIZE"] = 50
+            t = c.transform("EPSG:32615")
+            podpac.settings["MULTITHREADING"] = True
+            podpac.settings["N_THREADS"] = 4
+            tm = c.transform("EPSG:32615")
+
+        for d in ["lat", "lon"]:
+            assert_array_equal(t[d].coordinates, expected[d].coordinates)
+            assert_array_equal(tm[d].coordinates, expected[d].coordinates)
+
 
 class TestCoordinatesMethodSimplify(object):
     def test_simplify_array_to_uniform(self):
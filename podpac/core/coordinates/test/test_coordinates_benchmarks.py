@@ -0,0 +1,89 @@
+"""
+Coordinates microbenchmarks.
+
+The benchmarks are skipped by default, run them with::
+
+    pytest podpac/core/coordinates/test/test_coordinates_benchmarks.py --benchmark -s
+"""
+
+import timeit
+
+import pytest
+import numpy as np
+
+from podpac.core.coordinates.array_coordinates1d import ArrayCoordinates1d
+from podpac.core.coordinates.uniform_coordinates1d import UniformCoordinates1d
+from podpac.core.coordinates.stacked_coordinates import StackedCoordinates
+from podpac.core.coordinates.coordinates import Coordinates
+from podpac.core.coordinates.cfunctions import clinspace
+
+
+def _report(name, f, number=1000):
+    t = min(timeit.repeat(f, number=number, repeat=3)) / number
+    print("%-40s %10.1f us" % (name, t * 1e6))
+    return t
+
+
+@pytest.mark.benchmark
+class TestCoordinatesBenchmarks(object):
+    def setup_method(self):
+        self.grid = Coordinates(
+            [clinspace(0, 1, 1000, "lat"), clinspace(0, 1, 1000, "lon"), ["2018-01-01", "2018-01-02"]],
+            dims=["lat", "lon", "time"],
+        )
+        self.points = Coordinates([[np.random.random(10000), np.random.random(10000)]], dims=["lat_lon"])
+        print("")
+
+    def test_construct(self):
+        cs = list(self.grid.values())
+        _report("Coordinates(...)", lambda: Coordinates(cs, crs=self.grid.crs, validate_crs=False))
+        _report("Coordinates._new(...)", lambda: Coordinates._new(cs, self.grid.crs))
+
+        a = np.linspace(0, 1, 100)
+        _report("ArrayCoordinates1d(...)", lambda: ArrayCoordinates1d(a, name="lat"))
+        _report("ArrayCoordinates1d._new(...)", lambda: ArrayCoordinates1d._new(a, name="lat"))
+        _report("UniformCoordinates1d(...)", lambda: UniformCoordinates1d(0, 1, size=100, name="lat"))
+        _report("UniformCoordinates1d._new(...)", lambda: UniformCoordinates1d._new(0.0, 1.0, 0.01, name="lat"))
+
+    def test_getitem(self):
+        _report("grid[:10, :10]", lambda: self.grid[:10, :10])
+        _report("grid[[1, 3, 5]]", lambda: self.grid[[1, 3, 5]])
+        _report("points[:10]", lambda: self.points[:10])
+
+    def test_select(self):
+        bounds = {"lat": [0.2, 0.4], "lon": [0.5, 0.6]}
+        _report("grid.select", lambda: self.grid.select(bounds))
+        _report("grid.select outer", lambda: self.grid.select(bounds, outer=True))
+        _report("points.select", lambda: self.points.select(bounds))
+
+    def test_transpose(self):
+        _report("grid.transpose()", lambda: self.grid.transpose())
+        _report("points.transpose('lon_lat')", lambda: self.points.transpose("lon_lat"))
+        _report("grid.drop('time')", lambda: self.grid.drop("time"))
+        _report("points.udrop('lat')", lambda: self.points.udrop("lat"))
+
+    def test_derived(self):
+        # standardized cache coordinates, as in Node.eval
+        dims = sorted(self.grid.dims)
+        _report("grid.transpose(sorted).simplify().hash", lambda: self.grid.transpose(*dims).simplify().hash)
+        _report("grid.bounds", lambda: self.grid.bounds)
+        _report("grid.xcoords", lambda: self.grid.xcoords)
+
+        def cold():
+            self.grid._clear_cache()
+            return self.grid.transpose(*dims).simplify().hash
+
+        _report("... (cold)", cold, number=10)
+
+    def test_iterchunks(self):
+        _report("grid.iterchunks (200 chunks)", lambda: list(self.grid.iterchunks((100, 100, 1))), number=10)
+
+    def test_hash(self):
+        def cold_hash():
+            self.grid.__dict__.pop("_podpac_cached_property_hash", None)
+            return self.grid.hash
+
+        _report("grid.hash (cold)", cold_hash)
+        _report("grid.hash (cached)", lambda: self.grid.hash)
+        other = self.grid[:, :]
+        _report("grid == other", lambda: self.grid == other)
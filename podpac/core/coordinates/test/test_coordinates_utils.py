@@ -7,10 +7,13 @@ import numpy as np
 import pandas as pd
 import pyproj
 
+import podpac
+
 from podpac.core.coordinates.utils import get_timedelta, get_timedelta_unit, make_timedelta_string
 from podpac.core.coordinates.utils import make_coord_value, make_coord_delta, make_coord_array, make_coord_delta_array
 from podpac.core.coordinates.utils import add_coord, divide_delta, divide_timedelta, timedelta_divisible
 from podpac.core.coordinates.utils import has_alt_units, lower_precision_time_bounds, higher_precision_time_bounds
+from podpac.core.coordinates.utils import transform_coordinates, is_separable
 
 
 def test_get_timedelta():
@@ -158,6 +161,15 @@ class TestMakeCoordArray(object):
         np.testing.assert_array_equal(make_coord_array(a), a)
         np.testing.assert_array_equal(make_coord_array(np.array(a)), a)
 
+    def test_numerical_dtype(self):
+        assert make_coord_array(np.array([5, 5.5], dtype=np.float32)).dtype == np.float64
+        assert make_coord_array([5, 5.5], dtype=np.float32).dtype == np.float32
+        assert make_coord_array(np.array([5, 5.5]), dtype=np.float32).dtype == np.float32
+        assert make_coord_array(["2018-01-01"], dtype=np.float32).dtype == np.dtype("datetime64[D]")
+
+        with pytest.raises(TypeError, match="Invalid coordinates dtype"):
+            make_coord_array([5, 5.5], dtype=int)
+
     def test_date_singleton(self):
         a = np.array(["2018-01-01"]).astype(np.datetime64)
         s = "2018-01-01"
@@ -577,3 +589,40 @@ def test_higher_precision_time_bounds():
     assert a1 == [np.datetime64("2020-01-01"), np.datetime64("2020-01-02")]
     assert a1[0].dtype == "<M8[D]"
     assert a1[1].dtype == "<M8[D]"
+
+
+def test_transform_coordinates():
+    transformer = pyproj.Transformer.from_crs("EPSG:4326", "EPSG:32615", always_xy=True)
+    lon = np.linspace(-100, -90, 13)[np.newaxis, :]
+    lat = np.linspace(40, 50, 11)[:, np.newaxis]
+    ex, ey = transformer.transform(*np.broadcast_arrays(lon, lat))
+
+    x, y = transform_coordinates(transformer, lon, lat)
+    np.testing.assert_array_equal(x, ex)
+    np.testing.assert_array_equal(y, ey)
+
+    with podpac.settings:
+        podpac.settings["TRANSFORM_CHUNK_SIZE"] = 20
+        podpac.settings["MULTITHREADING"] = True
+        podpac.settings["N_THREADS"] = 3
+        x, y = transform_coordinates(transformer, lon, lat)
+    np.testing.assert_array_equal(x, ex)
+    np.testing.assert_array_equal(y, ey)
+
+    # scalars are broadcast
+    x, y = transform_coordinates(transformer, -95.0, lat[:, 0])
+    assert x.shape == (11,)
+    np.testing.assert_array_equal(y, ey[:, 6])
+
+
+def test_is_separable():
+    tlat, tlon = np.meshgrid(np.arange(5.0), np.arange(7.0), indexing="ij")
+    assert is_separable(tlat, tlon)
+    assert not is_separable(tlat + tlon, tlon)
+    assert not is_separable(tlat, tlon + tlat)
+
+    with podpac.settings:
+        podpac.settings["TRANSFORM_CHUNK_SIZE"] = 7
+        assert is_separable(tlat, tlon)
+        tlon[4, 3] += 1
+        assert not is_separable(tlat, tlon)
@@ -681,6 +681,41 @@ class TestStackedCoordinatesSelection(object):
         assert s == c[I]
         assert s == c[E0, E1]
 
+    def test_select_nonmonotonic(self):
+        lat = ArrayCoordinates1d([3, 1, 4, 1, 5, 9, 2, 6], name="lat")
+        lon = ArrayCoordinates1d([10, 20, 30, 40, 50, 60, 70, 80], name="lon")
+        c = StackedCoordinates([lat, lon])
+
+        s, I = c.select({"lat": [1, 4], "lon": [15, 75]}, return_index=True)
+        assert_equal(I, [1, 2, 3, 6])
+        assert s == c[I]
+
+        s, I = c.select({"lat": [1.5, 3.5], "lon": [15, 75]}, outer=True, return_index=True)
+        assert_equal(I, [0, 1, 2, 3, 6])
+        assert s == c[I]
+
+    def test_select_grid_index(self):
+        np.random.seed(0)
+        lat = np.round(np.random.uniform(-90, 90, 5000), 1)
+        lon = np.round(np.random.uniform(-180, 180, 5000), 1)
+        lat[10] = np.nan
+        c = StackedCoordinates([lat, lon], dims=["lat", "lon"])
+
+        for outer in [False, True]:
+            for lat_bounds, lon_bounds in [([10, 20], [-30, 30]), ([-100, -89], [0, 0.5]), ([20, 10], [0, 10])]:
+                bounds = {"lat": lat_bounds, "lon": lon_bounds}
+                s, I = c.select(bounds, outer=outer, return_index=True)
+
+                # AND of the selection in each dimension
+                Ilat = c["lat"].select(bounds, outer=outer, return_index=True)[1]
+                Ilon = c["lon"].select(bounds, outer=outer, return_index=True)[1]
+                expected = np.intersect1d(np.arange(c.size)[Ilat], np.arange(c.size)[Ilon])
+                assert_equal(np.arange(c.size)[I], expected)
+                assert s == c[expected]
+
+        # the grid index is reused
+        assert c._grid_indices[("lat", "lon")] is c._get_grid_index([c["lat"], c["lon"]])
+
 
 class TestStackedCoordinatesMethods(object):
     def test_transpose(self):
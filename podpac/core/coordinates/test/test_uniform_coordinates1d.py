@@ -499,6 +499,25 @@ class TestUniformCoordinatesCreation(object):
         with pytest.raises(TypeError):
             UniformCoordinates1d("2018-01-10", "2018-01-01", size="1,D")
 
+    def test_new(self):
+        for args in [
+            (0, 50, 10),
+            (50, 0, -10),
+            (0, 49.9, 10),
+            (0.1, 0.7, 0.1),
+            ("2018-01-01", "2018-01-10", "1,D"),
+            ("2018-01-31", "2019-06-01", "1,M"),
+            ("2018-01-01", "2022-06-01", "1,Y"),
+        ]:
+            c = UniformCoordinates1d._new(*args, name="time")
+            c2 = UniformCoordinates1d(*args, name="time")
+            assert c.start == c2.start
+            assert c.stop == c2.stop
+            assert c.step == c2.step
+            assert c.dtype == c2.dtype
+            assert c.properties == c2.properties
+            assert_equal(c.coordinates, c2.coordinates)
+
 
 class TestUniformCoordinatesEq(object):
     def test_equal(self):
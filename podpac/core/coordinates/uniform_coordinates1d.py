@@ -141,6 +141,18 @@ class UniformCoordinates1d(Coordinates1d):
         # set common properties
         super(UniformCoordinates1d, self).__init__(name=name)
 
+    @classmethod
+    def _new(cls, start, stop, step, name=None):
+        obj = super(UniformCoordinates1d, cls)._new(
+            name=name, start=make_coord_value(start), stop=make_coord_value(stop), step=make_coord_delta(step)
+        )
+
+        # same stop and step consistency as the constructor
+        obj._trait_values["stop"] = add_coord(obj.start, (obj.size - 1) * obj.step)
+        if isinstance(obj.step, float) and obj.size > 1:
+            obj._trait_values["step"] = divide_delta(obj.stop - obj.start, obj.size - 1)
+        return obj
+
     def __eq__(self, other):
         if not self._eq_base(other):
             return False
@@ -241,7 +253,7 @@ class UniformCoordinates1d(Coordinates1d):
             # The following 3 lines is copied from ArrayCoordinates1d.__getitem__
             if self.ndim == 1 and np.ndim(index) > 1 and np.array(index).dtype == int:
                 index = np.array(index).flatten().tolist()
-            return ArrayCoordinates1d(self.coordinates[index], **self.properties)
+            return ArrayCoordinates1d._new(np.atleast_1d(self.coordinates[index]), name=self.name)
 
         # start, stop, step
         if index.start is None:
@@ -270,7 +282,7 @@ class UniformCoordinates1d(Coordinates1d):
             (start < stop) and np.array(step).astype(float) < 0
         ):
             return ArrayCoordinates1d([], **self.properties)
-        return UniformCoordinates1d(start, stop, step, **self.properties)
+        return UniformCoordinates1d._new(start, stop, step, name=self.name)
 
     def __contains__(self, item):
         # overrides the Coordinates1d.__contains__ method with optimizations for uniform coordinates.
@@ -315,7 +327,7 @@ class UniformCoordinates1d(Coordinates1d):
     def size(self):
         """Number of coordinates."""
 
-        dname = np.array(self.step).dtype.name
+        dname = self.step.dtype.name if isinstance(self.step, np.timedelta64) else None
 
         if dname == "timedelta64[Y]":
             dyear = self.stop.item().year - self.start.item().year
@@ -2,7 +2,7 @@
 Utilities functions for handling podpac coordinates.
 
 .. testsetup:: podpac.core.coordinates.utils
-    
+
     import numpy as np
     from podpac.core.coordinates.utils import *
 """
@@ -22,6 +22,8 @@ import pyproj
 from geopy.distance import geodesic
 
 import podpac
+from podpac.core.settings import settings
+from podpac.core.managers.multi_threading import thread_manager
 
 
 def get_timedelta(s):
@@ -231,7 +233,7 @@ def make_coord_delta(val):
     return val
 
 
-def make_coord_array(values):
+def make_coord_array(values, dtype=float):
     """
     Make an array of podpac coordinate values by casting to the correct type.
 
@@ -239,6 +241,9 @@ def make_coord_array(values):
     ----------
     values : array-like
         Input coordinates.
+    dtype : dtype, optional
+        Floating point dtype for numerical coordinates, e.g. ``np.float32`` to halve the memory of large coordinates.
+        Default ``float``.
 
     Returns
     -------
@@ -249,16 +254,19 @@ def make_coord_array(values):
     -----
      * all of the values must be of the same type
      * strings and datetimes are converted to numpy datetime64
-     * numbers are converted to floats
+     * numbers are converted to floats (of the given dtype)
     """
 
+    if not np.issubdtype(dtype, np.floating):
+        raise TypeError("Invalid coordinates dtype '%s' (must be a floating point dtype)" % np.dtype(dtype))
+
     a = np.atleast_1d(values)
 
-    if a.dtype == float or np.issubdtype(a.dtype, np.datetime64):
+    if a.dtype == dtype or np.issubdtype(a.dtype, np.datetime64):
         pass
 
     elif np.issubdtype(a.dtype, np.number):
-        a = a.astype(float)
+        a = a.astype(dtype)
 
     else:
         a = np.array([make_coord_value(e) for e in np.atleast_1d(np.array(values, dtype=object)).flatten()]).reshape(
@@ -637,3 +645,83 @@ def calculate_distance(point1, point2, ellipsoid_tuple, coordinate_name, units="
             return (geodesic(point1, point2, ellipsoid=ellipsoid_tuple).m) * podpac.units("metre").to(
                 podpac.units(units)
             )
+
+
+def _transform_slices(shape):
+    """Slices along the first axis with at most ``settings["TRANSFORM_CHUNK_SIZE"]`` points each."""
+
+    n = max(1, int(np.prod(shape[1:])))
+    step = max(1, settings["TRANSFORM_CHUNK_SIZE"] // n)
+    return [slice(i, i + step) for i in range(0, shape[0], step)]
+
+
+def transform_coordinates(transformer, *values):
+    """
+    Transform coordinate values using a pyproj transformer, in chunks.
+
+    The values are broadcast together and transformed in chunks of at most ``settings["TRANSFORM_CHUNK_SIZE"]``
+    points, so that the inputs (e.g. a grid from broadcast lat and lon vectors) are only materialized one chunk at a
+    time. The chunks are transformed in a thread pool when ``settings["MULTITHREADING"]`` is True (pyproj releases the
+    GIL during the transform). Transformers are only thread-safe in pyproj 3.1 and later, so older versions always
+    transform the chunks sequentially.
+
+    Parameters
+    ----------
+    transformer : pyproj.Transformer
+        Transformer, e.g. from :meth:`pyproj.Transformer.from_proj`.
+    *values : array-like
+        Coordinate values for each input of the transformer (x, y, and optionally z).
+
+    Returns
+    -------
+    transformed : tuple
+        Transformed coordinate values for each input, with the broadcast shape.
+    """
+
+    values = np.broadcast_arrays(*[np.atleast_1d(v) for v in values])
+    outputs = [np.empty(v.shape) for v in values]
+    slices = _transform_slices(values[0].shape)
+
+    def f(s):
+        for output, t in zip(outputs, transformer.transform(*[v[s] for v in values])):
+            output[s] = t
+
+    threadsafe = tuple(int(v) for v in pyproj.__version__.split(".")[:2]) >= (3, 1)
+    n_threads = thread_manager.request_n_threads(len(slices)) if settings["MULTITHREADING"] and threadsafe else 0
+    if n_threads <= 1:
+        thread_manager.release_n_threads(n_threads)
+        for s in slices:
+            f(s)
+        return tuple(outputs)
+
+    pool = thread_manager.get_thread_pool(processes=n_threads)
+    try:
+        pool.map(f, slices)
+    finally:
+        pool.close()
+        thread_manager.release_n_threads(n_threads)
+
+    return tuple(outputs)
+
+
+def is_separable(tlat, tlon):
+    """
+    Check if transformed 2d grid coordinates are still a grid, i.e. if the lat values are constant along the rows and
+    the lon values are constant along the columns.
+
+    The check is vectorized and done in chunks of rows, stopping at the first chunk that is not separable.
+
+    Parameters
+    ----------
+    tlat, tlon : np.ndarray
+        2d transformed lat and lon coordinates
+
+    Returns
+    -------
+    bool
+        True if the lat values only depend on the row and the lon values only depend on the column.
+    """
+
+    return all(
+        np.allclose(tlat[s], tlat[s, :1]) and np.allclose(tlon[s], tlon[:1]) for s in _transform_slices(tlat.shape)
+    )
@@ -8,8 +8,10 @@ including user defined data sources.
 from __future__ import division, unicode_literals, print_function, absolute_import
 from collections import OrderedDict
 from copy import deepcopy
+import itertools
 import warnings
 import logging
+import threading
 
 import numpy as np
 import xarray as xr
@@ -18,7 +20,7 @@ import traitlets as tl
 # Internal imports
 from podpac.core.settings import settings
 from podpac.core.units import UnitsDataArray
-from podpac.core.coordinates import Coordinates, Coordinates1d, StackedCoordinates
+from podpac.core.coordinates import Coordinates, Coordinates1d, StackedCoordinates, UniformCoordinates1d
 from podpac.core.coordinates.utils import VALID_DIMENSION_NAMES, make_coord_delta, make_coord_delta_array
 from podpac.core.node import Node
 from podpac.core.utils import common_doc, cached_property
@@ -26,6 +28,8 @@ from podpac.core.node import COMMON_NODE_DOC
 
 log = logging.getLogger(__name__)
 
+_THREAD_LOCAL_LOCK = threading.Lock()
+
 DATA_DOC = {
     "coordinates": "The coordinates of the data source.",
     "get_data": """
@@ -139,6 +143,17 @@ class DataSource(Node):
     coordinate_index_type : str, optional
         Type of index to use for data source. Possible values are ``['slice', 'numpy', 'xarray']``
         Default is 'numpy', which allows a tuple of integer indices.
+    sparse_read : bool, optional
+        Only used when ``coordinate_index_type`` is 'slice'. If True, sparse selections are read as a set of small
+        windows (one ``get_data`` call per window) instead of a single window spanning the whole selection. The
+        windows keep the step of the selected indices, so strided selections are still read as a single stepped
+        window. Default False; data sources that read efficiently by window enable it.
+    sparse_read_max_blocks : int, optional
+        Maximum number of windows for a sparse read. Nearby selected indices are grouped into the same window until
+        the number of windows is below this limit. Default 64.
+    sparse_read_max_fill : float, optional
+        Sparse selections are only read as multiple windows if the selected indices fill less than this fraction of
+        the (stepped) window spanning the whole selection. Default 0.25.
     cache_coordinates : bool
         Whether to cache coordinates using the podpac ``cache_ctrl``. Default False.
     cache_output : bool
@@ -159,6 +174,9 @@ class DataSource(Node):
         ["slice", "numpy", "xarray"],
         default_value="numpy",
     ).tag(attr=True)
+    sparse_read = tl.Bool(False)
+    sparse_read_max_blocks = tl.Int(64)
+    sparse_read_max_fill = tl.Float(0.25)
     cache_coordinates = tl.Bool(False)
     cache_output = tl.Bool()
 
@@ -240,6 +258,65 @@ class DataSource(Node):
         """datasource crs."""
         return self.coordinates.crs
 
+    @property
+    def storage_chunks(self):
+        """native storage chunk shape of the source data, as a dictionary of sizes by dim, or None if unknown."""
+        return None
+
+    def get_storage_grid(self, coordinates):
+        """
+        Storage chunk grid of the source data, to snap the edges of requested coordinates chunks to.
+
+        Parameters
+        ----------
+        coordinates : :class:`podpac.Coordinates`
+            Requested coordinates.
+
+        Returns
+        -------
+        grid : dict
+            Storage grid ``(origin, length)`` by dim, in coordinate units, see :meth:`podpac.Coordinates.iterchunks`.
+            Only contains the numerical uniform source dims with known storage chunks that are also requested.
+        """
+
+        if not self.storage_chunks or coordinates.crs.lower() != self.coordinates.crs.lower():
+            return {}
+
+        grid = {}
+        for dim, n in self.storage_chunks.items():
+            if dim not in coordinates.dims or dim not in self.coordinates.dims:
+                continue
+            src = self.coordinates[dim]
+            if not isinstance(src, UniformCoordinates1d) or src.dtype != float:
+                continue
+            grid[dim] = (src.start - src.step / 2.0, n * src.step)
+        return grid
+
+    @property
+    def _thread_local(self):
+        # per-node thread-local state, so that the same node can be evaluated concurrently (e.g. in chunks)
+        try:
+            return self.__dict__["_thread_local_state"]
+        except KeyError:
+            with _THREAD_LOCAL_LOCK:
+                return self.__dict__.setdefault("_thread_local_state", threading.local())
+
+    def __getstate__(self):
+        # the thread-local state cannot be pickled or copied, and is recreated on first use
+        state = super(DataSource, self).__getstate__()
+        state.pop("_thread_local_state", None)
+        return state
+
+    @property
+    def _sparse_read(self):
+        """whether selections are requested as numpy indices and read as a set of windows"""
+        # shaped (nD stacked) coordinates are not supported
+        return (
+            self.sparse_read
+            and self.coordinate_index_type == "slice"
+            and len(self.coordinates.shape) == len(self.coordinates.dims)
+        )
+
     # ------------------------------------------------------------------------------------------------------------------
     # Private Methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -261,7 +338,14 @@ class DataSource(Node):
 
         """
         # get data from data source at requested source coordinates and requested source coordinates index
-        data = self.get_data(rc, rci)
+        if (
+            self._sparse_read
+            and len(rci) == len(self.coordinates.dims)
+            and all(isinstance(I, np.ndarray) and I.dtype.kind in "iu" for I in rci)
+        ):
+            data = self._get_sparse_data(rc, rci)
+        else:
+            data = self.get_data(rc, rci)
 
         # convert data into UnitsDataArray depending on format
         # TODO: what other processing needs to happen here?
@@ -289,6 +373,40 @@ class DataSource(Node):
 
         return udata_array
 
+    def _get_sparse_data(self, rc, rci):
+        """Read a sparse (orthogonal) selection by calling `get_data` once per window of nearby indices.
+
+        Parameters
+        ----------
+        rc : :class:`podpac.Coordinates`
+            selected source coordinates
+        rci : tuple
+            integer index array for each dimension of the source coordinates
+
+        Returns
+        -------
+        podpac.core.units.UnitsDataArray
+            Returns UnitsDataArray with coordinates rc
+        """
+
+        blocks = list(_sparse_blocks(rci, self.sparse_read_max_blocks, self.sparse_read_max_fill))
+        if len(blocks) == 1:
+            src, dst, local = blocks[0]
+            if all(
+                np.array_equal(p, np.arange(p.size)) and np.array_equal(l, np.arange(p.size))
+                for p, l in zip(dst, local)
+            ):
+                # the window is exactly the selection, e.g. a strided selection
+                return self.get_data(rc, src)
+
+        output = self.create_output_array(rc)
+        for src, dst, local in blocks:
+            data = self.get_data(self.coordinates[src], src)
+            if isinstance(data, xr.DataArray):
+                data = data.data
+            output.data[np.ix_(*dst) + (Ellipsis,)] = np.asarray(data)[np.ix_(*local) + (Ellipsis,)]
+        return output
+
     # ------------------------------------------------------------------------------------------------------------------
     # Methods
     # ------------------------------------------------------------------------------------------------------------------
@@ -334,6 +452,7 @@ class DataSource(Node):
         # This is needed for the interpolation mixin to avoid floating-point discrepancies
         # between the requested coordinates and the evaluated coordinates
         self._requested_coordinates = requested_coordinates
+        self._thread_local.requested_coordinates = requested_coordinates
 
         # remove extra dimensions
         extra = [
@@ -413,10 +532,11 @@ class DataSource(Node):
 
         # Use the selector
         if _selector is not None:
-            (rsc, rsci) = _selector(self.coordinates, coordinates, index_type=self.coordinate_index_type)
+            index_type = "numpy" if self._sparse_read else self.coordinate_index_type
+            rsc, rsci = _selector(self.coordinates, coordinates, index_type=index_type)
         else:
             # get source coordinates that are within the requested coordinates bounds
-            (rsc, rsci) = self.coordinates.intersect(coordinates, outer=True, return_index=True)
+            rsc, rsci = self.coordinates.intersect(coordinates, outer=True, return_index=True)
 
         # if requested coordinates and coordinates do not intersect, shortcut with nan UnitsDataArary
         if rsc.size == 0:
@@ -567,3 +687,66 @@ class DataSource(Node):
                 else:
                     boundary[dim] = self.boundary[dim]
         return boundary
+
+
+def _sparse_blocks(index, max_blocks, max_fill=1.0):
+    """Group an orthogonal integer index into rectangular windows of nearby indices.
+
+    Each window is stepped by the common step of its indices (see `_index_window`). A single window spanning the
+    selection is used if the selected indices fill at least ``max_fill`` of it, e.g. for strided selections.
+    Otherwise, the dimensions with evenly spaced indices still use a single window, and in the other dimensions,
+    indices separated by at most ``gap`` are read in the same window. The gap starts at 1 (contiguous indices only)
+    and is doubled until there are at most ``max_blocks`` windows.
+
+    Parameters
+    ----------
+    index : tuple
+        integer index array for each dimension
+    max_blocks : int
+        maximum number of windows
+    max_fill : float, optional
+        minimum fraction of a single window filled by the selected indices to read the selection in one window
+
+    Yields
+    ------
+    src : tuple
+        slice for each dimension, the window to read
+    dst : list
+        positions in the selection for each dimension
+    local : list
+        positions in the window for each dimension
+    """
+
+    index = [np.ravel(I) for I in index]
+    whole = [[np.argsort(I, kind="stable")] for I in index]
+    windows = [_index_window(I) for I in index]
+    size = np.prod([(s.stop - 1 - s.start) // s.step + 1 for s in windows], dtype=float)
+    if np.prod([np.unique(I).size for I in index], dtype=float) >= max_fill * size:
+        runs = whole
+    else:
+        regular = [len(set(np.diff(np.unique(I)))) <= 1 for I in index]
+        gap = 1
+        while True:
+            runs = [w if r else _index_runs(I, gap) for I, w, r in zip(index, whole, regular)]
+            if np.prod([len(r) for r in runs]) <= max_blocks or all(len(r) == 1 for r in runs):
+                break
+            gap *= 2
+
+    for blocks in itertools.product(*runs):
+        src = tuple(_index_window(index[d][p]) for d, p in enumerate(blocks))
+        local = [(index[d][p] - s.start) // s.step for d, (p, s) in enumerate(zip(blocks, src))]
+        yield src, list(blocks), local
+
+
+def _index_window(index):
+    """Stepped slice spanning the index values, with the greatest common step of the values."""
+    values = np.unique(index)
+    step = int(np.gcd.reduce(np.diff(values))) if values.size > 1 else 1
+    return slice(int(values[0]), int(values[-1]) + 1, step)
+
+
+def _index_runs(index, gap):
+    """Split the positions of an index into runs of nearby (sorted) index values."""
+    order = np.argsort(index, kind="stable")
+    splits = np.where(np.diff(index[order]) > gap)[0] + 1
+    return np.split(order, splits)
@@ -236,6 +236,15 @@ class FileKeysMixin(tl.HasTraits):
     def dims(self):
         raise NotImplementedError
 
+    @cached_property
+    def storage_chunks(self):
+        """native storage chunk shape of the (first) data key, by dim, or None if the data is not chunked."""
+        key = self.data_key[0] if isinstance(self.data_key, list) else self.data_key
+        chunks = getattr(self.dataset[key], "chunks", None)
+        if not chunks:
+            return None
+        return dict(zip(self.dims, chunks))
+
     @cached_property
     def available_data_keys(self):
         """available data keys"""
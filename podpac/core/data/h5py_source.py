@@ -52,6 +52,8 @@ class H5PYRaw(FileKeysMixin, BaseFileSource):
 
     file_mode = tl.Unicode(default_value="r").tag(readonly=True)
     array_dims = tl.List(trait=tl.Unicode()).tag(readonly=True)
+    coordinate_index_type = "slice"
+    sparse_read = tl.Bool(True)
 
     @cached_property
     def dataset(self):
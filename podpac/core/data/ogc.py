@@ -143,6 +143,12 @@ class WCSRaw(DataSource):
     max_size : int
         maximum request size, optional.
         If provided, the coordinates will be tiled into multiple requests.
+    halo : int
+        Number of overlapping pixels requested on each side of the tiles when `max_size` is provided, so that the
+        server interpolation does not have edge artifacts at the tile borders. Default 0.
+    tile_shape : dict
+        Native tile shape of the coverage on the server, by dim, optional. If provided, the edges of the requested
+        tiles are snapped to the server tiles when `max_size` is provided, so that each server tile is read once.
     allow_mock_client : bool
         Default is False. If True, a mock client will be used to make WCS requests. This allows returns
         from servers with only partial WCS implementations.
@@ -167,6 +173,8 @@ class WCSRaw(DataSource):
     format = tl.CaselessStrEnum(["geotiff", "geotiff_byte"], default_value="geotiff")
     crs = tl.Unicode(default_value="EPSG:4326")
     max_size = tl.Long(default_value=None, allow_none=True)
+    halo = tl.Int(default_value=0).tag(attr=True)
+    tile_shape = tl.Dict(default_value=None, allow_none=True).tag(attr=True)
     wcs_kwargs = tl.Dict(help="Additional query parameters sent to the WCS server")
 
     _repr_keys = ["source", "layer"]
@@ -175,6 +183,10 @@ class WCSRaw(DataSource):
     _evaluated_coordinates = tl.Instance(Coordinates)
     coordinate_index_type = "slice"
 
+    @property
+    def storage_chunks(self):
+        return self.tile_shape
+
     @property
     def auth(self):
         if self.username and self.password:
@@ -345,13 +357,25 @@ class WCSRaw(DataSource):
                     shape.append(n)
                 s *= n
             shape = tuple(shape)
+            halo = {"lat": self.halo, "lon": self.halo} if self.halo else None
+            grid = self.get_storage_grid(coordinates)
         else:
             shape = coordinates.shape
+            halo = None
+            grid = None
 
         # request each chunk and composite the data
         output = self.create_output_array(coordinates)
-        for i, (chunk, slc) in enumerate(coordinates.iterchunks(shape, return_slices=True)):
-            output[slc] = self._get_chunk(chunk)
+        for chunk in coordinates.iterchunks(shape, return_slices=True, halo=halo, grid=grid):
+            if halo:
+                chunk, slc, interior = chunk
+                data = self._get_chunk(chunk)
+                if data.ndim < chunk.ndim:
+                    data = data.reshape(chunk.shape)  # squeezed
+                output[slc] = data[interior]
+            else:
+                chunk, slc = chunk
+                output[slc] = self._get_chunk(chunk)
 
         return output
 
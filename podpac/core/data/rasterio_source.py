@@ -2,6 +2,8 @@ from __future__ import division, unicode_literals, print_function, absolute_impo
 
 from collections import OrderedDict
 import io
+import os
+import threading
 from podpac.core.coordinates.array_coordinates1d import ArrayCoordinates1d
 import re
 
@@ -16,6 +18,7 @@ from lazy_import import lazy_module
 rasterio = lazy_module("rasterio")
 boto3 = lazy_module("boto3")
 
+from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
 from podpac.core.coordinates import UniformCoordinates1d, Coordinates, merge_dims
 from podpac.core.data.datasource import COMMON_DATA_DOC, DATA_DOC
@@ -26,6 +29,43 @@ from podpac.core.interpolation.interpolation import InterpolationMixin
 _logger = logging.getLogger(__name__)
 
 
+class _BlockCache(object):
+    """Thread-safe LRU cache of decoded raster blocks, limited by settings["RASTERIO_BLOCK_CACHE_MAX_BYTES"]."""
+
+    def __init__(self):
+        self._blocks = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def get(self, key):
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+            return block
+
+    def put(self, key, block):
+        max_bytes = settings["RASTERIO_BLOCK_CACHE_MAX_BYTES"] or 0
+        if block.nbytes > max_bytes:
+            return
+        with self._lock:
+            if key in self._blocks:
+                self.size -= self._blocks.pop(key).nbytes
+            self._blocks[key] = block
+            self.size += block.nbytes
+            while self.size > max_bytes:
+                _, old = self._blocks.popitem(last=False)
+                self.size -= old.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._blocks.clear()
+            self.size = 0
+
+
+_block_cache = _BlockCache()
+
+
 @common_doc(COMMON_DATA_DOC)
 class RasterioRaw(S3Mixin, BaseFileSource):
     """Create a DataSource using rasterio.
@@ -50,6 +90,11 @@ class RasterioRaw(S3Mixin, BaseFileSource):
         in the request.
     prefer_overviews_closest: bool, optional
         Default is False. If True, will find the closest overview instead of the closest
+    cache_blocks: bool, optional
+        Default is True. If True, unstrided window reads are assembled from the internal blocks of the raster
+        (see ``dataset.block_shapes``), which are cached in memory and shared between nodes, so that overlapping
+        requests only read and decode each block once. The cache size is set by
+        settings["RASTERIO_BLOCK_CACHE_MAX_BYTES"].
 
     See Also
     --------
@@ -64,6 +109,8 @@ class RasterioRaw(S3Mixin, BaseFileSource):
     aws_https = tl.Bool(True).tag(attr=True)
     prefer_overviews = tl.Bool(False).tag(attr=True)
     prefer_overviews_closest = tl.Bool(False).tag(attr=True)
+    sparse_read = tl.Bool(True)
+    cache_blocks = tl.Bool(True)
 
     @tl.default("coordinate_index_type")
     def _default_coordinate_index_type(self):
@@ -113,6 +160,12 @@ class RasterioRaw(S3Mixin, BaseFileSource):
     def nan_vals(self):
         return np.unique(np.array(self.dataset.nodatavals).astype(self.dtype)).tolist()
 
+    @cached_property
+    def storage_chunks(self):
+        """native block shape of the first band, by dim."""
+        rows, cols = self.dataset.block_shapes[0]
+        return {"lat": rows, "lon": cols}
+
     def close_dataset(self):
         """Closes the file for the datasource"""
         self.dataset.close()
@@ -158,12 +211,7 @@ class RasterioRaw(S3Mixin, BaseFileSource):
 
         # read data within coordinates_index window
         window = ((slc[0].start, slc[0].stop), (slc[1].start, slc[1].stop))
-
-        if self.outputs is not None:  # read all the bands
-            raster_data = self.dataset.read(out_shape=(len(self.outputs),) + tuple(coordinates.shape), window=window)
-            raster_data = np.moveaxis(raster_data, 0, 2)
-        else:  # read the requested band
-            raster_data = self.dataset.read(self.band, out_shape=tuple(coordinates.shape)[:2], window=window)
+        raster_data = self._read(self.dataset, window, tuple(coordinates.shape)[:2])
 
         # set raster data to output array
         data.data.ravel()[:] = raster_data.ravel()
@@ -225,13 +273,7 @@ class RasterioRaw(S3Mixin, BaseFileSource):
             new_coords = merge_dims([new_coords, missing_coords])
             new_coords = new_coords.transpose(*self.coordinates.dims)
             coordinates_shape = new_coords.shape[:2]
-
-            # The following lines are *nearly* copied/pasted from get_data
-            if self.outputs is not None:  # read all the bands
-                raster_data = dataset.read(out_shape=(len(self.outputs),) + coordinates_shape, window=window)
-                raster_data = np.moveaxis(raster_data, 0, 2)
-            else:  # read the requested band
-                raster_data = dataset.read(self.band, out_shape=coordinates_shape, window=window)
+            raster_data = self._read(dataset, window, coordinates_shape, overview_level)
 
             # set raster data to output array
             data = self.create_output_array(new_coords)
@@ -244,6 +286,81 @@ class RasterioRaw(S3Mixin, BaseFileSource):
 
         return data
 
+    def _read(self, dataset, window, out_shape, overview_level=None):
+        """Read the requested band (or all bands, moved to the last axis) within a window."""
+
+        if self.outputs is not None:  # read all the bands
+            bands = list(range(1, dataset.count + 1))
+        else:  # read the requested band
+            bands = [self.band]
+
+        (r0, r1), (c0, c1) = window
+        if (
+            self.cache_blocks
+            and settings["RASTERIO_BLOCK_CACHE_MAX_BYTES"]
+            and self._file_version is not None
+            and None not in (r0, r1, c0, c1)
+            and tuple(out_shape) == (r1 - r0, c1 - c0)
+            and 0 <= r0 < r1 <= dataset.height
+            and 0 <= c0 < c1 <= dataset.width
+        ):
+            raster_data = self._read_blocks(dataset, bands, window, overview_level)
+        elif self.outputs is not None:
+            raster_data = dataset.read(out_shape=(len(bands),) + tuple(out_shape), window=window)
+        else:
+            raster_data = dataset.read(self.band, out_shape=tuple(out_shape), window=window)[None]
+
+        if self.outputs is not None:
+            return np.moveaxis(raster_data, 0, 2)
+        return raster_data[0]
+
+    def _read_blocks(self, dataset, bands, window, overview_level):
+        """Assemble a window read from the (cached) internal blocks of the raster."""
+
+        (r0, r1), (c0, c1) = window
+        bh, bw = dataset.block_shapes[bands[0] - 1]
+        out = np.empty((len(bands), r1 - r0, c1 - c0), dtype=dataset.dtypes[bands[0] - 1])
+        for br in range(r0 // bh, (r1 - 1) // bh + 1):
+            for bc in range(c0 // bw, (c1 - 1) // bw + 1):
+                blocks = self._get_blocks(dataset, bands, overview_level, br, bc)
+                rs, re = max(r0, br * bh), min(r1, (br + 1) * bh)
+                cs, ce = max(c0, bc * bw), min(c1, (bc + 1) * bw)
+                dst = (slice(rs - r0, re - r0), slice(cs - c0, ce - c0))
+                src = (slice(rs - br * bh, re - br * bh), slice(cs - bc * bw, ce - bc * bw))
+                for i, block in enumerate(blocks):
+                    out[i][dst] = block[src]
+        return out
+
+    @cached_property
+    def _file_version(self):
+        """Version of the file (mtime and size, or S3 ETag) for the block cache keys. None if unknown (not cached)."""
+
+        if self.source.startswith("s3://"):
+            try:
+                info = self.s3.info(self.source)
+            except Exception as e:
+                _logger.debug("Could not get the S3 object info for {}: {}".format(self.source, e))
+                return None
+            return info.get("ETag") or info.get("LastModified")
+        elif os.path.isfile(self.source):
+            stat = os.stat(self.source)
+            return (stat.st_mtime_ns, stat.st_size)
+        else:
+            return None
+
+    def _get_blocks(self, dataset, bands, overview_level, br, bc):
+        keys = [(self.source, self._file_version, band, overview_level, br, bc) for band in bands]
+        blocks = [_block_cache.get(key) for key in keys]
+        missing = [i for i, block in enumerate(blocks) if block is None]
+        if missing:
+            bh, bw = dataset.block_shapes[bands[0] - 1]
+            window = ((br * bh, min((br + 1) * bh, dataset.height)), (bc * bw, min((bc + 1) * bw, dataset.width)))
+            data = dataset.read([bands[i] for i in missing], window=window)
+            for i, block in zip(missing, data):
+                blocks[i] = block
+                _block_cache.put(keys[i], block)
+        return blocks
+
     # -------------------------------------------------------------------------
     # additional methods and properties
     # -------------------------------------------------------------------------
@@ -4,6 +4,9 @@ Test podpac.core.data.datasource module
 
 # from collections import OrderedDict
 
+import copy
+import pickle
+
 import pytest
 
 import numpy as np
@@ -120,6 +123,20 @@ class TestDataSource(object):
         node = MyDataSource()
         assert node.dims == ("lat", "lon")
 
+    def test_get_storage_grid(self):
+        c = Coordinates([clinspace(0, 10, 20), clinspace(0, 10, 20)], dims=["lat", "lon"])
+
+        node = MockDataSource()
+        assert node.get_storage_grid(c) == {}
+
+        class ChunkedDataSource(MockDataSource):
+            storage_chunks = {"lat": 4}
+
+        node = ChunkedDataSource()
+        assert node.get_storage_grid(c) == {"lat": (-27.5, 20.0)}
+        assert node.get_storage_grid(c.drop("lat")) == {}
+        assert node.get_storage_grid(c.transform("EPSG:3857")) == {}
+
     def test_cache_coordinates(self):
         class MyDataSource(DataSource):
             get_coordinates_called = 0
@@ -343,6 +360,13 @@ class TestDataSource(object):
         # test data
         np.testing.assert_array_equal(out.data, node.data)
 
+    def test_pickle_evaluated(self):
+        node = MockDataSource()
+        output = node.eval(node.coordinates)
+
+        for copied in [copy.deepcopy(node), pickle.loads(pickle.dumps(node))]:
+            np.testing.assert_array_equal(copied.eval(node.coordinates), output)
+
     def test_evaluate_selector(self):
         def selector(rsc, coordinates, index_type=None):
             """mock selector that just strides by 2"""
@@ -356,6 +380,73 @@ class TestDataSource(object):
         np.testing.assert_array_equal(output["lat"].data, node.coordinates["lat"][::2].coordinates)
         np.testing.assert_array_equal(output["lon"].data, node.coordinates["lon"][::2].coordinates)
 
+    def test_evaluate_sparse_read(self):
+        class MockSparseDataSource(MockDataSource):
+            coordinate_index_type = "slice"
+            sparse_read = tl.Bool(True)
+            windows = []
+
+            def get_data(self, coordinates, coordinates_index):
+                assert all(isinstance(s, slice) for s in coordinates_index)
+                self.windows.append(coordinates_index)
+                return super(MockSparseDataSource, self).get_data(coordinates, coordinates_index)
+
+        index = (np.array([0, 1, 8, 9]), np.array([2, 3, 4, 10]))
+
+        def selector(rsc, coordinates, index_type=None):
+            assert index_type == "numpy"
+            return rsc[index], (index[0].reshape(-1, 1), index[1].reshape(1, -1))
+
+        node = MockSparseDataSource()
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data[np.ix_(*index)])
+        assert node.windows == [
+            (slice(0, 2, 1), slice(2, 5, 1)),
+            (slice(0, 2, 1), slice(10, 11, 1)),
+            (slice(8, 10, 1), slice(2, 5, 1)),
+            (slice(8, 10, 1), slice(10, 11, 1)),
+        ]
+
+        # limit the number of windows
+        node = MockSparseDataSource(sparse_read_max_blocks=1)
+        node.windows = []
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data[np.ix_(*index)])
+        assert node.windows == [(slice(0, 10, 1), slice(2, 11, 1))]
+
+        # dense selections are read in a single window
+        node = MockSparseDataSource(sparse_read_max_fill=0.1)
+        node.windows = []
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data[np.ix_(*index)])
+        assert node.windows == [(slice(0, 10, 1), slice(2, 11, 1))]
+
+        # strided selections are read in a single stepped window, e.g. for decimated reads
+        index = (np.arange(1, 10, 4), np.arange(0, 11, 5))
+        node = MockSparseDataSource()
+        node.windows = []
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data[np.ix_(*index)])
+        assert node.windows == [(slice(1, 10, 4), slice(0, 11, 5))]
+
+        # in the irregular dimension only
+        index = (np.array([0, 1, 9]), np.arange(0, 11, 5))
+        node = MockSparseDataSource(sparse_read_max_fill=0.5)
+        node.windows = []
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data[np.ix_(*index)])
+        assert node.windows == [(slice(0, 2, 1), slice(0, 11, 5)), (slice(9, 10, 1), slice(0, 11, 5))]
+
+        # disabled
+        def selector(rsc, coordinates, index_type=None):
+            assert index_type == "slice"
+            return rsc, (slice(None), slice(None))
+
+        node = MockSparseDataSource(sparse_read=False)
+        node.windows = []
+        output = node.eval(node.coordinates, _selector=selector)
+        np.testing.assert_array_equal(output.data, node.data)
+
     def test_nan_vals(self):
         """evaluate note with nan_vals"""
 
@@ -17,6 +17,12 @@ class TestH5PY(object):
         assert node.dims == ["lat", "lon"]
         node.close_dataset()
 
+    def test_storage_chunks(self):
+        # contiguous dataset
+        node = H5PY(source=self.source, data_key="/data/init", lat_key="/coords/lat", lon_key="/coords/lon")
+        assert node.storage_chunks is None
+        node.close_dataset()
+
     def test_available_data_keys(self):
         node = H5PY(source=self.source, data_key="/data/init", lat_key="/coords/lat", lon_key="/coords/lon")
         assert node.available_data_keys == ["/data/init"]
@@ -1,4 +1,5 @@
 import os.path
+import shutil
 from collections import OrderedDict
 
 import numpy as np
@@ -48,6 +49,10 @@ class TestRasterio(object):
         output = node.eval(node.coordinates)
         assert isinstance(output, UnitsDataArray)
 
+    def test_storage_chunks(self):
+        node = Rasterio(source=self.source)
+        assert node.storage_chunks == {"lat": 3, "lon": 791}
+
     def test_band_count(self):
         """test band descriptions methods"""
         node = Rasterio(source=self.source)
@@ -74,3 +79,72 @@ class TestRasterio(object):
         node = Rasterio(source=self.source)
         numbers = node.get_band_numbers("STATISTICS_MINIMUM", "0")
         np.testing.assert_array_equal(numbers, [1, 2, 3])
+
+    def test_cache_blocks(self):
+        from podpac.core.data.rasterio_source import _block_cache
+
+        _block_cache.clear()
+        node = Rasterio(source=self.source)
+        expected = node.dataset.read(1).astype(float)
+        expected[expected == 0] = np.nan
+        coords = node.coordinates[10:20, 5:50]
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output.data, expected[10:20, 5:50])
+
+        # blocks are cached (the blocks are strips of 3 rows)
+        size = _block_cache.size
+        assert size == 4 * 3 * 791
+        output = node.eval(node.coordinates[12:18, 100:120])
+        np.testing.assert_array_equal(output.data, expected[12:18, 100:120])
+        assert _block_cache.size == size
+
+        # multiple bands
+        node = Rasterio(source=self.source, outputs=["R", "G", "B"])
+        output = node.eval(coords)
+        expected_rgb = np.moveaxis(node.dataset.read()[:, 10:20, 5:50], 0, 2).astype(float)
+        expected_rgb[expected_rgb == 0] = np.nan
+        np.testing.assert_array_equal(output.data, expected_rgb)
+
+        # disabled
+        _block_cache.clear()
+        node = Rasterio(source=self.source, cache_blocks=False)
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output.data, expected[10:20, 5:50])
+        assert _block_cache.size == 0
+
+    def test_sparse_read_strided(self, monkeypatch):
+        reads = []
+        _read = Rasterio._read
+
+        def read(self, dataset, window, out_shape, overview_level=None):
+            reads.append(tuple(out_shape))
+            return _read(self, dataset, window, out_shape, overview_level)
+
+        monkeypatch.setattr(Rasterio, "_read", read)
+
+        # strided requests are read decimated, not at full resolution
+        node = Rasterio(source=self.source, band=self.band, cache_output=False)
+        output = node.eval(node.coordinates[::50, ::50])
+        assert output.shape == (15, 16)
+        assert reads == [(15, 16)]
+
+    def test_cache_blocks_rewritten_file(self, tmp_path):
+        from podpac.core.data.rasterio_source import _block_cache
+
+        path = str(tmp_path / "RGB.byte.tif")
+        shutil.copy(self.source, path)
+        node = Rasterio(source=path)
+        coords = node.coordinates[10:20, 5:50]
+        output = node.eval(coords)
+        node.close_dataset()
+
+        # rewrite the file at the same path
+        with rasterio.open(path, "r+") as dataset:
+            dataset.write(dataset.read(1) // 2 + 1, 1)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        node = Rasterio(source=path)
+        np.testing.assert_array_equal(node.eval(coords).data, node.dataset.read(1)[10:20, 5:50])
+        assert not np.array_equal(node.eval(coords).data, output.data, equal_nan=True)
+        _block_cache.clear()
@@ -5,7 +5,7 @@ import pytest
 import numpy as np
 from traitlets import TraitError
 
-from podpac.core.coordinates import Coordinates
+from podpac.core.coordinates import Coordinates, clinspace
 from podpac.core.data.zarr_source import Zarr
 
 
@@ -24,6 +24,10 @@ class TestZarr(object):
         node = Zarr(source=self.path)
         assert node.dims == ["lat", "lon"]
 
+    def test_storage_chunks(self):
+        node = Zarr(source=self.path, data_key="a")
+        assert node.storage_chunks == {"lat": 3, "lon": 4}
+
     def test_available_data_keys(self):
         node = Zarr(source=self.path)
         assert node.available_data_keys == ["a", "b"]
@@ -80,3 +84,125 @@ class TestZarr(object):
         path = "s3://podpac-internal-test/drought_parameters.zarr"
         node = Zarr(source=path, data_key="d0")
         node.close_dataset()
+
+    def test_build_overviews(self, tmp_path):
+        path = str(tmp_path / "pyramid.zarr")
+        g = zarr.open(path, mode="w")
+        g.array("lat", np.linspace(0, 9, 10))
+        g.array("lon", np.linspace(0, 19, 20))
+        g.array("data", np.arange(200.0).reshape(10, 20), chunks=(4, 4))
+        g["data"].attrs["_ARRAY_DIMENSIONS"] = ["lat", "lon"]
+
+        # read-only
+        with pytest.raises(ValueError, match="read-only"):
+            Zarr(source=path).build_overviews()
+
+        node = Zarr(source=path, file_mode="a")
+        with pytest.raises(ValueError, match="Invalid reducer"):
+            node.build_overviews(reducer="mode")
+        node.build_overviews(levels=2, factor=2, reducer="mean")
+
+        assert node.overviews == [2, 4]
+        assert node.dataset["1/data"].shape == (5, 10)
+        assert node.dataset["2/data"].shape == (3, 5)
+        np.testing.assert_array_equal(node.dataset["1/lat"][:], [0.5, 2.5, 4.5, 6.5, 8.5])
+        np.testing.assert_array_equal(node.dataset["1/data"][0, :2], [10.5, 12.5])
+
+        # the partial block at the end is centered on its existing coordinates
+        np.testing.assert_array_equal(node.dataset["2/lat"][:], [1.5, 5.5, 8.5])
+        np.testing.assert_array_equal(node.dataset["2/data"][2, 0], node.dataset["1/data"][4, :2].mean())
+
+        # overview groups are not data keys
+        node = Zarr(source=path)
+        assert node.available_data_keys == ["data"]
+        assert node.overviews == [2, 4]
+
+        # nearest
+        node = Zarr(source=path, file_mode="a")
+        node.build_overviews(levels=1, reducer="nearest")
+        np.testing.assert_array_equal(node.dataset["1/lat"][:], [0, 2, 4, 6, 8])
+        np.testing.assert_array_equal(node.dataset["1/data"][0, :2], [0, 2])
+        assert node.overviews == [2]
+
+        # nearest keeps integer dtypes
+        g.array("idata", np.arange(200).reshape(10, 20), chunks=(4, 4))
+        g["idata"].attrs["_ARRAY_DIMENSIONS"] = ["lat", "lon"]
+        node = Zarr(source=path, file_mode="a")
+        node.build_overviews(levels=1, reducer="nearest")
+        assert node.dataset["1/idata"].dtype == np.int64
+        np.testing.assert_array_equal(node.dataset["1/idata"][0, :2], [0, 2])
+
+    def test_eval_prefer_overviews(self, tmp_path):
+        path = str(tmp_path / "pyramid.zarr")
+        g = zarr.open(path, mode="w")
+        g.array("lat", np.linspace(0, 9, 10))
+        g.array("lon", np.linspace(0, 19, 20))
+        g.array("data", np.arange(200.0).reshape(10, 20), chunks=(4, 4))
+        g["data"].attrs["_ARRAY_DIMENSIONS"] = ["lat", "lon"]
+        Zarr(source=path, file_mode="a").build_overviews(levels=2)
+
+        node = Zarr(source=path, prefer_overviews=True)
+        assert node.coordinate_index_type == "numpy"
+
+        # coarse request uses the coarsest overview
+        coords = Coordinates([clinspace(0, 9, 3), clinspace(0, 19, 5)], dims=["lat", "lon"])
+        output = node.eval(coords)
+        assert output[0, 0] == np.arange(200.0).reshape(10, 20)[:4, :4].mean()
+
+        # full resolution request uses the full resolution data
+        coords = Coordinates([np.linspace(0, 9, 10), np.linspace(0, 19, 20)], dims=["lat", "lon"])
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output, np.arange(200.0).reshape(10, 20))
+
+        # without prefer_overviews
+        node = Zarr(source=path)
+        coords = Coordinates([clinspace(0, 9, 3), clinspace(0, 19, 5)], dims=["lat", "lon"])
+        assert node.eval(coords)[0, 0] == 0
+
+    def test_eval_chunked(self, tmp_path):
+        path = str(tmp_path / "chunked.zarr")
+        g = zarr.open(path, mode="w")
+        g.array("lat", np.linspace(0, 9, 10))
+        g.array("lon", np.linspace(0, 19, 20))
+        data = np.arange(200.0).reshape(10, 20)
+        for key in ["a", "b"]:
+            g.array(key, data, chunks=(4, 6))
+            g[key].attrs["_ARRAY_DIMENSIONS"] = ["lat", "lon"]
+        os.remove(os.path.join(path, "a", "1.1"))
+
+        coords = Coordinates([np.linspace(1, 8, 8), np.linspace(2, 17, 16)], dims=["lat", "lon"])
+        expected = data[1:9, 2:18]
+
+        # concurrent reads
+        node = Zarr(source=path, data_key="b", multithreading=True)
+        np.testing.assert_array_equal(node.eval(coords), expected)
+
+        node = Zarr(source=path, data_key=["a", "b"], multithreading=True)
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output.sel(output="b"), expected)
+
+        # missing chunks
+        expected_a = expected.copy()
+        expected_a[3:7, 4:10] = np.nan
+
+        node = Zarr(source=path, data_key="a", skip_missing_chunks=True, nan_val=-9999.0)
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output.data[:3], expected_a[:3])
+        assert np.all(output.data[3:7, 4:10] == -9999.0)
+
+        # the listings are cached until the dataset is closed
+        g["a"][4:8, 6:12] = data[4:8, 6:12]
+        assert np.all(node.eval(coords).data[3:7, 4:10] == -9999.0)
+        node.close_dataset()
+        np.testing.assert_array_equal(node.eval(coords), expected)
+        os.remove(os.path.join(path, "a", "1.1"))
+
+        node = Zarr(source=path, data_key=["a", "b"], skip_missing_chunks=True, multithreading=True)
+        output = node.eval(coords)
+        np.testing.assert_array_equal(output.sel(output="a"), expected_a)
+        np.testing.assert_array_equal(output.sel(output="b"), expected)
+
+        # strided request
+        coords = Coordinates([clinspace(0, 8, 5), clinspace(1, 19, 7)], dims=["lat", "lon"])
+        node = Zarr(source=path, data_key="b", multithreading=True)
+        np.testing.assert_array_equal(node.eval(coords), data[::2, 1::3])
@@ -1,4 +1,6 @@
 import os
+import itertools
+import warnings
 import traitlets as tl
 import numpy as np
 
@@ -10,11 +12,24 @@ zarr_open_consolidated = lazy_function("zarr.convenience.open_consolidated")
 zarrGroup = lazy_class("zarr.Group")
 
 from podpac.core.authentication import S3Mixin
+from podpac.core.settings import settings
 from podpac.core.utils import common_doc, cached_property
+from podpac.core.managers.multi_threading import thread_manager
+from podpac.core.coordinates import Coordinates, ArrayCoordinates1d, UniformCoordinates1d
 from podpac.core.data.datasource import COMMON_DATA_DOC, DATA_DOC
 from podpac.core.data.file_source import BaseFileSource, FileKeysMixin
 from podpac.core.interpolation.interpolation import InterpolationMixin
 
+OVERVIEW_REDUCERS = {
+    "mean": np.nanmean,
+    "median": np.nanmedian,
+    "min": np.nanmin,
+    "max": np.nanmax,
+    "sum": np.nansum,
+    "nearest": None,
+}
+"""dict : reducers available to :meth:`ZarrRaw.build_overviews`, by name"""
+
 
 class ZarrRaw(S3Mixin, FileKeysMixin, BaseFileSource):
     """Create a DataSource node using zarr.
@@ -47,6 +62,20 @@ class ZarrRaw(S3Mixin, FileKeysMixin, BaseFileSource):
         units, when decoding CF datetimes
     cf_calendar : str
         calendar, when decoding CF datetimes
+    prefer_overviews: bool, optional
+        Default is False. If True, will pull data from the overview (see :meth:`build_overviews`) with the closest
+        resolution (step size) matching the smallest resolution in the request.
+    prefer_overviews_closest: bool, optional
+        Default is False. If True, will find the closest overview instead of the closest overview that is finer than
+        the request.
+    multithreading : bool, optional
+        Default is settings["MULTITHREADING"]. If True, the requested data is split into chunk-aligned reads that are
+        fetched concurrently (up to settings["N_THREADS"] at a time).
+    skip_missing_chunks : bool, optional
+        Default is False. If True, the chunks of each data key are listed once (see :meth:`list_dir`) and requested
+        chunks that do not exist are filled with ``nan_val`` instead of being read. The listings are cleared by
+        :meth:`build_overviews` and :meth:`close_dataset`; call :meth:`close_dataset` after writing to the store
+        externally.
 
     See Also
     --------
@@ -54,9 +83,25 @@ class ZarrRaw(S3Mixin, FileKeysMixin, BaseFileSource):
     """
 
     file_mode = tl.Unicode(default_value="r").tag(readonly=True)
-    coordinate_index_type = "slice"
+    coordinate_index_type = tl.Unicode()
+    prefer_overviews = tl.Bool(False).tag(attr=True)
+    prefer_overviews_closest = tl.Bool(False).tag(attr=True)
+    multithreading = tl.Bool()
+    skip_missing_chunks = tl.Bool(False)
+    sparse_read = tl.Bool(True)
     _consolidated = False
 
+    @tl.default("multithreading")
+    def _default_multithreading(self):
+        return settings["MULTITHREADING"]
+
+    @tl.default("coordinate_index_type")
+    def _default_coordinate_index_type(self):
+        if self.prefer_overviews:
+            return "numpy"
+        else:
+            return "slice"
+
     def _get_store(self):
         if self.source.startswith("s3://"):
             s3fs = lazy_module("s3fs")
@@ -181,7 +226,7 @@ class ZarrRaw(S3Mixin, FileKeysMixin, BaseFileSource):
 
     @cached_property
     def keys(self):
-        keys = list(self.dataset.keys())
+        keys = [key for key in self.dataset.keys() if key not in self._overview_paths]
         full_keys = self._add_keys(keys)
         while keys != full_keys:
             keys = full_keys.copy()
@@ -192,14 +237,333 @@ class ZarrRaw(S3Mixin, FileKeysMixin, BaseFileSource):
     @common_doc(COMMON_DATA_DOC)
     def get_data(self, coordinates, coordinates_index):
         """{get_data}"""
+        if self.prefer_overviews:
+            return self.get_data_overviews(coordinates, coordinates_index)
+
         data = self.create_output_array(coordinates)
-        if not isinstance(self.data_key, list):
+        if (self.multithreading or self.skip_missing_chunks) and all(isinstance(I, slice) for I in coordinates_index):
+            self._get_chunked_data(data, coordinates_index)
+        elif not isinstance(self.data_key, list):
             data[:] = self.dataset[self.data_key][coordinates_index]
         else:
             for key, name in zip(self.data_key, self.outputs):
                 data.sel(output=name)[:] = self.dataset[key][coordinates_index]
         return data
 
+    def _get_chunked_data(self, data, coordinates_index):
+        """Fill ``data`` using reads aligned to the zarr chunks, skipping missing chunks and reading concurrently."""
+
+        keys = self.data_key if isinstance(self.data_key, list) else [self.data_key]
+
+        reads = []
+        for key, d in zip(keys, self._iter_outputs(data)):
+            out = d.data
+            arr = self.dataset[key]
+            listing = self._chunk_listing(key) if self.skip_missing_chunks else None
+            for chunk_ids, src, dst in _plan_chunk_reads(coordinates_index, arr.shape, arr.chunks):
+                if listing is not None and not self.chunk_exists(
+                    chunk_str=".".join(str(i) for i in chunk_ids), data_key=key, chunks=arr.chunks, list_dir=listing
+                ):
+                    out[dst] = self.nan_val
+                    continue
+                reads.append((arr, src, out, dst))
+
+        def f(read):
+            arr, src, out, dst = read
+            out[dst] = arr[src]
+
+        if self.multithreading:
+            n_threads = thread_manager.request_n_threads(len(reads))
+            if n_threads == 1:
+                thread_manager.release_n_threads(n_threads)
+        else:
+            n_threads = 0
+
+        if self.multithreading and n_threads > 1:
+            pool = thread_manager.get_thread_pool(processes=n_threads)
+            pool.map(f, reads)
+            pool.close()
+            thread_manager.release_n_threads(n_threads)
+        else:
+            for read in reads:
+                f(read)
+
+    @cached_property
+    def _chunk_listings(self):
+        """Existing chunk paths by data key, filled on first use by :meth:`_chunk_listing`."""
+        return {}
+
+    def _chunk_listing(self, data_key):
+        """Cached set of the existing chunk paths for a data key, in the format used by :meth:`chunk_exists`."""
+
+        if data_key not in self._chunk_listings:
+            self._chunk_listings[data_key] = set(self.list_dir(data_key))
+        return self._chunk_listings[data_key]
+
+    def _clear_chunk_listings(self):
+        self._chunk_listings.clear()
+
+    def close_dataset(self):
+        super(ZarrRaw, self).close_dataset()
+        self._clear_chunk_listings()
+
+    def get_data_overviews(self, coordinates, coordinates_index):
+        # orthogonal index, one entry per dimension
+        index = [np.ravel(i) if isinstance(i, np.ndarray) else i for i in coordinates_index]
+
+        # Figure out how much coarser the request is than the actual data
+        reduction_factor = np.inf
+        for c in self._overview_dims:
+            crd = coordinates[c]
+            if crd.size == 1:
+                reduction_factor = 0
+                break
+            if isinstance(crd, UniformCoordinates1d):
+                min_delta = crd.step
+            elif isinstance(crd, ArrayCoordinates1d) and crd.is_monotonic:
+                min_delta = crd.deltas.min()
+            else:
+                raise NotImplementedError(
+                    "The Zarr node with prefer_overviews=True currently does not support request coordinates type {}".format(
+                        coordinates
+                    )
+                )
+            reduction_factor = min(reduction_factor, np.abs(min_delta / self._source_step(c)))
+
+        # Find the overview that's closest to this reduction factor
+        if (reduction_factor < 2) or (len(self.overviews) == 0):  # Then we shouldn't use an overview
+            data = self.create_output_array(coordinates)
+            keys = self.data_key if isinstance(self.data_key, list) else [self.data_key]
+            for key, d in zip(keys, self._iter_outputs(data)):
+                d[:] = self.dataset[key].oindex[tuple(index)]
+            return data
+
+        diffs = reduction_factor - np.array(self.overviews)
+        if self.prefer_overviews_closest:
+            diffs = np.abs(diffs)
+        else:
+            diffs[diffs < 0] = np.inf
+        level = np.argmin(diffs)
+        overview = self.overviews[level]
+        group = self.dataset[self._overview_paths[level]]
+
+        # read the window containing the requested index at the resolution of the overview
+        cs = []
+        for dim, I in zip(self.dims, index):
+            if dim in self._overview_dims:
+                start, stop = self._index_bounds(I, self.coordinates[dim].size)
+                size = group[self._lookup_key(dim)].shape[0]
+                I = slice(start // overview, min(size, int(np.ceil(stop / overview))))
+                cs.append(ArrayCoordinates1d(group[self._lookup_key(dim)][I], name=dim))
+            else:
+                cs.append(self.coordinates[dim][I])
+            index[self.dims.index(dim)] = I
+        new_coords = Coordinates(cs, crs=self.coordinates.crs)
+
+        data = self.create_output_array(new_coords)
+        keys = self.data_key if isinstance(self.data_key, list) else [self.data_key]
+        for key, d in zip(keys, self._iter_outputs(data)):
+            d[:] = group[key].oindex[tuple(index)]
+        return data
+
+    def _iter_outputs(self, data):
+        if self.outputs is None:
+            yield data
+        else:
+            for name in self.outputs:
+                yield data.sel(output=name)
+
+    @staticmethod
+    def _index_bounds(index, size):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(size)
+            return start, stop
+        if index.dtype == bool:
+            index = np.where(index)[0]
+        return int(index.min()), int(index.max()) + 1
+
+    def _source_step(self, dim):
+        c = self.coordinates[dim]
+        if isinstance(c, UniformCoordinates1d):
+            return c.step
+        return (c.bounds[1] - c.bounds[0]) / max(1, c.size - 1)
+
+    # -------------------------------------------------------------------------
+    # overviews
+    # -------------------------------------------------------------------------
+
+    @property
+    def _multiscales(self):
+        return self.dataset.attrs.get("multiscales", {"levels": [], "dims": []})
+
+    @property
+    def _overview_paths(self):
+        return [level["path"] for level in self._multiscales["levels"]]
+
+    @property
+    def _overview_dims(self):
+        return self._multiscales["dims"]
+
+    @property
+    def overviews(self):
+        """list : decimation factor of each overview level, from finest to coarsest"""
+        return [level["factor"] for level in self._multiscales["levels"]]
+
+    def build_overviews(self, levels=3, factor=2, reducer="mean"):
+        """Write multiscale overviews (a pyramid) of the data into the Zarr store.
+
+        Level 0 is the full-resolution data at the root of the store. Each overview level ``n`` is written into the
+        group ``"n"`` and contains every data key and coordinate array, decimated by ``factor**n`` along the lat
+        and lon dimensions. The pyramid is described in the ``"multiscales"`` attribute of the root group, and is used
+        when the node is evaluated with ``prefer_overviews=True``.
+
+        Arguments
+        ---------
+        levels : int, optional
+            Number of overview levels. Default 3.
+        factor : int, optional
+            Decimation factor between successive levels. Default 2.
+        reducer : str, optional
+            Function used to combine each block of ``factor x factor`` values, one of
+            :attr:`OVERVIEW_REDUCERS`. Default 'mean'. 'nearest' uses the first value in each block.
+        """
+
+        if self.file_mode == "r":
+            raise ValueError("Cannot build overviews on a read-only Zarr store, use file_mode='a' or 'r+'")
+        if reducer not in OVERVIEW_REDUCERS:
+            raise ValueError("Invalid reducer '%s', available reducers are %s" % (reducer, list(OVERVIEW_REDUCERS)))
+
+        dims = list(self.dims)
+        overview_dims = [dim for dim in ["lat", "lon"] if dim in dims]
+        if not overview_dims:
+            raise ValueError("Cannot build overviews for Zarr store without lat or lon dimensions")
+        axes = [dims.index(dim) for dim in overview_dims]
+
+        src = self.dataset
+        multiscales = {"levels": [], "dims": overview_dims, "reducer": reducer}
+        for level in range(1, levels + 1):
+            path = str(level)
+            group = self.dataset.create_group(path, overwrite=True)
+
+            for dim in dims:
+                key = self._lookup_key(dim)
+                c = src[key][:]
+                if dim in overview_dims:
+                    c = _decimate_coordinates(c, factor, reducer)
+                group.array(key, c, overwrite=True)
+                group[key].attrs.update(src[key].attrs)
+
+            for key in self.available_data_keys:
+                _decimate_array(src[key], group, key, axes, factor, reducer, self.nan_vals)
+
+            multiscales["levels"].append({"path": path, "factor": factor**level})
+            src = group
+
+        self.dataset.attrs["multiscales"] = multiscales
+        if ".zmetadata" in self.dataset.store:
+            zarr.consolidate_metadata(self.dataset.store)
+        self._clear_chunk_listings()
+
+
+def _plan_chunk_reads(index, shape, chunks):
+    """Split an index into reads that each fall within a single chunk.
+
+    Arguments
+    ---------
+    index : tuple
+        tuple of slices, one per dimension
+    shape : tuple
+        shape of the array
+    chunks : tuple
+        chunk shape of the array
+
+    Yields
+    ------
+    chunk_ids : tuple
+        chunk grid position of the read
+    src : tuple
+        tuple of slices into the array
+    dst : tuple
+        tuple of slices into the output, which has the shape of the indexed array
+    """
+
+    parts = []
+    for slc, n, c in zip(index, shape, chunks):
+        start, stop, step = slc.indices(n)
+        dim_parts = []
+        for k in range(start // c, (stop - 1) // c + 1 if stop > start else start // c):
+            lo = max(start, k * c)
+            hi = min(stop, (k + 1) * c)
+            lo += (start - lo) % step  # first index in this chunk that is on the stride
+            if lo >= hi:
+                continue
+            o = (lo - start) // step
+            dim_parts.append((k, slice(lo, hi, step), slice(o, o + len(range(lo, hi, step)))))
+        parts.append(dim_parts)
+
+    for combo in itertools.product(*parts):
+        yield tuple(p[0] for p in combo), tuple(p[1] for p in combo), tuple(p[2] for p in combo)
+
+
+def _decimate_coordinates(c, factor, reducer):
+    if reducer == "nearest":
+        return c[::factor]
+
+    # block centers; the partial block at the end is padded with nan in the data, so use its existing coordinates
+    n = c.size // factor * factor
+    centers = c[:n].reshape(-1, factor).mean(axis=1)
+    if n < c.size:
+        centers = np.append(centers, c[n:].mean())
+    return centers
+
+
+def _decimate(data, axes, factor, reducer, nan_vals):
+    if reducer == "nearest":
+        return data[tuple(slice(None, None, factor) if i in axes else slice(None) for i in range(data.ndim))]
+
+    data = data.astype(float)
+    if nan_vals:
+        data[np.isin(data, nan_vals)] = np.nan
+
+    # pad partial blocks with nan
+    pad = [(0, (-n) % factor if i in axes else 0) for i, n in enumerate(data.shape)]
+    if any(p[1] for p in pad):
+        data = np.pad(data, pad, mode="constant", constant_values=np.nan)
+
+    # split each decimated axis into (blocks, factor), move the factor axes to the end and reduce over them
+    shape = []
+    for i, n in enumerate(data.shape):
+        shape.extend([n // factor, factor] if i in axes else [n])
+    data = data.reshape(shape)
+    block_axes = [i + k + 1 for k, i in enumerate(sorted(axes))]
+    data = np.moveaxis(data, block_axes, list(range(-len(axes), 0)))
+    data = data.reshape(data.shape[: -len(axes)] + (-1,))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-nan blocks
+        return OVERVIEW_REDUCERS[reducer](data, axis=-1)
+
+
+def _decimate_array(arr, group, key, axes, factor, reducer, nan_vals):
+    """Decimate the zarr array ``arr`` into ``group[key]``, one band of whole chunks at a time."""
+
+    shape = tuple(-(-n // factor) if i in axes else n for i, n in enumerate(arr.shape))
+    chunks = tuple(min(c, n) for c, n in zip(arr.chunks, shape))
+    dtype = arr.dtype if reducer == "nearest" else np.float64
+    fill_value = np.nan if np.issubdtype(dtype, np.floating) else arr.fill_value
+    out = group.create_dataset(key, shape=shape, chunks=chunks, dtype=dtype, fill_value=fill_value, overwrite=True)
+    out.attrs.update(arr.attrs)
+
+    # bands along the first decimated axis, aligned to both the source chunks and the decimation factor
+    axis = axes[0]
+    step = arr.chunks[axis] * factor
+    for start in range(0, arr.shape[axis], step):
+        src_index = tuple(slice(start, start + step) if i == axis else slice(None) for i in range(arr.ndim))
+        out_index = tuple(
+            slice(start // factor, (start + step) // factor) if i == axis else slice(None) for i in range(arr.ndim)
+        )
+        out[out_index] = _decimate(arr[src_index], axes, factor, reducer, nan_vals)
+
 
 class Zarr(InterpolationMixin, ZarrRaw):
     """Zarr Datasource with Interpolation."""
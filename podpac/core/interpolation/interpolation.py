@@ -47,7 +47,7 @@ class InterpolationMixin(tl.HasTraits):
         if isinstance(self, DataSource):
             # This is required to ensure that the output coordinates
             # match the requested coordinates to floating point precision
-            r = node.eval(self._requested_coordinates, output=output)
+            r = node.eval(self._thread_local.requested_coordinates, output=output)
         else:
             r = node.eval(coordinates, output=output)
         # Helpful for debugging
@@ -4,6 +4,9 @@ Interpolator implementations
 
 from __future__ import division, unicode_literals, print_function, absolute_import
 
+import threading
+from collections import OrderedDict
+
 import numpy as np
 import traitlets as tl
 
@@ -11,7 +14,7 @@ import traitlets as tl
 try:
     import scipy
     from scipy.interpolate import griddata, RectBivariateSpline, RegularGridInterpolator
-    from scipy.spatial import KDTree
+    from scipy.spatial import cKDTree
 except:
     scipy = None
 
@@ -19,9 +22,13 @@ except:
 from podpac.core.interpolation.interpolator import COMMON_INTERPOLATOR_DOCS, Interpolator, InterpolatorException
 from podpac.core.units import UnitsDataArray
 from podpac.core.coordinates import Coordinates, UniformCoordinates1d, StackedCoordinates
-from podpac.core.utils import common_doc
+from podpac.core.utils import common_doc, hash_alg
 from podpac.core.coordinates.utils import get_timedelta
 
+# cache of KDTrees built from source point coordinates, shared by all ScipyPoint interpolators
+_KDTREE_CACHE = OrderedDict()
+_KDTREE_CACHE_LOCK = threading.Lock()
+
 
 @common_doc(COMMON_INTERPOLATOR_DOCS)
 class ScipyPoint(Interpolator):
@@ -30,11 +37,18 @@ class ScipyPoint(Interpolator):
     Attributes
     ----------
     {interpolator_attributes}
+    workers : int
+        Number of workers used to query the KDTree. Default -1 uses all available cores.
+    kdtree_cache_size : int
+        Maximum number of KDTrees (one per set of source point coordinates) kept in the shared cache. Default 16.
+        Set to 0 to disable caching.
     """
 
     methods_supported = ["nearest"]
     method = tl.Unicode(default_value="nearest")
     dims_supported = ["lat", "lon"]
+    workers = tl.Int(default_value=-1)
+    kdtree_cache_size = tl.Int(default_value=16)
 
     # TODO: implement these parameters for the method 'nearest'
     spatial_tolerance = tl.Float(default_value=np.inf)
@@ -90,9 +104,11 @@ class ScipyPoint(Interpolator):
             pts = np.stack([source_coordinates[dim].coordinates for dim in source_coordinates[order].dims], axis=1)
             if order == "lat_lon":
                 pts = pts[:, ::-1]
-            pts = KDTree(pts)
+            pts = self._get_kdtree(pts)
             lon, lat = np.meshgrid(eval_coordinates["lon"].coordinates, eval_coordinates["lat"].coordinates)
-            dist, ind = pts.query(np.stack((lon.ravel(), lat.ravel()), axis=1), distance_upper_bound=tol)
+            dist, ind = pts.query(
+                np.stack((lon.ravel(), lat.ravel()), axis=1), distance_upper_bound=tol, workers=self.workers
+            )
             mask = ind == source_data[order].size
             ind[mask] = 0  # This is a hack to make the select on the next line work
             # (the masked values are set to NaN on the following line)
@@ -119,8 +135,8 @@ class ScipyPoint(Interpolator):
             new_stacked = np.stack(
                 [eval_coordinates[dim].coordinates for dim in source_coordinates[order].dims], axis=1
             )
-            pts = KDTree(src_stacked)
-            dist, ind = pts.query(new_stacked, distance_upper_bound=tol)
+            pts = self._get_kdtree(src_stacked)
+            dist, ind = pts.query(new_stacked, distance_upper_bound=tol, workers=self.workers)
             mask = ind == source_data[order].size
             ind[mask] = 0
             vals = source_data[{order: ind}]
@@ -131,6 +147,40 @@ class ScipyPoint(Interpolator):
 
             return output_data
 
+    def _get_kdtree(self, pts):
+        """Get a KDTree for the given source points, building it only if it is not already cached.
+
+        Parameters
+        ----------
+        pts : np.ndarray
+            (N, 2) array of source point coordinates
+
+        Returns
+        -------
+        scipy.spatial.cKDTree
+            KDTree of the source points
+        """
+
+        if self.kdtree_cache_size <= 0:
+            return cKDTree(pts)
+
+        pts = np.ascontiguousarray(pts)
+        key = hash_alg(str((pts.dtype.str, pts.shape)).encode("utf-8") + pts.tobytes()).hexdigest()
+
+        with _KDTREE_CACHE_LOCK:
+            if key in _KDTREE_CACHE:
+                _KDTREE_CACHE.move_to_end(key)
+                return _KDTREE_CACHE[key]
+
+        tree = cKDTree(pts)
+
+        with _KDTREE_CACHE_LOCK:
+            _KDTREE_CACHE[key] = tree
+            while len(_KDTREE_CACHE) > self.kdtree_cache_size:
+                _KDTREE_CACHE.popitem(last=False)
+
+        return tree
+
 
 @common_doc(COMMON_INTERPOLATOR_DOCS)
 class ScipyGrid(ScipyPoint):
@@ -27,6 +27,7 @@ def _higher_precision_time_stack(coords0, coords1, dims):
 
 
 def _higher_precision_time_coords1d(coords0, coords1):
+    # numerical coordinates are used as stored (e.g. float32), and datetimes as int64 epoch values in the finest unit
     dtype0 = coords0.coordinates[0].dtype
     dtype1 = coords1.coordinates[0].dtype
     if not np.issubdtype(dtype0, np.datetime64) or not np.issubdtype(dtype1, np.datetime64):
@@ -35,7 +36,7 @@ def _higher_precision_time_coords1d(coords0, coords1):
         dtype = dtype0
     else:
         dtype = dtype1
-    return coords0.coordinates.astype(dtype).astype(float), coords1.coordinates.astype(dtype).astype(float)
+    return coords0.coordinates.astype(dtype).view(np.int64), coords1.coordinates.astype(dtype).view(np.int64)
 
 
 def _index2slice(index):
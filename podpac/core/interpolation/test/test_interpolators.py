@@ -952,6 +952,29 @@ class TestInterpolateScipyPoint(object):
         assert output.values[0, 0] == source[0]
         assert output.values[-1, -1] == source[3]
 
+    def test_kdtree_cache(self):
+        interp = ScipyPoint()
+        pts = np.random.rand(10, 2)
+        tree = interp._get_kdtree(pts)
+        assert interp._get_kdtree(pts.copy()) is tree
+        assert interp._get_kdtree(pts[::-1]) is not tree
+
+        interp = ScipyPoint(kdtree_cache_size=0)
+        assert interp._get_kdtree(pts) is not tree
+
+    def test_interpolate_scipy_point_workers(self):
+        source = np.random.rand(6)
+        coords_src = Coordinates([[[0, 2, 4, 6, 8, 10], [0, 2, 4, 5, 6, 10]]], dims=["lat_lon"])
+        coords_dst = Coordinates([[1, 2, 3, 4, 5], [1, 2, 3, 4, 5]], dims=["lat", "lon"])
+        node = MockArrayDataSource(
+            data=source,
+            coordinates=coords_src,
+            interpolation={"method": "nearest", "interpolators": [ScipyPoint], "params": {"workers": 1}},
+        )
+        output = node.eval(coords_dst)
+        assert output.values[0, 0] == source[0]
+        assert output.values[-1, -1] == source[3]
+
 
 class TestXarrayInterpolator(object):
     """test interpolation functions"""
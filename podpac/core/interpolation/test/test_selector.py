@@ -4,7 +4,7 @@ import numpy as np
 
 from podpac.core.node import Node
 from podpac.core.coordinates import Coordinates, clinspace
-from podpac.core.interpolation.selector import Selector
+from podpac.core.interpolation.selector import Selector, _higher_precision_time_coords1d
 
 
 class TestSelector(object):
@@ -365,3 +365,24 @@ class TestSelector(object):
         c, ci = selector.select(src, req, index_type="slice")
         assert isinstance(ci[0], slice)
         assert c == src[ci]
+
+    def test_reduced_precision(self):
+        selector = Selector("nearest")
+
+        # float32 points
+        p_fine = Coordinates([[self.lat_fine, self.lon_fine]], [["lat", "lon"]])
+        p_coarse = Coordinates([[self.lat_coarse, self.lon_coarse]], [["lat", "lon"]])
+        c, ci = selector.select(p_fine, p_coarse)
+        c32, ci32 = selector.select(p_fine.astype(np.float32), p_coarse.astype(np.float32))
+        np.testing.assert_array_equal(ci32, ci)
+        assert c32["lat"].coordinates.dtype == np.float32
+
+    def test_higher_precision_time_coords1d(self):
+        # nanosecond datetimes are compared as exact int64 epoch values
+        t = np.array(["2020-01-01T00:00:00.000000001", "2020-01-01T00:00:00.000000003"], "datetime64[ns]")
+        src = Coordinates([t], dims=["time"])
+        req = Coordinates([["2020-01-01"]], dims=["time"])
+        s, r = _higher_precision_time_coords1d(src["time"], req["time"])
+        assert s.dtype == np.int64
+        assert s[1] - s[0] == 2
+        assert s[0] - r[0] == 1
@@ -0,0 +1,146 @@
+"""
+Module for reusing temporary arrays.
+
+Chunked and tiled evaluations allocate many arrays with the same shape that are only used until the chunk is reduced
+or combined. The buffer arena keeps released arrays, up to ``settings["BUFFER_ARENA_MAX_BYTES"]``, so that they can be
+reused for the next chunk instead of being allocated again.
+"""
+
+from __future__ import division, unicode_literals, print_function, absolute_import
+
+import threading
+from collections import defaultdict
+
+import numpy as np
+
+from podpac.core.settings import settings
+
+
+class BufferArena(object):
+    """This is a singleton class that keeps released temporary arrays so that they can be reused."""
+
+    _lock = threading.Lock()
+    __instance = None
+
+    def __new__(cls):
+        if BufferArena.__instance is None:
+            BufferArena.__instance = object.__new__(cls)
+            BufferArena.__instance._buffers = defaultdict(list)
+            BufferArena.__instance._nbytes = 0
+        return BufferArena.__instance
+
+    @property
+    def nbytes(self):
+        """Total size of the arrays kept in the arena."""
+        return self._nbytes
+
+    def acquire(self, shape, dtype=float):
+        """Get an uninitialized array, reusing a released array with the same shape and dtype if possible.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the array
+        dtype : type, optional
+            Data type of the array. Default is float.
+
+        Returns
+        -------
+        np.ndarray
+            Uninitialized array
+        """
+
+        key = (tuple(shape), np.dtype(dtype))
+        with self._lock:
+            if self._buffers[key]:
+                buffer = self._buffers[key].pop()
+                self._nbytes -= buffer.nbytes
+                return buffer
+        return np.empty(shape, dtype=dtype)
+
+    def release(self, buffer):
+        """Return an array to the arena. The array must not be used after it is released.
+
+        Parameters
+        ----------
+        buffer : np.ndarray, None
+            Array obtained from :meth:`acquire`. None is ignored.
+        """
+
+        if buffer is None:
+            return
+
+        with self._lock:
+            if self._nbytes + buffer.nbytes > settings["BUFFER_ARENA_MAX_BYTES"]:
+                return
+            self._buffers[(buffer.shape, buffer.dtype)].append(buffer)
+            self._nbytes += buffer.nbytes
+
+    def clear(self):
+        """Release all of the arrays kept in the arena."""
+
+        with self._lock:
+            self._buffers.clear()
+            self._nbytes = 0
+
+    def output_array(self, node, coordinates, layout):
+        """Output array for a node evaluation, backed by an array from the arena.
+
+        The layout of the node output must be known, i.e. from the output of a previous evaluation of the node with
+        coordinates that have the same dims.
+
+        Parameters
+        ----------
+        node : podpac.Node
+            Node that will be evaluated.
+        coordinates : podpac.Coordinates
+            Requested coordinates.
+        layout : tuple, None
+            Output dims and outputs of the node, see :meth:`get_layout`.
+
+        Returns
+        -------
+        output : UnitsDataArray, None
+            Output array to pass to the node `eval`, or None if the layout is None.
+        buffer : np.ndarray, None
+            Array to release once the node output is no longer used, or None if the layout is None.
+        """
+
+        if layout is None:
+            return None, None
+
+        dims, outputs = layout
+        coords = coordinates.drop([dim for dim in coordinates.dims if dim not in dims])
+        shape = coords.shape if outputs is None else coords.shape + (len(outputs),)
+        buffer = self.acquire(shape, dtype=node.dtype)
+        output = node.create_output_array(coords, data=buffer, outputs=outputs or [], copy=False)
+        return output, buffer
+
+    @staticmethod
+    def get_layout(output, coordinates):
+        """Layout of a node output, used for the arena output arrays of subsequent evaluations.
+
+        Parameters
+        ----------
+        output : UnitsDataArray
+            Node output
+        coordinates : podpac.Coordinates
+            Coordinates requested for this output.
+
+        Returns
+        -------
+        tuple, None
+            Output dims and outputs, or None if the output dims are not the requested dims, in order.
+        """
+
+        dims = tuple(dim for dim in output.dims if dim != "output")
+        if dims != tuple(dim for dim in coordinates.dims if dim in dims):
+            return None
+        if "output" in output.dims:
+            if output.dims[-1] != "output":
+                return None
+            return dims, list(output["output"].data)
+        return dims, None
+
+
+buffer_arena = BufferArena()
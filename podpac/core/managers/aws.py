@@ -1411,7 +1411,7 @@ Lambda Node {status}
 
         # add coordinates to the pipeline
         pipeline = self.pipeline  # contains "pipeline" and "output" keys
-        pipeline["coordinates"] = json.loads(coordinates.json)
+        pipeline["coordinates"] = json.loads(coordinates.compact_json)
 
         # TODO: should we move this to `self.pipeline`?
         pipeline["settings"] = self.eval_settings
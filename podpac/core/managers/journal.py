@@ -0,0 +1,184 @@
+"""
+Module for recording the completed chunks of parallel evaluations.
+
+The journal is a local SQLite database that records the status and timings of each chunk of a job, so that an
+interrupted :class:`podpac.core.managers.parallel.Parallel` evaluation can be restarted without evaluating (or checking
+the output of) the chunks that already completed. Failed chunks, and chunks that were only submitted to asynchronous
+workers, are evaluated again.
+"""
+
+from __future__ import division, unicode_literals, print_function, absolute_import
+
+import os
+import sqlite3
+import threading
+
+
+class ChunkJournal(object):
+    """Durable record of the completed and failed chunks of parallel jobs.
+
+    Parameters
+    ----------
+    path : str
+        Path to the SQLite journal file. It is created if it does not exist. Multiple jobs can share a journal file.
+
+    Notes
+    -----
+    Chunks are identified by their index in :meth:`podpac.Coordinates.iterchunks` and jobs by a key that depends on the
+    source node, the coordinates and the chunks (see :meth:`Parallel.get_job_key`). Only the latest attempt of each
+    chunk is kept, along with the number of attempts and failures.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+        dirname = os.path.dirname(os.path.abspath(path))
+        if not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS chunks ("
+            "job TEXT, i INTEGER, status TEXT, attempts INTEGER, failures INTEGER, submitted REAL, finished REAL, "
+            "error TEXT, PRIMARY KEY (job, i))"
+        )
+
+    def __repr__(self):
+        return "ChunkJournal(%s)" % self.path
+
+    def close(self):
+        """Close the journal file."""
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def completed(self, job):
+        """Indices of the completed chunks of a job.
+
+        Parameters
+        ----------
+        job : str
+            Job key
+
+        Returns
+        -------
+        set
+            chunk indices
+        """
+
+        with self._lock:
+            rows = self._connection.execute("SELECT i FROM chunks WHERE job=? AND status='completed'", (job,))
+            return set(i for (i,) in rows)
+
+    def clear(self, job):
+        """Remove the chunks of a job, e.g. when its output is overwritten.
+
+        Parameters
+        ----------
+        job : str
+            Job key
+        """
+
+        with self._lock:
+            self._connection.execute("DELETE FROM chunks WHERE job=?", (job,))
+
+    def record(self, job, i, submitted, finished, error=None, completed=True):
+        """Record the completion or failure of a chunk.
+
+        Parameters
+        ----------
+        job : str
+            Job key
+        i : int
+            Chunk index
+        submitted : float
+            Time (s since the epoch) when the chunk was submitted
+        finished : float
+            Time (s since the epoch) when the chunk completed or failed
+        error : Exception, optional
+            The exception if the chunk failed.
+        completed : bool, optional
+            Default is True. If False, the chunk was only submitted (e.g. to an asynchronous worker), and it is recorded
+            as 'submitted' rather than 'completed' unless it failed. Submitted chunks are evaluated again in a restart.
+        """
+
+        if error is not None:
+            status = "failed"
+        elif completed:
+            status = "completed"
+        else:
+            status = "submitted"
+        error = None if error is None else repr(error)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, "
+                "COALESCE((SELECT attempts FROM chunks WHERE job=? AND i=?), 0) + 1, "
+                "COALESCE((SELECT failures FROM chunks WHERE job=? AND i=?), 0) + ?, ?, ?, ?)",
+                (job, i, status, job, i, job, i, int(status == "failed"), submitted, finished, error),
+            )
+
+    def failures(self, job):
+        """Latest error of the failed chunks of a job.
+
+        Parameters
+        ----------
+        job : str
+            Job key
+
+        Returns
+        -------
+        dict
+            error message by chunk index
+        """
+
+        with self._lock:
+            rows = self._connection.execute("SELECT i, error FROM chunks WHERE job=? AND status='failed'", (job,))
+            return dict(rows.fetchall())
+
+    def stats(self, job=None):
+        """Job statistics.
+
+        Parameters
+        ----------
+        job : str, optional
+            Job key. By default, the statistics of all of the jobs in the journal are returned.
+
+        Returns
+        -------
+        dict
+            * completed: number of completed chunks
+            * failed: number of chunks that failed in their latest attempt
+            * submitted: number of chunks that were submitted asynchronously in their latest attempt
+            * attempts: total number of chunk evaluations
+            * failure_rate: fraction of the attempts that failed
+            * elapsed: time (s) between the first submission and the last completion, including any restarts
+            * throughput: completed chunks per second over the elapsed time
+        """
+
+        query = (
+            "SELECT SUM(status='completed'), SUM(status='failed'), SUM(status='submitted'), SUM(attempts), "
+            "SUM(failures), MIN(submitted), MAX(finished) FROM chunks"
+        )
+        with self._lock:
+            if job is None:
+                row = self._connection.execute(query).fetchone()
+            else:
+                row = self._connection.execute(query + " WHERE job=?", (job,)).fetchone()
+
+        completed, failed, submitted, attempts, failures, start, end = row
+        completed = completed or 0
+        elapsed = 0.0 if start is None else end - start
+        return {
+            "completed": completed,
+            "failed": failed or 0,
+            "submitted": submitted or 0,
+            "attempts": attempts or 0,
+            "failure_rate": failures / attempts if attempts else 0.0,
+            "elapsed": elapsed,
+            "throughput": completed / elapsed if elapsed > 0 else None,
+        }
@@ -48,7 +48,7 @@ class Process(Node):
     def eval(self, coordinates, **kwargs):
         output = kwargs.get("output")
         definition = self.source.json
-        coords = coordinates.json
+        coords = coordinates.compact_json
 
         q = Queue()
         process = mpProcess(target=_f, args=(definition, coords, q, self.output_format))
@@ -4,7 +4,9 @@ Module to help farm out computation to multiple workers and save the results in
 
 from __future__ import division, unicode_literals, print_function, absolute_import
 
+import json
 import time
+import queue
 import logging
 import traitlets as tl
 import numpy as np
@@ -12,8 +14,10 @@ import numpy as np
 from multiprocessing.pool import ThreadPool
 
 from podpac.core.managers.multi_threading import Lock
+from podpac.core.managers.journal import ChunkJournal
 from podpac.core.node import Node
-from podpac.core.utils import NodeTrait
+from podpac.core.utils import NodeTrait, hash_alg
+from podpac.core.data.datasource import DataSource
 from podpac.core.data.zarr_source import Zarr
 from podpac.core.coordinates import Coordinates, merge_dims
 
@@ -64,6 +68,28 @@ class Parallel(Node):
     start_i: int, optional
         Default is 0. Starting chunk. This allow you to restart a run without having to check/submit 1000's of workers
         before getting back to where you were. Empty chunks make the submission slower.
+    halo: dict, optional
+        Number of neighboring coordinates to add on each side of the chunks, by dimension. Each chunk is evaluated with
+        the padded coordinates and only the interior is kept, so that neighborhood nodes (e.g. Convolution) do not
+        have edge artifacts at the chunk borders. Requires fill_output.
+    align_chunks: bool, optional
+        Default is False. If True and the source is a DataSource with known storage chunks, the chunk edges are
+        snapped to the source storage chunks (see :meth:`DataSource.get_storage_grid`), so that each storage chunk
+        is read by a single worker.
+    max_in_flight: int, optional
+        Default is twice the number_of_workers. Maximum number of chunks submitted to the worker pool at one time. The
+        next chunk is only submitted (and its coordinates computed) when a previous chunk completes, so the memory use
+        does not grow with the number of chunks. Completed chunks are assembled in the order they finish.
+    progress: dict
+        Progress of the current or last eval: the 'total', 'completed' and 'failed' number of chunks, the 'elapsed'
+        time (s), the 'throughput' (chunks/s) and the estimated remaining time 'eta' (s).
+    progress_interval: float, optional
+        Default is 10. Minimum number of seconds between progress log messages.
+    journal: str, optional
+        Path to a local SQLite file that records the completed and failed chunks (see
+        :class:`podpac.core.managers.journal.ChunkJournal`). When the same job is evaluated again, the completed chunks
+        are skipped and only the remaining and failed chunks are evaluated. Requires fill_output=False, i.e. the
+        results must be written to a file.
 
     Notes
     ------
@@ -74,16 +100,33 @@ class Parallel(Node):
     _repr_keys = ["source", "number_of_workers", "chunks"]
     source = NodeTrait().tag(attr=True)
     chunks = tl.Dict().tag(attr=True)
+    halo = tl.Dict().tag(attr=True)
+    align_chunks = tl.Bool(False).tag(attr=True)
     fill_output = tl.Bool(True).tag(attr=True)
     number_of_workers = tl.Int(1).tag(attr=True)
+    max_in_flight = tl.Int(default_value=None, allow_none=True).tag(attr=True)
     _lock = Lock()
     errors = tl.List()
     start_i = tl.Int(0)
+    progress = tl.Dict()
+    progress_interval = tl.Float(10.0)
+    journal = tl.Unicode(default_value=None, allow_none=True)
+
+    # whether a chunk is finished when eval_source returns, see ParallelAsync
+    _journal_completed = True
 
     def eval(self, coordinates, **kwargs):
         output = kwargs.get("output")
-        # Make a thread pool to manage queue
-        pool = ThreadPool(processes=self.number_of_workers)
+
+        if self.halo and not self.fill_output:
+            raise ValueError("Parallel halo requires fill_output")
+
+        max_in_flight = self.max_in_flight or 2 * self.number_of_workers
+        if max_in_flight < 1:
+            raise ValueError("Parallel max_in_flight must be positive, not %d" % max_in_flight)
+
+        if self.journal and self.fill_output:
+            raise ValueError("Parallel journal requires fill_output=False, completed chunks are not evaluated again")
 
         if output is None and self.fill_output:
             output = self.create_output_array(coordinates)
@@ -95,61 +138,205 @@ class Parallel(Node):
             else:
                 shape.append(coordinates[d].size)
 
-        results = []
-        #         inputs = []
-        i = 0
-        for coords, slc in coordinates.iterchunks(shape, True):
-            #             inputs.append(coords)
-            if i < self.start_i:
-                _log.debug("Skipping {} since it is less than self.start_i ({})".format(i, self.start_i))
-                i += 1
-                continue
-
-            out = None
-            if self.fill_output and output is not None:
-                out = output[slc]
-            with self._lock:
-                _log.debug("Added {} to worker pool".format(i))
-                _log.debug("Node eval with coords: {}, {}".format(slc, coords))
-                results.append(pool.apply_async(self.eval_source, [coords, slc, out, i]))
-            i += 1
-
-        _log.info("Added all chunks to worker pool. Now waiting for results.")
-        start_time = time.time()
-        for i, res in enumerate(results):
-            #             _log.debug('Waiting for results: {} {}'.format(i, inputs[i]))
-            dt = str(np.timedelta64(int(1000 * (time.time() - start_time)), "ms").astype(object))
-            _log.info("({}): Waiting for results: {} / {}".format(dt, i + 1, len(results)))
-
-            # Try to get the results / wait for the results
-            try:
-                o, slc = res.get()
-            except Exception as e:
-                o = None
-                slc = None
-                self.errors.append((i, res, e))
-                dt = str(np.timedelta64(int(1000 * (time.time() - start_time)), "ms").astype(object))
-                _log.warning("({}) {} failed with exception {}".format(dt, i, e))
-
-            dt = str(np.timedelta64(int(1000 * (time.time() - start_time)), "ms").astype(object))
-            _log.info("({}) Finished result: {} / {}".format(time.time() - start_time, i + 1, len(results)))
-
-            # Fill output
-            if self.fill_output:
-                if output is None:
-                    missing_dims = [d for d in coordinates.dims if d not in self.chunks.keys()]
-                    coords = coordinates.drop(missing_dims)
-                    missing_coords = Coordinates.from_xarray(o).drop(list(self.chunks.keys()))
-                    coords = merge_dims([coords, missing_coords])
-                    coords = coords.transpose(*coordinates.dims)
-                    output = self.create_output_array(coords)
-                output[slc] = o
-
-        _log.info("Completed parallel execution.")
-        pool.close()
+        if self.align_chunks and isinstance(self.source, DataSource):
+            grid = self.source.get_storage_grid(coordinates)
+        else:
+            grid = None
+
+        chunks = coordinates.iterchunks(shape, True, halo=self.halo, grid=grid)
+        n = int(np.prod([len(slices) for slices in coordinates._get_chunk_slices(shape, grid=grid)]))
+
+        # the pool and the journal are closed even if the evaluation fails
+        journal = None
+        pool = None
+        try:
+            completed = set()
+            if self.journal:
+                journal = ChunkJournal(self.journal)
+                job = self.get_job_key(coordinates)
+                completed = journal.completed(job)
+
+            # Make a thread pool to manage queue
+            pool = ThreadPool(processes=self.number_of_workers)
+
+            # results are put in the queue by the pool as they complete, in any order
+            done = queue.Queue()
+            pending = {}
+            self._start_progress(max(n - self.start_i, 0) - len([j for j in completed if self.start_i <= j < n]))
+
+            i = 0
+            exhausted = False
+            while True:
+                # submit chunks until the window is full
+                while not exhausted and len(pending) < max_in_flight:
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        exhausted = True
+                        break
+
+                    if self.halo:
+                        coords, slc, interior = chunk
+                    else:
+                        coords, slc = chunk
+                        interior = None
+
+                    if i < self.start_i:
+                        _log.debug("Skipping {} since it is less than self.start_i ({})".format(i, self.start_i))
+                        i += 1
+                        continue
+
+                    if i in completed:
+                        _log.debug("Skipping {} (completed in the journal)".format(i))
+                        i += 1
+                        continue
+
+                    out = None
+                    if self.fill_output and output is not None and interior is None:
+                        out = output[slc]
+                    with self._lock:
+                        _log.debug("Added {} to worker pool".format(i))
+                        _log.debug("Node eval with coords: {}, {}".format(slc, coords))
+                        res = pool.apply_async(
+                            self.eval_source,
+                            [coords, slc, out, i],
+                            callback=lambda r, i=i: done.put((i, r, None)),
+                            error_callback=lambda e, i=i: done.put((i, None, e)),
+                        )
+                        pending[i] = (res, interior, time.time())
+                    i += 1
+
+                if not pending:
+                    break
+
+                # wait for the next completed chunk
+                j, r, e = done.get()
+                res, interior, submitted = pending.pop(j)
+                if e is None:
+                    o, slc = r
+                    _log.debug("Finished result: {}".format(j))
+                else:
+                    o = None
+                    slc = None
+                    self.errors.append((j, res, e))
+                    _log.warning("{} failed with exception {}".format(j, e))
+                self._update_progress(failed=e is not None)
+                if journal is not None:
+                    journal.record(job, j, submitted, time.time(), error=e, completed=self._journal_completed)
+
+                # Fill output
+                if self.fill_output and o is not None:
+                    if output is None:
+                        missing_dims = [d for d in coordinates.dims if d not in self.chunks.keys()]
+                        coords = coordinates.drop(missing_dims)
+                        missing_coords = Coordinates.from_xarray(o).drop(list(self.chunks.keys()))
+                        coords = merge_dims([coords, missing_coords])
+                        coords = coords.transpose(*coordinates.dims)
+                        output = self.create_output_array(coords)
+                    if interior is not None:
+                        # crop the halo; the chunk coordinates can differ from the output coordinates by rounding
+                        output.data[slc] = o.data[interior]
+                    else:
+                        output[slc] = o
+
+            self._log_progress()
+            _log.info("Completed parallel execution.")
+        finally:
+            if pool is not None:
+                pool.close()
+            if journal is not None:
+                journal.close()
 
         return output
 
+    def get_job_key(self, coordinates):
+        """Key identifying the chunks of an evaluation in the journal.
+
+        The key depends on the source node, the coordinates, the chunking (chunks, halo and align_chunks), and the
+        output target (see :meth:`_get_job_target`).
+
+        Parameters
+        ----------
+        coordinates : :class:`podpac.Coordinates`
+            Evaluation coordinates
+
+        Returns
+        -------
+        str
+            job key
+        """
+
+        s = json.dumps(
+            [self.source.hash, coordinates.hash, self.chunks, self.halo, self.align_chunks, self._get_job_target()],
+            sort_keys=True,
+            default=str,
+        )
+        return hash_alg(s.encode("utf-8")).hexdigest()
+
+    def _get_job_target(self):
+        """Where the chunks are written, e.g. the output_format of a Process or Lambda source."""
+        return getattr(self.source, "output_format", None)
+
+    def get_job_stats(self, coordinates=None):
+        """Statistics of the chunks recorded in the journal (see :meth:`ChunkJournal.stats`).
+
+        Parameters
+        ----------
+        coordinates : :class:`podpac.Coordinates`, optional
+            Evaluation coordinates of the job. By default, the statistics of all of the jobs in the journal are
+            returned.
+
+        Returns
+        -------
+        dict
+            job statistics
+        """
+
+        if not self.journal:
+            raise ValueError("Parallel journal is not set")
+
+        job = None if coordinates is None else self.get_job_key(coordinates)
+        with ChunkJournal(self.journal) as journal:
+            return journal.stats(job)
+
+    def _start_progress(self, total):
+        self._progress_start = time.time()
+        self._progress_logged = self._progress_start
+        self.progress = {
+            "total": total,
+            "completed": 0,
+            "failed": 0,
+            "elapsed": 0.0,
+            "throughput": None,
+            "eta": None,
+        }
+
+    def _update_progress(self, failed=False):
+        progress = dict(self.progress)
+        progress["completed"] += 1
+        progress["failed"] += int(failed)
+        progress["elapsed"] = time.time() - self._progress_start
+        if progress["elapsed"] > 0:
+            progress["throughput"] = progress["completed"] / progress["elapsed"]
+            progress["eta"] = (progress["total"] - progress["completed"]) / progress["throughput"]
+        self.progress = progress
+
+        if time.time() - self._progress_logged >= self.progress_interval:
+            self._log_progress()
+
+    def _log_progress(self):
+        self._progress_logged = time.time()
+        p = self.progress
+        _log.info(
+            "Completed {} / {} chunks ({} failed) in {:.1f} s, {} chunks/s, eta {} s".format(
+                p["completed"],
+                p["total"],
+                p["failed"],
+                p["elapsed"],
+                "-" if p["throughput"] is None else "{:.3g}".format(p["throughput"]),
+                "-" if p["eta"] is None else "{:.1f}".format(p["eta"]),
+            )
+        )
+
     def eval_source(self, coordinates, coordinates_index, out, i, source=None):
         if source is None:
             source = self.source
@@ -189,6 +376,9 @@ class ParallelAsync(Parallel):
         Default is botocore.exceptions.ReadTimeoutException. This is an exception thrown by the async function in case
         it time out waiting for a return. In our case, this is a success. The default is chosen to work with the
         podpac.managers.Lambda node.
+    journal: str, optional
+        Path to a local SQLite journal file. The chunks may still be running (or fail) after they are submitted, so
+        they are recorded as 'submitted' rather than 'completed', and they are evaluated again in a restart.
     Notes
     ------
     In some cases where the input and output coordinates of the source node is not the same (such as reduce nodes)
@@ -201,6 +391,7 @@ class ParallelAsync(Parallel):
     sleep_time = tl.Float(1).tag(attr=True)
     no_worker_exception = tl.Type(botocore.exceptions.ClientError).tag(attr=True)
     async_exception = tl.Type(botocore.exceptions.ReadTimeoutError).tag(attr=True)
+    _journal_completed = False
 
     def check_worker_available(self):
         return True
@@ -263,10 +454,14 @@ class ZarrOutputMixin(tl.HasTraits):
     skip_existing: bool
         Default is False. If true, this will check to see if the results already exist. And if so, it will not
         submit a job for that particular coordinate evaluation. This assumes self.chunks == self.zar_chunks
+        Chunks that are recorded as completed in the journal (if set) are skipped without checking the zarr file.
     list_dir: bool, optional
         Default is False. If skip_existing is True, by default existing files are checked by asking for an 'exists' call.
         If list_dir is True, then at the first opportunity a "list_dir" is performed on the directory and the results
         are cached.
+    journal: str, optional
+        Path to a local SQLite journal file. The job includes the zarr_file and the data keys. The chunks recorded for
+        the job are cleared when the output is overwritten (init_file_mode='w' or skip_existing=False).
     """
 
     zarr_file = tl.Unicode().tag(attr=True)
@@ -288,6 +483,11 @@ class ZarrOutputMixin(tl.HasTraits):
     aws_config_kwargs = tl.Dict()
 
     def eval(self, coordinates, **kwargs):
+        if self.halo or self.align_chunks:
+            raise ValueError(
+                "halo and align_chunks are not supported with zarr output, the chunks must match zarr_chunks"
+            )
+
         output = kwargs.get("output")
         if self.zarr_shape is None:
             self._shape = coordinates.shape
@@ -317,6 +517,10 @@ class ZarrOutputMixin(tl.HasTraits):
         set_coords.transpose(*coordinates.dims)
 
         self.set_zarr_coordinates(set_coords, data_key)
+        if self.journal and (self.init_file_mode == "w" or not self.skip_existing):
+            # the zarr file or arrays were overwritten, none of the chunks are completed
+            with ChunkJournal(self.journal) as journal:
+                journal.clear(self.get_job_key(coordinates))
         if self.list_dir:
             dk = data_key
             if isinstance(dk, list):
@@ -342,9 +546,10 @@ class ZarrOutputMixin(tl.HasTraits):
             self.dataset.create_dataset(d, shape=coordinates[d].size, overwrite=True)
             self.dataset[d][:] = coordinates[d].coordinates
 
-    def initialize_zarr_array(self, shape, chunks):
-        _log.debug("Creating Zarr file.")
-        zn = Zarr(source=self.zarr_file, file_mode=self.init_file_mode, aws_client_kwargs=self.aws_client_kwargs)
+    def _get_job_target(self):
+        return [self.zarr_file, self._get_data_key(), super(ZarrOutputMixin, self)._get_job_target()]
+
+    def _get_data_key(self):
         if self.source.output or getattr(self.source, "data_key", None):
             data_key = self.source.output
             if data_key is None:
@@ -357,6 +562,12 @@ class ZarrOutputMixin(tl.HasTraits):
             data_key = self.source.outputs
         else:
             data_key = ["data"]
+        return data_key
+
+    def initialize_zarr_array(self, shape, chunks):
+        _log.debug("Creating Zarr file.")
+        zn = Zarr(source=self.zarr_file, file_mode=self.init_file_mode, aws_client_kwargs=self.aws_client_kwargs)
+        data_key = self._get_data_key()
 
         zf = zarr.open(zn._get_store(), mode=self.init_file_mode)
 
@@ -374,8 +585,9 @@ class ZarrOutputMixin(tl.HasTraits):
             except ValueError:
                 pass  # Dataset already exists
 
-        # Recompute any cached properties
-        zn = Zarr(source=self.zarr_file, file_mode=self.init_file_mode, aws_client_kwargs=self.aws_client_kwargs)
+        # Recompute any cached properties (without overwriting the file again)
+        file_mode = "a" if self.init_file_mode == "w" else self.init_file_mode
+        zn = Zarr(source=self.zarr_file, file_mode=file_mode, aws_client_kwargs=self.aws_client_kwargs)
         return zf, data_key, zn
 
     def eval_source(self, coordinates, coordinates_index, out, i, source=None):
@@ -0,0 +1,70 @@
+import numpy as np
+
+import podpac
+from podpac import settings
+from podpac.core.managers.arena import BufferArena, buffer_arena
+from podpac.core.data.array_source import Array
+
+
+class TestBufferArena(object):
+    def setup_method(self):
+        buffer_arena.clear()
+
+    def teardown_method(self):
+        buffer_arena.clear()
+
+    def test_singleton(self):
+        assert BufferArena() is buffer_arena
+
+    def test_acquire_release(self):
+        a = buffer_arena.acquire((3, 4))
+        assert a.shape == (3, 4)
+        assert a.dtype == float
+        assert buffer_arena.nbytes == 0
+
+        buffer_arena.release(a)
+        assert buffer_arena.nbytes == a.nbytes
+
+        # reused for the same shape and dtype only
+        assert buffer_arena.acquire((4, 3)) is not a
+        assert buffer_arena.acquire((3, 4), dtype=np.float32) is not a
+        assert buffer_arena.acquire((3, 4)) is a
+        assert buffer_arena.nbytes == 0
+
+        buffer_arena.release(None)
+        assert buffer_arena.nbytes == 0
+
+    def test_max_bytes(self):
+        with settings:
+            settings["BUFFER_ARENA_MAX_BYTES"] = 100
+            buffer_arena.release(np.empty(10))
+            buffer_arena.release(np.empty(10))
+            assert buffer_arena.nbytes == 80
+
+    def test_output_array(self):
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20], "2018-01-01"], dims=["lat", "lon", "time"])
+        node = Array(source=np.random.random(coords.drop("time").shape), coordinates=coords.drop("time"))
+
+        assert buffer_arena.output_array(node, coords, None) == (None, None)
+
+        o = node.eval(coords)
+        layout = buffer_arena.get_layout(o, coords)
+        assert layout == (("lat", "lon"), None)
+
+        output, buffer = buffer_arena.output_array(node, coords, layout)
+        assert output.dims == ("lat", "lon")
+        assert output.data is buffer
+
+        o2 = node.eval(coords, output=output)
+        assert np.shares_memory(o2.data, buffer)
+        np.testing.assert_array_equal(o2, o)
+
+    def test_get_layout(self):
+        coords = podpac.Coordinates([[0, 1, 2], [10, 20]], dims=["lat", "lon"])
+        node = Array(source=np.random.random(coords.shape + (2,)), coordinates=coords, outputs=["a", "b"])
+        o = node.eval(coords)
+        assert buffer_arena.get_layout(o, coords) == (("lat", "lon"), ["a", "b"])
+
+        # dims in a different order or not requested
+        assert buffer_arena.get_layout(o, coords.transpose("lon", "lat")) is None
+        assert buffer_arena.get_layout(o, coords.drop("lon")) is None
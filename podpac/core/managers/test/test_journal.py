@@ -0,0 +1,66 @@
+import os
+import tempfile
+
+import pytest
+
+from podpac.core.managers.journal import ChunkJournal
+
+
+class TestChunkJournal(object):
+    def test_record(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "journal", "journal.sqlite")
+            with ChunkJournal(path) as journal:
+                assert journal.completed("a") == set()
+                assert journal.stats()["completed"] == 0
+                assert journal.stats()["throughput"] is None
+
+                journal.record("a", 0, 10.0, 11.0)
+                journal.record("a", 1, 10.0, 12.0, error=RuntimeError("fail"))
+                journal.record("b", 0, 10.0, 11.0)
+                assert journal.completed("a") == {0}
+                assert journal.failures("a") == {1: "RuntimeError('fail')"}
+
+            # persistent, the failed chunk is retried
+            with ChunkJournal(path) as journal:
+                assert journal.completed("a") == {0}
+                journal.record("a", 1, 12.0, 14.0)
+                assert journal.completed("a") == {0, 1}
+                assert journal.failures("a") == {}
+
+                stats = journal.stats("a")
+                assert stats["completed"] == 2
+                assert stats["failed"] == 0
+                assert stats["attempts"] == 3
+                assert stats["failure_rate"] == pytest.approx(1.0 / 3)
+                assert stats["elapsed"] == 4.0
+                assert stats["throughput"] == 0.5
+
+                assert journal.stats()["completed"] == 3
+
+    def test_submitted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with ChunkJournal(os.path.join(tmpdir, "journal.sqlite")) as journal:
+                journal.record("a", 0, 10.0, 11.0, completed=False)
+                journal.record("a", 1, 10.0, 11.0, error=RuntimeError("fail"), completed=False)
+                assert journal.completed("a") == set()
+                assert journal.failures("a") == {1: "RuntimeError('fail')"}
+
+                # submitted again
+                journal.record("a", 0, 12.0, 13.0, completed=False)
+                stats = journal.stats("a")
+                assert stats["completed"] == 0
+                assert stats["submitted"] == 1
+                assert stats["failed"] == 1
+                assert stats["attempts"] == 3
+                assert stats["failure_rate"] == pytest.approx(1.0 / 3)
+
+    def test_clear(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with ChunkJournal(os.path.join(tmpdir, "journal.sqlite")) as journal:
+                journal.record("a", 0, 10.0, 11.0)
+                journal.record("b", 0, 10.0, 11.0)
+                journal.clear("a")
+                assert journal.completed("a") == set()
+                assert journal.completed("b") == {0}
+                assert journal.stats("a")["attempts"] == 0
@@ -6,12 +6,16 @@ import numpy as np
 from threading import Thread
 import tempfile
 import logging
+import threading
 
 import pytest
 
 from podpac import settings
-from podpac.core.coordinates import Coordinates
+from podpac.core.utils import NodeTrait
+from podpac.core.coordinates import Coordinates, clinspace
 from podpac.core.algorithm.utility import CoordData
+from podpac.core.algorithm.algorithm import Algorithm
+from podpac.core.data.array_source import Array
 from podpac.core.managers.parallel import Parallel, ParallelOutputZarr, ParallelAsync, ParallelAsyncOutputZarr
 from podpac.core.managers.multi_process import Process
 
@@ -19,6 +23,50 @@ logger = logging.getLogger("podpac")
 logger.setLevel(logging.DEBUG)
 
 
+class ChunkedArray(Array):
+    storage_chunks = {"time": 2}
+
+
+class RunningMean(Algorithm):
+    source = NodeTrait().tag(attr=True)
+
+    def algorithm(self, inputs, coordinates):
+        return inputs["source"].rolling(lat=3, center=True, min_periods=1).mean()
+
+
+class SlowCoordData(CoordData):
+    # shared by the copies of the node that are evaluated in the workers
+    lock = threading.Lock()
+    in_flight = []
+    max_in_flight = [0]
+    finished = []
+
+    def eval(self, coordinates, **kwargs):
+        i = int(coordinates["time"].coordinates[0])
+        with self.lock:
+            self.in_flight.append(i)
+            self.max_in_flight[0] = max(self.max_in_flight[0], len(self.in_flight))
+        # the first chunk is the slowest
+        time.sleep(0.2 if i == 0 else 0.01)
+        with self.lock:
+            self.in_flight.remove(i)
+            self.finished.append(i)
+        return super(SlowCoordData, self).eval(coordinates, **kwargs)
+
+
+class FlakyCoordData(CoordData):
+    # shared by the copies of the node that are evaluated in the workers
+    fail = set()
+    evaluated = []
+
+    def eval(self, coordinates, **kwargs):
+        i = int(coordinates["time"].coordinates[0])
+        self.evaluated.append(i)
+        if i in self.fail:
+            raise RuntimeError("chunk %d failed" % i)
+        return super(FlakyCoordData, self).eval(coordinates, **kwargs)
+
+
 class TestParallel(object):
     def test_parallel_multi_thread_compute_fill_output(self):
         node = CoordData(coord_name="time")
@@ -40,6 +88,168 @@ class TestParallel(object):
 
         np.testing.assert_array_equal(o, o_p)
 
+    def test_parallel_halo(self):
+        coords = Coordinates([clinspace(0, 1, 20), clinspace(0, 1, 10)], ["lat", "lon"])
+        source = Array(source=np.random.random(coords.shape), coordinates=coords)
+        node = RunningMean(source=source)
+        o = node.eval(coords)
+
+        # edge artifacts at the chunk borders
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"lat": 5})
+        assert not np.allclose(o, node_p.eval(coords))
+
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"lat": 5}, halo={"lat": 1})
+        np.testing.assert_allclose(o, node_p.eval(coords))
+
+    def test_parallel_align_chunks(self):
+        coords = Coordinates([[1, 2, 3, 4, 5, 6]], ["time"])
+        node = ChunkedArray(source=np.arange(6.0), coordinates=coords)
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 3}, align_chunks=True)
+        o = node_p.eval(coords[1:])
+        np.testing.assert_array_equal(o, np.arange(1.0, 6.0))
+
+    def test_parallel_max_in_flight(self):
+        node = SlowCoordData(coord_name="time")
+        coords = Coordinates([np.arange(10)], ["time"])
+
+        # completed out of order
+        del SlowCoordData.finished[:]
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 1}, max_in_flight=3)
+        np.testing.assert_array_equal(node_p.eval(coords), np.arange(10))
+        assert SlowCoordData.finished[0] != 0
+
+        # bounded window
+        del SlowCoordData.finished[:]
+        SlowCoordData.max_in_flight[0] = 0
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 1}, max_in_flight=1)
+        np.testing.assert_array_equal(node_p.eval(coords), np.arange(10))
+        assert SlowCoordData.max_in_flight[0] == 1
+        assert SlowCoordData.finished == list(range(10))
+
+        with pytest.raises(ValueError, match="max_in_flight must be positive"):
+            Parallel(source=node, chunks={"time": 1}, max_in_flight=-1).eval(coords)
+
+    def test_parallel_progress(self):
+        node = CoordData(coord_name="time")
+        coords = Coordinates([[1, 2, 3, 4, 5]], ["time"])
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 2}, max_in_flight=1)
+        node_p.eval(coords)
+        assert node_p.progress["total"] == 3
+        assert node_p.progress["completed"] == 3
+        assert node_p.progress["failed"] == 0
+        assert node_p.progress["eta"] == 0
+
+        node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 2}, start_i=1)
+        node_p.eval(coords)
+        assert node_p.progress["total"] == 2
+        assert node_p.progress["completed"] == 2
+
+    def test_parallel_journal(self):
+        node = FlakyCoordData(coord_name="time")
+        coords = Coordinates([[0, 1, 2, 3, 4]], ["time"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = os.path.join(tmpdir, "journal.sqlite")
+
+            # the chunk starting at time 2 fails
+            FlakyCoordData.fail = {2}
+            del FlakyCoordData.evaluated[:]
+            node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 2}, fill_output=False, journal=journal)
+            node_p.eval(coords)
+            assert sorted(FlakyCoordData.evaluated) == [0, 2, 4]
+            assert len(node_p.errors) == 1
+            stats = node_p.get_job_stats(coords)
+            assert stats["completed"] == 2
+            assert stats["failed"] == 1
+
+            # restart, only the failed chunk is evaluated again
+            FlakyCoordData.fail = set()
+            del FlakyCoordData.evaluated[:]
+            node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 2}, fill_output=False, journal=journal)
+            node_p.eval(coords)
+            assert FlakyCoordData.evaluated == [2]
+            assert node_p.progress["total"] == 1
+            stats = node_p.get_job_stats(coords)
+            assert stats["completed"] == 3
+            assert stats["failed"] == 0
+            assert stats["attempts"] == 4
+            assert stats["failure_rate"] == 0.25
+
+            # different job
+            del FlakyCoordData.evaluated[:]
+            node_p = Parallel(source=node, number_of_workers=2, chunks={"time": 3}, fill_output=False, journal=journal)
+            node_p.eval(coords)
+            assert sorted(FlakyCoordData.evaluated) == [0, 3]
+            assert node_p.get_job_stats()["completed"] == 5
+
+        with pytest.raises(ValueError, match="requires fill_output=False"):
+            Parallel(source=node, chunks={"time": 2}, journal=journal).eval(coords)
+
+    def test_parallel_close(self, monkeypatch):
+        import podpac.core.managers.parallel as parallel
+
+        pools = []
+
+        class ThreadPool(parallel.ThreadPool):
+            closed = False
+
+            def __init__(self, *args, **kwargs):
+                super(ThreadPool, self).__init__(*args, **kwargs)
+                pools.append(self)
+
+            def close(self):
+                self.closed = True
+                super(ThreadPool, self).close()
+
+        journals = []
+
+        class ChunkJournal(parallel.ChunkJournal):
+            def close(self):
+                journals.append(self)
+                super(ChunkJournal, self).close()
+
+        monkeypatch.setattr(parallel, "ThreadPool", ThreadPool)
+        monkeypatch.setattr(parallel, "ChunkJournal", ChunkJournal)
+
+        node = CoordData(coord_name="time")
+        coords = Coordinates([[0, 1, 2, 3, 4]], ["time"])
+
+        # invalid settings are rejected before the pool is created
+        with pytest.raises(ValueError, match="max_in_flight must be positive"):
+            Parallel(source=node, chunks={"time": 2}, max_in_flight=-1).eval(coords)
+        with pytest.raises(ValueError, match="requires fill_output"):
+            Parallel(source=node, chunks={"time": 2}, halo={"time": 1}, fill_output=False).eval(coords)
+        assert pools == []
+
+        # the pool and the journal are closed when the evaluation fails
+        def fail(*args, **kwargs):
+            raise RuntimeError("progress failed")
+
+        monkeypatch.setattr(Parallel, "_update_progress", fail)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = os.path.join(tmpdir, "journal.sqlite")
+            node_p = Parallel(source=node, chunks={"time": 2}, fill_output=False, journal=journal)
+            with pytest.raises(RuntimeError, match="progress failed"):
+                node_p.eval(coords)
+            assert len(pools) == 1 and pools[0].closed
+            assert len(journals) == 1
+
+    def test_parallel_job_key(self):
+        coords = Coordinates([[0, 1, 2, 3, 4]], ["time"])
+        node = Parallel(source=Process(source=CoordData(coord_name="time")), chunks={"time": 2})
+        key = node.get_job_key(coords)
+        assert (
+            Parallel(source=Process(source=CoordData(coord_name="time")), chunks={"time": 2}).get_job_key(coords) == key
+        )
+
+        # output target
+        node = Process(source=CoordData(coord_name="time"), output_format={"format": "pickle"})
+        assert Parallel(source=node, chunks={"time": 2}).get_job_key(coords) != key
+
+        node = CoordData(coord_name="time")
+        key = ParallelOutputZarr(source=node, chunks={"time": 2}, zarr_file="a.zarr").get_job_key(coords)
+        assert ParallelOutputZarr(source=node, chunks={"time": 2}, zarr_file="b.zarr").get_job_key(coords) != key
+
     @pytest.mark.skipif(sys.version < "3.7", reason="python < 3.7 cannot handle processes launched from threads")
     def test_parallel_process(self):
         node = Process(source=CoordData(coord_name="time"))
@@ -64,6 +274,26 @@ class TestParallelAsync(object):
         time.sleep(0.1)
         # Just try to make it run...
 
+    def test_parallel_async_journal(self):
+        node = FlakyCoordData(coord_name="time")
+        coords = Coordinates([[0, 1, 2, 3, 4]], ["time"])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = os.path.join(tmpdir, "journal.sqlite")
+            FlakyCoordData.fail = set()
+
+            # the submitted chunks are not known to be completed, and are evaluated again
+            for _ in range(2):
+                del FlakyCoordData.evaluated[:]
+                node_p = ParallelAsync(source=node, chunks={"time": 2}, fill_output=False, journal=journal)
+                node_p.eval(coords)
+                assert sorted(FlakyCoordData.evaluated) == [0, 2, 4]
+
+            stats = node_p.get_job_stats(coords)
+            assert stats["completed"] == 0
+            assert stats["submitted"] == 3
+            assert stats["failure_rate"] == 0.0
+
 
 class TestParallelOutputZarr(object):
     @pytest.mark.skipif(sys.version < "3.7", reason="python < 3.7 cannot handle processes launched from threads")
@@ -83,6 +313,36 @@ class TestParallelOutputZarr(object):
 
         shutil.rmtree(tmpdir)
 
+    def test_parallel_zarr_journal(self):
+        node = FlakyCoordData(coord_name="time")
+        coords = Coordinates([[0, 1, 2, 3, 4]], ["time"])
+        FlakyCoordData.fail = set()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            journal = os.path.join(tmpdir, "journal.sqlite")
+            zarr_file = os.path.join(tmpdir, "output.zarr")
+
+            del FlakyCoordData.evaluated[:]
+            node_p = ParallelOutputZarr(source=node, chunks={"time": 2}, zarr_file=zarr_file, journal=journal)
+            node_p.eval(coords)
+            assert sorted(FlakyCoordData.evaluated) == [0, 2, 4]
+
+            # completed chunks are skipped
+            del FlakyCoordData.evaluated[:]
+            node_p = ParallelOutputZarr(source=node, chunks={"time": 2}, zarr_file=zarr_file, journal=journal)
+            o_zarr = node_p.eval(coords)
+            assert FlakyCoordData.evaluated == []
+            np.testing.assert_array_equal(o_zarr["data"][:], [0, 1, 2, 3, 4])
+
+            # the file is overwritten, all of the chunks are evaluated again
+            node_p = ParallelOutputZarr(
+                source=node, chunks={"time": 2}, zarr_file=zarr_file, journal=journal, init_file_mode="w"
+            )
+            o_zarr = node_p.eval(coords)
+            assert sorted(FlakyCoordData.evaluated) == [0, 2, 4]
+            np.testing.assert_array_equal(o_zarr["data"][:], [0, 1, 2, 3, 4])
+            assert node_p.get_job_stats(coords)["attempts"] == 3
+
     @pytest.mark.skipif(sys.version < "3.7", reason="python < 3.7 cannot handle processes launched from threads")
     def test_parallel_process_zarr_async(self):
         # Can't use tempfile.TemporaryDirectory because multiple processess need access to dir
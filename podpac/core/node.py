@@ -295,7 +295,11 @@ class Node(tl.HasTraits):
         else:
             data = self._eval(coordinates, **kwargs)
             if self.cache_output:
-                self.put_cache(data, item, cache_coordinates)
+                # the provided output buffer belongs to the caller, which may reuse it
+                if output is not None and np.shares_memory(data.data, output.data):
+                    self.put_cache(data.copy(), item, cache_coordinates)
+                else:
+                    self.put_cache(data, item, cache_coordinates)
             self._from_cache = False
 
         # extract single output, if necessary
@@ -32,6 +32,9 @@ DEFAULT_SETTINGS = {
     "MULTITHREADING": False,
     "N_THREADS": 8,
     "CHUNK_SIZE": None,  # Size of chunks for parallel processing or large arrays that do not fit in memory
+    "CHUNK_MEMORY_FRACTION": 0.25,  # Fraction of the available memory used by chunks when CHUNK_SIZE is 'auto'
+    "BUFFER_ARENA_MAX_BYTES": 2.5e8,  # ~250MB of released temporary arrays kept for reuse
+    "TRANSFORM_CHUNK_SIZE": 2**20,  # Number of points transformed at once in coordinate reprojections
     "ENABLE_UNITS": True,
     "PODPAC_VERSION": version.semver(),
     "UNSAFE_EVAL_HASH": uuid.uuid4().hex,  # unique id for running unsafe evaluations
@@ -49,6 +52,7 @@ DEFAULT_SETTINGS = {
     "RAM_CACHE_ENABLED": True,
     "DISK_CACHE_ENABLED": True,
     "S3_CACHE_ENABLED": True,
+    "RASTERIO_BLOCK_CACHE_MAX_BYTES": 256e6,  # ~256MB
     # AWS
     "AWS_ACCESS_KEY_ID": None,
     "AWS_SECRET_ACCESS_KEY": None,
@@ -148,6 +152,10 @@ class PodpacSettings(dict):
         Enable caching to disk. Note that if disabled, some nodes may fail. Defaults to ``True``.
     S3_CACHE_ENABLED: bool
         Enable caching to RAM. Note that if disabled, some nodes may fail. Defaults to ``True``.
+    RASTERIO_BLOCK_CACHE_MAX_BYTES : int
+        Maximum size in bytes of the decoded raster blocks shared by all Rasterio nodes with ``cache_blocks`` enabled.
+        Least recently used blocks are discarded first. Defaults to ``256e6`` (~256MB).
+        Set to ``0`` to disable the block cache.
     ROOT_PATH : str
         Path to primary podpac working directory. Defaults to the ``.podpac`` directory in the users home directory.
     S3_BUCKET_NAME : str
@@ -167,6 +175,15 @@ class PodpacSettings(dict):
     CHUNK_SIZE: int, 'auto', None
         Chunk size for iterative evaluation, when applicable (e.g. Reduce Nodes). Use None for no iterative evaluation,
         and 'auto' to automatically calculate a chunk size based on the system. Defaults to ``None``.
+    CHUNK_MEMORY_FRACTION: float
+        Fraction of the available system memory that the chunks evaluated at once may use, when CHUNK_SIZE is 'auto'.
+        Defaults to ``0.25``.
+    BUFFER_ARENA_MAX_BYTES: int
+        Maximum size in bytes of the temporary arrays kept for reuse by chunked evaluations (see
+        :class:`podpac.core.managers.arena.BufferArena`). Defaults to ``2.5e8`` (~250MB).
+    TRANSFORM_CHUNK_SIZE: int
+        Maximum number of points transformed at once when transforming coordinates to a different crs. The chunks
+        are transformed in parallel when MULTITHREADING is True. Defaults to ``2**20``.
     """
 
     def __init__(self):
@@ -20,6 +20,7 @@ from podpac.core.utils import trait_is_defined
 from podpac.core.utils import create_logfile
 from podpac.core.utils import OrderedDictTrait, ArrayTrait, TupleTrait, NodeTrait
 from podpac.core.utils import JSONEncoder, is_json_serializable
+from podpac.core.utils import CompactJSONEncoder, encode_array, decode_array, is_encoded_array
 from podpac.core.utils import cached_property
 from podpac.core.utils import ind2slice
 from podpac.core.utils import probe_node
@@ -295,6 +296,43 @@ class TestJSONEncoder(object):
         assert not is_json_serializable(xr.DataArray([]))
 
 
+class TestEncodeArray(object):
+    def test_roundtrip(self):
+        for a in [
+            np.linspace(0, 1, 7),
+            np.arange(12).reshape(3, 4),
+            np.array([], dtype=float),
+            np.array(["2018-01-01", "2018-01-02"]).astype(np.datetime64),
+            np.array(["2018-01-01T12:30", "NaT"], dtype="datetime64[m]"),
+            np.array([1.5, np.nan, 2.5]).astype(">f8"),
+            np.linspace(0, 1, 12).reshape(3, 4)[:, ::2],
+        ]:
+            d = encode_array(a)
+            assert is_encoded_array(d)
+            assert d["dtype"][0] in "<|"
+            b = decode_array(json.loads(json.dumps(d)))
+            assert b.dtype == a.dtype.newbyteorder("<")
+            assert b.shape == a.shape
+            assert b.flags.writeable
+            np.testing.assert_array_equal(b, a)
+
+    def test_is_encoded_array(self):
+        assert not is_encoded_array([0, 1, 2])
+        assert not is_encoded_array({"dtype": "<f8"})
+
+    def test_compact_json_encoder(self):
+        d = {"a": np.linspace(0, 1, 5), "t": np.array(["2018-01-01"]).astype(np.datetime64), "n": 1, "s": "test"}
+        d2 = json.loads(json.dumps(d, cls=CompactJSONEncoder))
+        assert is_encoded_array(d2["a"])
+        assert is_encoded_array(d2["t"])
+        assert d2["n"] == 1
+        assert d2["s"] == "test"
+
+        # other objects still use the podpac JSONEncoder
+        json.dumps(np.array([np.timedelta64(1, "D")]), cls=CompactJSONEncoder)
+        json.dumps(podpac.Node(), cls=CompactJSONEncoder)
+
+
 class TestCachedPropertyDecorator(object):
     def test_cached_property(self):
         class MyNode(podpac.Node):
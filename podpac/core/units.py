@@ -411,7 +411,7 @@ class UnitsDataArray(xr.DataArray):
         return cls.create(coords, data=da.data, **uda_kwargs)
 
     @classmethod
-    def create(cls, c, data=np.nan, outputs=None, dtype=float, **kwargs):
+    def create(cls, c, data=np.nan, outputs=None, dtype=float, copy=True, **kwargs):
         """Shortcut to create :class:`podpac.UnitsDataArray`
 
         Parameters
@@ -422,6 +422,8 @@ class UnitsDataArray(xr.DataArray):
             Data to fill in. Defaults to np.nan.
         dtype : type, optional
             Data type. Defaults to float.
+        copy : bool, optional
+            Defaults to True. If False, the data array is used directly if it already has the correct dtype.
         **kwargs
             keyword arguments to pass to :class:`podpac.UnitsDataArray` constructor
 
@@ -452,7 +454,7 @@ class UnitsDataArray(xr.DataArray):
                     "data with shape %s does not match provided outputs %s (%d != %d)"
                     % (data.shape, outputs, data.shape[-1], len(outputs))
                 )
-            data = data.astype(dtype)
+            data = data.astype(dtype, copy=copy)
 
         # coords and dims
         coords = c.xcoords
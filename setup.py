@@ -19,7 +19,7 @@ install_requires = [
     "matplotlib>=2.1",
     "numpy>=1.14",
     "pint>=0.8",
-    "scipy>=1.0",
+    "scipy>=1.6",
     "traitlets>=4.3",
     "xarray>=0.10",
     "requests>=2.18",
@@ -32,7 +32,7 @@ install_requires = [
 if sys.version_info.major == 2:
     install_requires += ["future>=0.16", "pyproj>=2.2"]
 else:
-    install_requires += ["pyproj>=2.4"]
+    install_requires += ["pyproj>=3.1"]
 
 extras_require = {
     "datatype": [